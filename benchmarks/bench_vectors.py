@@ -0,0 +1,92 @@
+"""Construction and arithmetic benchmark for Vector, Vec2 and Vec3.
+
+Compares the validated construction path (``cls(*coords)``, the one every
+operator used before) with the trusted ``cls._from_coords`` path, times the
+operators and measures the memory of one instance with and without __slots__.
+
+Run from the repository root with: python -m benchmarks.bench_vectors
+"""
+
+import sys
+import timeit
+import tracemalloc
+
+from src.Vectors import Vec2, Vec3, Vector
+
+N_INSTANCES = 100_000
+REPEAT = 5
+
+
+class DictVector(Vector):
+    """Vector subclass without __slots__, every instance has a __dict__"""
+
+
+def best_time(stmt, number: int) -> float:
+    """return the best time per call in nanoseconds"""
+    return min(timeit.repeat(stmt, number=number, repeat=REPEAT)) / number * 1e9
+
+
+def instance_memory(factory) -> float:
+    """return the memory in bytes allocated by one instance built by factory"""
+    tracemalloc.start()
+    before, _ = tracemalloc.get_traced_memory()
+    instances = [factory() for _ in range(N_INSTANCES)]
+    after, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    # the list holding the instances is not part of the instance cost
+    return (after - before - sys.getsizeof(instances)) / N_INSTANCES
+
+
+def bench_construction() -> None:
+    print("construction (ns per object)")
+    for cls, coords in (
+        (Vector, (1.0, 2.0, 3.0, 4.0)),
+        (Vec2, (1.0, 2.0)),
+        (Vec3, (1.0, 2.0, 3.0)),
+    ):
+        validated = best_time(lambda: cls(*coords), 200_000)
+        trusted = best_time(lambda: cls._from_coords(coords), 200_000)
+        print(
+            f"  {cls.__name__:<7} validated {validated:8.1f}   trusted {trusted:8.1f}"
+            f"   speedup x{validated / trusted:.2f}"
+        )
+
+
+def bench_operators() -> None:
+    print("operators (ns per operation)")
+    for a, b in (
+        (Vector(1.0, 2.0, 3.0, 4.0), Vector(4.0, 3.0, 2.0, 1.0)),
+        (Vec2(1.0, 2.0), Vec2(3.0, 4.0)),
+        (Vec3(1.0, 2.0, 3.0), Vec3(4.0, 5.0, 6.0)),
+    ):
+        name = type(a).__name__
+        # the old operators rebuilt every result through the validating __init__
+        old_add = best_time(
+            lambda: type(a)(*(x + y for x, y in zip(a.coords, b.coords))), 100_000
+        )
+        timings = {
+            "a + b": best_time(lambda: a + b, 100_000),
+            "a - b": best_time(lambda: a - b, 100_000),
+            "-a": best_time(lambda: -a, 100_000),
+            "2.0 * a": best_time(lambda: 2.0 * a, 100_000),
+            "a * b": best_time(lambda: a * b, 100_000),
+            "a.copy()": best_time(a.copy, 100_000),
+        }
+        print(f"  {name:<7} old a + b {old_add:8.1f}")
+        for label, value in timings.items():
+            print(f"  {name:<7} {label:<9} {value:8.1f}")
+
+
+def bench_memory() -> None:
+    print("memory (bytes per instance, the coordinates tuple is shared)")
+    coords = (1.0, 2.0, 3.0)
+    with_dict = instance_memory(lambda: DictVector._from_coords(coords))
+    with_slots = instance_memory(lambda: Vec3._from_coords(coords))
+    print(f"  with __dict__  {with_dict:8.1f}")
+    print(f"  with __slots__ {with_slots:8.1f}")
+
+
+if __name__ == "__main__":
+    bench_construction()
+    bench_operators()
+    bench_memory()
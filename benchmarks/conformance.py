@@ -0,0 +1,121 @@
+"""Conformance of the compute backends with the pure python one.
+
+The operations of Matrix and SMatrix (addition, subtraction, negation,
+product by a scalar, product with a Vector, also of a transposed view, and
+with a Matrix) are computed with every available backend (see src.Backends)
+on the same random operands and compared with the results of the python
+backend, the reference.
+The backends whose package is not installed (e.g. numpy) are skipped.
+Exits with status 1 if any result differs by more than the tolerance.
+
+Run from the repository root with:
+
+    python -m benchmarks.conformance
+    python -m benchmarks.conformance --backend numpy
+"""
+
+import argparse
+import math
+import random
+import sys
+from typing import Callable, Dict, Iterator, Tuple
+
+from src import Backends
+from src.Matrices import Matrix, SMatrix
+from src.Precision import POLICIES
+from src.Vectors import Vector
+
+REFERENCE = "python"
+
+SIZES = ((1, 1), (3, 3), (4, 7), (16, 16), (33, 17))
+
+# relative tolerance, the backends can sum the products in another order
+TOLERANCE = 1e-12
+
+# a check is a name and the function computing its result
+Check = Tuple[str, Callable[[], object]]
+
+
+def random_matrix(n_rows: int, n_columns: int) -> object:
+    cls = SMatrix if n_rows == n_columns else Matrix
+    return cls(
+        *(
+            tuple(random.uniform(-1.0, 1.0) for _ in range(n_columns))
+            for _ in range(n_rows)
+        )
+    )
+
+
+def checks(n_rows: int, n_columns: int) -> Iterator[Check]:
+    a = random_matrix(n_rows, n_columns)
+    b = random_matrix(n_rows, n_columns)
+    c = random_matrix(n_columns, n_rows)
+    x = Vector(*(random.uniform(-1.0, 1.0) for _ in range(n_columns)))
+    shape = f"{n_rows}x{n_columns}"
+    yield f"add {shape}", lambda: a + b
+    yield f"sub {shape}", lambda: a - b
+    yield f"neg {shape}", lambda: -a
+    yield f"scale {shape}", lambda: a * 2.5
+    for policy in POLICIES:
+        yield f"matvec {shape} {policy}", lambda p=policy: a.matmul(x, precision=p)
+        yield f"matmul {shape} {policy}", lambda p=policy: a.matmul(c, precision=p)
+    yield f"matmul {shape} blocked", lambda: a.matmul(c, workers=1, block_size=2)
+    # strided operand, the backends read the transposed buffer without copying it
+    yield f"matvec {shape} transposed", lambda: c.get_transposed().matmul(x)
+
+
+def values(result: object) -> Tuple[float]:
+    """return the flat values of a Matrix or of a Vector"""
+    if isinstance(result, Vector):
+        return tuple(result.coords)
+    return tuple(value for row in result.coords for value in row)
+
+
+def run(names: Tuple[str]) -> Dict[str, list]:
+    """return, for each backend, the checks whose result differs from the reference"""
+    random.seed(0)
+    cases = [check for size in SIZES for check in checks(*size)]
+    with Backends.backend(REFERENCE):
+        expected = [(name, type(call()), values(call())) for name, call in cases]
+    failures = {}
+    for backend in names:
+        failures[backend] = []
+        with Backends.backend(backend):
+            for (name, call), (_, cls, reference) in zip(cases, expected):
+                result = call()
+                if type(result) is not cls:
+                    failures[backend].append(f"{name}: {type(result).__name__}")
+                elif len(values(result)) != len(reference) or not all(
+                    math.isclose(value, other, rel_tol=TOLERANCE, abs_tol=TOLERANCE)
+                    for value, other in zip(values(result), reference)
+                ):
+                    failures[backend].append(f"{name}: different values")
+    return failures
+
+
+def main(argv: list | None = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument(
+        "--backend",
+        action="append",
+        help="check only this backend (can be repeated), default all the available",
+    )
+    args = parser.parse_args(argv)
+
+    names = tuple(args.backend or Backends.available())
+    failures = run(names)
+    for backend in names:
+        if failures[backend]:
+            print(f"{backend}: {len(failures[backend])} failures")
+            for line in failures[backend]:
+                print("  " + line)
+        else:
+            print(f"{backend}: ok")
+    skipped = sorted(set(Backends._MODULES) - set(Backends.available()))
+    if skipped:
+        print("skipped (not installed): " + ", ".join(skipped))
+    return 1 if any(failures.values()) else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
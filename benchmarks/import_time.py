@@ -0,0 +1,81 @@
+"""Import time of the library and of its subpackages.
+
+Every import runs in a fresh interpreter (best of REPEAT runs), so that the
+modules imported by the previous runs are not in sys.modules, and is timed
+inside it, without the start up of the interpreter. The modules of the
+library loaded by every import are also counted.
+
+Run from the repository root with:
+
+    python -m benchmarks.import_time
+"""
+
+import argparse
+import subprocess
+import sys
+from typing import Tuple
+
+REPEAT = 7
+
+# the statements timed, each in a new interpreter
+STATEMENTS = (
+    "import src",
+    "from src import Vector",
+    "from src import Vec3",
+    "from src import Mat",
+    "import src.Backends",
+    "from src import *",
+)
+
+SCRIPT = """
+import time
+start = time.perf_counter()
+{statement}
+print(time.perf_counter() - start)
+"""
+
+
+def time_statement(statement: str, repeat: int = REPEAT) -> float:
+    """return the best time of statement, in seconds, in a fresh interpreter"""
+    times = []
+    for _ in range(repeat):
+        result = subprocess.run(
+            [sys.executable, "-c", SCRIPT.format(statement=statement)],
+            capture_output=True,
+            check=True,
+            text=True,
+        )
+        times.append(float(result.stdout))
+    return min(times)
+
+
+def loaded_modules(statement: str) -> Tuple[str]:
+    """return the modules of the library loaded by statement"""
+    script = f"import sys\n{statement}\nprint(*sorted(sys.modules))"
+    result = subprocess.run(
+        [sys.executable, "-c", script], capture_output=True, check=True, text=True
+    )
+    return tuple(name for name in result.stdout.split() if name.startswith("src."))
+
+
+def main(argv: list | None = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument(
+        "--repeat", type=int, default=REPEAT, help="runs of every statement"
+    )
+    parser.add_argument(
+        "--modules", action="store_true", help="list the modules loaded"
+    )
+    args = parser.parse_args(argv)
+
+    for statement in STATEMENTS:
+        seconds = time_statement(statement, args.repeat)
+        modules = loaded_modules(statement)
+        print(f"{statement:<24} {seconds * 1e3:>8.2f} ms {len(modules):>4} modules")
+        if args.modules:
+            print("    " + " ".join(modules))
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,318 @@
+"""Benchmark suite for the hot paths of Vector, Vec2, Vec3, Matrix and SMatrix.
+
+Every case is run over a sweep of dimensions (or of batch sizes, the number
+of vectors processed by one call) and reports:
+
+- ops/sec and ns per call (best of REPEAT runs, timed with timeit);
+- allocated bytes per call, the memory still held by the results;
+- peak bytes per call, the highest memory used while the call runs.
+
+The results can be saved as JSON and compared with a saved baseline, the
+comparison lists the cases slower (or using more memory) than the baseline
+by more than the threshold, and exits with status 1 if there are any.
+
+Run from the repository root with:
+
+    python -m benchmarks.suite --output results.json
+    python -m benchmarks.suite --baseline results.json --threshold 0.1
+"""
+
+import argparse
+import json
+import math
+import platform
+import random
+import re
+import sys
+import time
+import timeit
+import tracemalloc
+from array import array
+from itertools import chain
+from typing import Callable, Dict, Iterator, Tuple
+
+from src.Matrices import Matrix, SMatrix
+from src.Precision import POLICIES
+from src.Vectors import PVector, Vec2, Vec3, Vector, VectorBatch
+
+REPEAT = 5
+
+# minimum time of a single timed run, the number of calls is chosen to reach it
+MIN_TIME = 0.05
+
+VECTOR_DIMS = (2, 3, 8, 64, 512)
+BATCH_SIZES = (10, 1_000, 10_000)
+MATRIX_SIZES = (4, 16, 64)
+QUICK_MATRIX_SIZES = (4, 16)
+# the EXACT policy is orders of magnitude slower, it's measured on fewer sizes
+PRECISION_DIMS = (8, 512)
+PRECISION_MATRIX_SIZES = (4, 16)
+
+# a case is a name, the parameters of the sweep and a function that builds
+# the operands and returns the call to measure
+Case = Tuple[str, Dict[str, int | str], Callable[[], Callable[[], object]]]
+
+
+def random_coords(n: int) -> Tuple[float]:
+    return tuple(random.uniform(-1.0, 1.0) for _ in range(n))
+
+
+def random_rows(n_rows: int, n_columns: int) -> Tuple[Tuple[float]]:
+    return tuple(random_coords(n_columns) for _ in range(n_rows))
+
+
+def vector_cases(dims: Tuple[int]) -> Iterator[Case]:
+    for dim in dims:
+
+        def setup(dim=dim):
+            a, b = Vector(*random_coords(dim)), Vector(*random_coords(dim))
+            return {
+                "add": lambda: a + b,
+                "dot": lambda: a * b,
+                "scale": lambda: 2.5 * a,
+                "module": lambda: a.module,
+            }
+
+        for op in ("add", "dot", "scale", "module"):
+            name = f"Vector.{op}[dim={dim}]"
+            yield name, {"dim": dim}, lambda s=setup, op=op: s()[op]
+
+
+def small_vector_cases() -> Iterator[Case]:
+    a, b = Vec2(1.5, -0.5), Vec2(0.25, 2.0)
+    c, d = Vec3(1.5, -0.5, 0.75), Vec3(0.25, 2.0, -1.0)
+    yield "Vec2.add", {}, lambda: lambda: a + b
+    yield "Vec2.dot", {}, lambda: lambda: a * b
+    yield "Vec2.from_polar", {}, lambda: lambda: Vec2.from_polar(2.0, 0.7)
+    yield "Vec3.add", {}, lambda: lambda: c + d
+    yield "Vec3.dot", {}, lambda: lambda: c * d
+    yield "Vec3.get_spherical_coordinates", {}, lambda: c.get_spherical_coordinates
+    yield "Vec3.from_spherical", {}, lambda: lambda: Vec3.from_spherical(2.0, 0.7, 1.1)
+
+
+def batch_cases(sizes: Tuple[int]) -> Iterator[Case]:
+    for size in sizes:
+
+        def vectors(size=size):
+            xs = [Vec3(*random_coords(3)) for _ in range(size)]
+            ys = [Vec3(*random_coords(3)) for _ in range(size)]
+            return lambda: [x + y for x, y in zip(xs, ys)]
+
+        def batch(size=size):
+            xs = VectorBatch.from_coords(random_coords(3 * size), 3)
+            ys = VectorBatch.from_coords(random_coords(3 * size), 3)
+            return lambda: xs + ys
+
+        params = {"batch": size}
+        yield f"Vec3.add.loop[batch={size}]", params, vectors
+        yield f"VectorBatch.add[batch={size}]", params, batch
+
+
+def matrix_cases(sizes: Tuple[int]) -> Iterator[Case]:
+    for n in sizes:
+
+        def setup(n=n):
+            a, b = Matrix(*random_rows(n, n)), Matrix(*random_rows(n, n))
+            v = Vector(*random_coords(n))
+            return {
+                "add": lambda: a + b,
+                "scale": lambda: 2.5 * a,
+                "matvec": lambda: a @ v,
+                "matmul": lambda: a @ b,
+                "transposed_copy": lambda: a.get_transposed().copy(),
+            }
+
+        def square(n=n):
+            a = SMatrix(*random_rows(n, n))
+            v = Vector(*random_coords(n))
+
+            def fresh():
+                # writing a value drops the cached factorization
+                a[0, 0] = a[0, 0]
+                return a
+
+            return {
+                "determinant": lambda: fresh().determinant,
+                "solve": lambda: fresh().solve(v),
+                "solve_cached": lambda: a.solve(v),
+                "invert": lambda: fresh().invert(),
+            }
+
+        params = {"n": n}
+        for op in ("add", "scale", "matvec", "matmul", "transposed_copy"):
+            yield f"Matrix.{op}[n={n}]", params, lambda s=setup, op=op: s()[op]
+        for op in ("determinant", "solve", "solve_cached", "invert"):
+            yield f"SMatrix.{op}[n={n}]", params, lambda s=square, op=op: s()[op]
+
+
+def precision_cases(dims: Tuple[int], sizes: Tuple[int]) -> Iterator[Case]:
+    for policy in POLICIES:
+        for dim in dims:
+
+            def setup(dim=dim, policy=policy):
+                a = PVector(*random_coords(dim), precision=policy)
+                b = PVector(*random_coords(dim), precision=policy)
+                return {"dot": lambda: a * b, "module": lambda: a.module}
+
+            params = {"policy": policy, "dim": dim}
+            for op in ("dot", "module"):
+                name = f"PVector.{op}[policy={policy},dim={dim}]"
+                yield name, params, lambda s=setup, op=op: s()[op]
+        for n in sizes:
+
+            def matmul(n=n, policy=policy):
+                a, b = Matrix(*random_rows(n, n)), Matrix(*random_rows(n, n))
+                return lambda: a.matmul(b, precision=policy)
+
+            params = {"policy": policy, "n": n}
+            yield f"Matrix.matmul[policy={policy},n={n}]", params, matmul
+
+
+def buffer_cases(sizes: Tuple[int]) -> Iterator[Case]:
+    for n in sizes:
+
+        def setup(n=n):
+            rows = random_rows(n, n)
+            raw = array("d", chain.from_iterable(rows)).tobytes()
+            a = Matrix(raw, shape=(n, n))
+            return {
+                "from_rows": lambda: Matrix(*rows),
+                "from_bytes": lambda: Matrix(raw, shape=(n, n)),
+                "export": lambda: memoryview(a),
+                "vector_from_bytes": lambda: Vector(raw),
+            }
+
+        params = {"n": n}
+        for op in ("from_rows", "from_bytes", "export", "vector_from_bytes"):
+            yield f"Buffer.{op}[n={n}]", params, lambda s=setup, op=op: s()[op]
+
+
+def all_cases(quick: bool) -> Iterator[Case]:
+    yield from vector_cases(VECTOR_DIMS[:3] if quick else VECTOR_DIMS)
+    yield from small_vector_cases()
+    yield from batch_cases(BATCH_SIZES[:2] if quick else BATCH_SIZES)
+    yield from matrix_cases(QUICK_MATRIX_SIZES if quick else MATRIX_SIZES)
+    yield from precision_cases(
+        PRECISION_DIMS[:1] if quick else PRECISION_DIMS,
+        PRECISION_MATRIX_SIZES[:1] if quick else PRECISION_MATRIX_SIZES,
+    )
+    yield from buffer_cases(QUICK_MATRIX_SIZES if quick else MATRIX_SIZES)
+
+
+def measure(call: Callable[[], object]) -> Dict[str, float]:
+    """return the speed and the memory used by call"""
+    timer = timeit.Timer(call)
+    number, elapsed = timer.autorange()
+    number = max(1, math.ceil(number * MIN_TIME / max(elapsed, 1e-9)))
+    best = min(timer.repeat(repeat=REPEAT, number=number)) / number
+
+    # allocations are measured on a few calls keeping their results alive
+    n_calls = max(1, min(number, 100))
+    results = [None] * n_calls
+    tracemalloc.start()
+    start, _ = tracemalloc.get_traced_memory()
+    for i in range(n_calls):
+        results[i] = call()
+    held, _ = tracemalloc.get_traced_memory()
+    del results
+    tracemalloc.reset_peak()
+    base, _ = tracemalloc.get_traced_memory()
+    call()
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    return {
+        "ops_per_sec": 1.0 / best,
+        "ns_per_op": best * 1e9,
+        "alloc_bytes": max(0.0, (held - start) / n_calls),
+        "peak_bytes": max(0, peak - base),
+    }
+
+
+def run(quick: bool = False, pattern: str | None = None) -> dict:
+    """run the cases matching pattern and return the results"""
+    random.seed(0)
+    results = {}
+    for name, params, setup in all_cases(quick):
+        if pattern is not None and re.search(pattern, name) is None:
+            continue
+        results[name] = {"params": params, **measure(setup())}
+        print(format_result(name, results[name]), flush=True)
+    return {
+        "meta": {
+            "python": platform.python_version(),
+            "implementation": platform.python_implementation(),
+            "platform": platform.platform(),
+            "time": time.strftime("%Y-%m-%dT%H:%M:%S"),
+        },
+        "results": results,
+    }
+
+
+def compare(current: dict, baseline: dict, threshold: float) -> list:
+    """return the regressions of current against baseline, as printable lines"""
+    regressions = []
+    for name, result in current["results"].items():
+        if name not in baseline["results"]:
+            continue
+        old = baseline["results"][name]
+        if result["ops_per_sec"] < old["ops_per_sec"] * (1.0 - threshold):
+            regressions.append(
+                f"{name}: {old['ops_per_sec']:.0f} -> {result['ops_per_sec']:.0f} ops/sec"
+                + f" ({result['ops_per_sec'] / old['ops_per_sec'] - 1.0:+.1%})"
+            )
+        # a few bytes of difference are noise of the allocator free lists
+        if result["alloc_bytes"] > old["alloc_bytes"] * (1.0 + threshold) + 32:
+            regressions.append(
+                f"{name}: {old['alloc_bytes']:.0f} -> {result['alloc_bytes']:.0f}"
+                + " allocated bytes per call"
+            )
+    return regressions
+
+
+def format_result(name: str, result: dict) -> str:
+    return (
+        f"{name:<40} {result['ops_per_sec']:>14,.0f} ops/sec"
+        + f" {result['ns_per_op']:>14,.1f} ns"
+        + f" {result['alloc_bytes']:>10,.0f} B alloc"
+        + f" {result['peak_bytes']:>10,} B peak"
+    )
+
+
+def main(argv: list | None = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--output", help="write the results in this JSON file")
+    parser.add_argument("--baseline", help="compare with the results in this file")
+    parser.add_argument(
+        "--threshold",
+        type=float,
+        default=0.1,
+        help="relative slowdown reported as a regression (default: 0.1)",
+    )
+    parser.add_argument("--filter", help="run only the cases matching this regex")
+    parser.add_argument(
+        "--quick", action="store_true", help="run smaller sweeps of sizes"
+    )
+    args = parser.parse_args(argv)
+
+    results = run(args.quick, args.filter)
+    if args.output is not None:
+        with open(args.output, "w") as file:
+            json.dump(results, file, indent=2)
+    if args.baseline is None:
+        return 0
+
+    with open(args.baseline) as file:
+        baseline = json.load(file)
+    regressions = compare(results, baseline, args.threshold)
+    if not regressions:
+        print(f"no regressions beyond {args.threshold:.0%} against {args.baseline}")
+        return 0
+    print(f"regressions beyond {args.threshold:.0%} against {args.baseline}:")
+    for line in regressions:
+        print("  " + line)
+    return 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
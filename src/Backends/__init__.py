@@ -0,0 +1,81 @@
+# compute backends for the kernels of the dense matrices
+import importlib
+from contextlib import contextmanager
+from types import ModuleType
+from typing import Iterator, Tuple
+
+# module implementing every backend, relative to this package or absolute,
+# a backend is imported only the first time it's used
+_MODULES = {"python": ".pure", "array": ".arrays", "numpy": ".numeric"}
+
+# the backend used when none is given, array is the one of the matrix kernels
+DEFAULT = "array"
+_default = [DEFAULT]
+
+# the backends already imported, so that the operators don't go through importlib
+_loaded = {}
+
+
+def register(name: str, module: str) -> None:
+    """Register a backend, imported from module (a dotted path) when it's used
+
+    The module must define the functions of the backends of this package:
+    add, sub, neg, scale, matvec (on a strided buffer) and matmul.
+    """
+    if not isinstance(name, str) or not isinstance(module, str):
+        raise TypeError("The name and the module of a backend should be strings")
+    _MODULES[name] = module
+    _loaded.pop(name, None)
+
+
+def get_backend(name: str | None = None) -> ModuleType:
+    """Return the module of a backend, None returns the global one
+
+    Raises:
+        ValueError: for a name that is not registered
+        ImportError: if the backend needs a package that is not installed
+    """
+    name = _default[0] if name is None else name
+    module = _loaded.get(name)
+    if module is not None:
+        return module
+    if name not in _MODULES:
+        raise ValueError(f"Unknown backend {name!r}, use one of {', '.join(_MODULES)}")
+    module = _loaded[name] = importlib.import_module(_MODULES[name], __name__)
+    return module
+
+
+def set_backend(name: str) -> None:
+    """set the global backend, checking that it can be imported"""
+    get_backend(name)
+    _default[0] = name
+
+
+@contextmanager
+def backend(name: str) -> Iterator[None]:
+    """Context manager setting the global backend inside its block"""
+    previous = _default[0]
+    set_backend(name)
+    try:
+        yield
+    finally:
+        _default[0] = previous
+
+
+def available() -> Tuple[str]:
+    """return the names of the registered backends that can be imported"""
+    names = []
+    for name in _MODULES:
+        try:
+            get_backend(name)
+        except ImportError:
+            continue
+        names.append(name)
+    return tuple(names)
+
+
+def __getattr__(name: str) -> ModuleType:
+    """return the module of a backend (e.g. Backends.numpy), importing it"""
+    if name in _MODULES:
+        return get_backend(name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -0,0 +1,72 @@
+# array backend, the kernels of the library on array('d') buffers
+import operator
+from array import array
+from functools import partial
+from itertools import repeat
+from typing import Iterable, Tuple
+
+from ..Matrices import matmul as _matmul
+from ..Precision import kernels
+
+NAME = "array"
+
+
+def add(a: Iterable[float], b: Iterable[float]) -> array:
+    """return the elementwise sum of two flat buffers"""
+    return array("d", map(operator.add, a, b))
+
+
+def sub(a: Iterable[float], b: Iterable[float]) -> array:
+    """return the elementwise difference of two flat buffers"""
+    return array("d", map(operator.sub, a, b))
+
+
+def neg(a: Iterable[float]) -> array:
+    """return the opposite of a flat buffer"""
+    return array("d", map(operator.neg, a))
+
+
+def scale(a: Iterable[float], value: float) -> array:
+    """return a flat buffer multiplied by a scalar"""
+    return array("d", map(partial(operator.mul, value), a))
+
+
+def matvec(
+    a: Iterable[float],
+    x: Tuple[float],
+    shape: Tuple[int],
+    precision: str | None = None,
+    strides: Tuple[int] | None = None,
+    offset: int = 0,
+) -> array:
+    """Return the product of a n x k matrix with k values
+
+    The matrix is in the buffer a from offset, with the strides (between two
+    rows and between two columns, None is row-major without gaps) of the
+    views like the transposed matrices: its rows are memoryview slices of
+    the buffer, no value is copied.
+    """
+    n, k = shape
+    row_stride, column_stride = (k, 1) if strides is None else strides
+    values = memoryview(a)
+    span = (k - 1) * column_stride + 1
+    rows = (
+        values[start : start + span : column_stride]
+        for start in range(offset, offset + n * row_stride, row_stride)
+    )
+    return array("d", map(kernels.DOT[precision], rows, repeat(x)))
+
+
+def matmul(
+    a: Iterable[float],
+    bt: Iterable[float],
+    shape: Tuple[int],
+    workers: int | None = None,
+    block_size: int = _matmul.BLOCK_SIZE,
+    precision: str | None = None,
+) -> array:
+    """return the flat product of a n x k matrix and the transposed m x k matrix bt
+
+    The tiled (and optionally parallel) product of Matrices.matmul.
+    """
+    return _matmul.multiply(a, bt, shape, workers, block_size, precision)
@@ -0,0 +1,89 @@
+# NumPy backend, the buffers are used by NumPy without copying them
+from array import array
+from typing import Iterable, Tuple
+
+import numpy
+
+from ..Precision import kernels
+from . import arrays
+
+NAME = "numpy"
+
+
+def add(a: Iterable[float], b: Iterable[float]) -> array:
+    """return the elementwise sum of two flat buffers"""
+    return _to_array(numpy.add(_view(a), _view(b)))
+
+
+def sub(a: Iterable[float], b: Iterable[float]) -> array:
+    """return the elementwise difference of two flat buffers"""
+    return _to_array(numpy.subtract(_view(a), _view(b)))
+
+
+def neg(a: Iterable[float]) -> array:
+    """return the opposite of a flat buffer"""
+    return _to_array(numpy.negative(_view(a)))
+
+
+def scale(a: Iterable[float], value: float) -> array:
+    """return a flat buffer multiplied by a scalar"""
+    return _to_array(numpy.multiply(_view(a), value))
+
+
+def matvec(
+    a: Iterable[float],
+    x: Tuple[float],
+    shape: Tuple[int],
+    precision: str | None = None,
+    strides: Tuple[int] | None = None,
+    offset: int = 0,
+) -> array:
+    """return the product of a n x k matrix with k values, in the buffer a
+    from offset with strides (None is row-major, see the array backend)
+
+    The strided matrix is a NumPy view of the buffer, not a copy. Only the
+    FAST precision policy runs in NumPy, the others use the array backend.
+    """
+    if kernels.resolve(precision) != kernels.FAST:
+        return arrays.matvec(a, x, shape, precision, strides, offset)
+    n, k = shape
+    row_stride, column_stride = (k, 1) if strides is None else strides
+    matrix = numpy.lib.stride_tricks.as_strided(
+        _view(a)[offset:],
+        shape,
+        (8 * row_stride, 8 * column_stride),
+        writeable=False,
+    )
+    return _to_array(matrix @ numpy.asarray(x, dtype=numpy.float64))
+
+
+def matmul(
+    a: Iterable[float],
+    bt: Iterable[float],
+    shape: Tuple[int],
+    workers: int | None = None,
+    block_size: int | None = None,
+    precision: str | None = None,
+) -> array:
+    """return the flat product of a n x k matrix and the transposed m x k matrix bt
+
+    NumPy (BLAS) chooses the tiles and the threads, workers and block_size are
+    ignored. Only the FAST precision policy runs in NumPy.
+    """
+    if kernels.resolve(precision) != kernels.FAST:
+        return arrays.matmul(a, bt, shape, workers, precision=precision)
+    n, k, m = shape
+    return _to_array(_view(a).reshape(n, k) @ _view(bt).reshape(m, k).T)
+
+
+def _view(values: Iterable[float]) -> numpy.ndarray:
+    """return a float64 ndarray sharing the memory of a buffer (array, memoryview)"""
+    try:
+        return numpy.frombuffer(values, dtype=numpy.float64)
+    except (TypeError, ValueError):
+        return numpy.fromiter(values, dtype=numpy.float64)
+
+
+def _to_array(values: numpy.ndarray) -> array:
+    """return the values of an ndarray as a flat array('d')"""
+    return array("d", numpy.ascontiguousarray(values, dtype=numpy.float64).tobytes())
@@ -0,0 +1,66 @@
+# pure python backend, plain loops over lists of floats
+from array import array
+from typing import Iterable, Tuple
+
+from ..Precision import kernels
+
+NAME = "python"
+
+
+def add(a: Iterable[float], b: Iterable[float]) -> array:
+    """return the elementwise sum of two flat buffers"""
+    return array("d", [x + y for x, y in zip(a, b)])
+
+
+def sub(a: Iterable[float], b: Iterable[float]) -> array:
+    """return the elementwise difference of two flat buffers"""
+    return array("d", [x - y for x, y in zip(a, b)])
+
+
+def neg(a: Iterable[float]) -> array:
+    """return the opposite of a flat buffer"""
+    return array("d", [-x for x in a])
+
+
+def scale(a: Iterable[float], value: float) -> array:
+    """return a flat buffer multiplied by a scalar"""
+    return array("d", [value * x for x in a])
+
+
+def matvec(
+    a: Iterable[float],
+    x: Tuple[float],
+    shape: Tuple[int],
+    precision: str | None = None,
+    strides: Tuple[int] | None = None,
+    offset: int = 0,
+) -> array:
+    """return the product of a n x k matrix with k values, in the buffer a
+    from offset with strides (None is row-major, see the array backend)"""
+    n, k = shape
+    row_stride, column_stride = (k, 1) if strides is None else strides
+    dot = kernels.DOT[precision]
+    rows = [
+        [a[offset + i * row_stride + j * column_stride] for j in range(k)]
+        for i in range(n)
+    ]
+    return array("d", [dot(row, x) for row in rows])
+
+
+def matmul(
+    a: Iterable[float],
+    bt: Iterable[float],
+    shape: Tuple[int],
+    workers: int | None = None,
+    block_size: int | None = None,
+    precision: str | None = None,
+) -> array:
+    """return the flat product of a n x k matrix and the transposed m x k matrix bt
+
+    A row by column loop, workers and block_size are ignored.
+    """
+    n, k, m = shape
+    dot = kernels.DOT[precision]
+    rows = [list(a[i * k : (i + 1) * k]) for i in range(n)]
+    columns = [list(bt[j * k : (j + 1) * k]) for j in range(m)]
+    return array("d", [dot(row, column) for row in rows for column in columns])
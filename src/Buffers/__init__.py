@@ -0,0 +1,8 @@
+from .convert import (
+    array_interface,
+    as_doubles,
+    buffer_shape,
+    export,
+    is_buffer,
+    is_immutable,
+)
@@ -0,0 +1,180 @@
+# conversions between the buffers of other objects and the storage of the library
+import mmap
+import struct
+import sys
+from array import array
+from collections.abc import Buffer
+from itertools import chain
+from typing import Iterable, Tuple
+
+# the formats of the buffers read as raw native doubles (e.g. bytes, mmap)
+BYTE_FORMATS = ("B", "b", "c")
+
+# the untyped byte buffers (e.g. a binary dump read from a file), the ones of
+# other objects (array('B'), NumPy uint8, ...) contain numbers
+RAW_TYPES = (bytes, bytearray, mmap.mmap)
+
+# formats of numbers that are converted to doubles, once, when they are read
+NUMBER_FORMATS = tuple("?bBhHiIlLqQnNefd")
+
+# the formats of the native numbers converted by array
+ARRAY_FORMATS = tuple("bBhHiIlLqQfd")
+
+# type of the values in the array interface, native float64
+TYPESTR = ("<" if sys.byteorder == "little" else ">") + "f8"
+
+
+def is_buffer(value: object) -> bool:
+    """return true if value supports the buffer protocol (array, memoryview,
+    bytes, NumPy arrays, ...)"""
+    return isinstance(value, Buffer)
+
+
+def as_doubles(buffer: object) -> memoryview | array:
+    """Return the values of a buffer as a flat sequence of doubles
+
+    The memory of the buffer is shared, not copied, if its values are
+    native doubles (format "d", also NumPy float64 arrays) or raw bytes
+    (bytes, bytearray, mmap and the memoryviews on them, or format "c"),
+    which are read as native doubles: writing in the buffer changes the
+    values of the objects using it, and the objects on read-only buffers are
+    read-only.
+    Buffers of other numbers (float32, integers, also bytes like array('B')
+    and NumPy int8) and doubles not stored row-major are converted once to
+    a new array('d').
+
+    Raises:
+        TypeError: if the buffer doesn't contain numbers
+        ValueError: if the length of a byte buffer is not a multiple of 8
+    """
+    view = memoryview(buffer)
+    format = _native_format(view.format)
+    if (format or view.format[1:]) not in BYTE_FORMATS + NUMBER_FORMATS:
+        raise TypeError(f"Cannot read numbers from a buffer of format {view.format!r}")
+    if format == "c" or format in BYTE_FORMATS and isinstance(view.obj, RAW_TYPES):
+        if view.nbytes % 8:
+            raise ValueError(
+                f"A buffer of {view.nbytes} bytes doesn't contain a whole number "
+                + "of doubles"
+            )
+        if view.c_contiguous:
+            return view.cast("B").cast("d")
+        return array("d", view.tobytes())
+    if format == "d":
+        if view.c_contiguous:
+            return (
+                view
+                if view.format == "d" and view.ndim == 1
+                else view.cast("B").cast("d")
+            )
+        if view.ndim == 1:
+            return view
+    if view.format.lstrip("@") in ARRAY_FORMATS:
+        return array("d", array(view.format.lstrip("@"), view.tobytes()))
+    # standard sizes or the other byte order (e.g. "<i", ">d")
+    values = struct.iter_unpack(view.format, view.tobytes())
+    return array("d", chain.from_iterable(values))
+
+
+def is_immutable(buffer: object) -> bool:
+    """return true if the values of a buffer cannot change (bytes, a read-only
+    mmap and the memoryviews on them)"""
+    view = memoryview(buffer)
+    return view.readonly and isinstance(view.obj, bytes | mmap.mmap)
+
+
+def buffer_shape(buffer: object) -> Tuple[int]:
+    """return the shape of a buffer (the lengths of its axes)"""
+    return memoryview(buffer).shape
+
+
+def export(
+    data: Iterable[float],
+    shape: Tuple[int],
+    strides: Tuple[int],
+    offset: int,
+) -> memoryview:
+    """Return a read-only memoryview with a shape on the values of a strided storage
+
+    The view shares the storage if it's row-major without gaps, otherwise
+    it's on a copy of the values. It's read-only because the objects cache
+    quantities derived from their values (e.g. the LU factors of a matrix),
+    the changes made through an exported buffer would not invalidate them.
+    """
+    size = 1
+    contiguous = True
+    for length, stride in zip(reversed(shape), reversed(strides)):
+        contiguous = contiguous and (length == 1 or stride == size)
+        size *= length
+    view = memoryview(data)
+    if contiguous and view.c_contiguous:
+        view = view[offset : offset + size]
+    else:
+        view = memoryview(array("d", _gather(data, shape, strides, offset)))
+    view = view.toreadonly()
+    return view.cast("B").cast("d", shape) if len(shape) != 1 else view
+
+
+def array_interface(
+    data: Iterable[float],
+    shape: Tuple[int],
+    strides: Tuple[int],
+    offset: int,
+) -> dict:
+    """Return the NumPy array interface (version 3) of a strided storage
+
+    The interface describes the shape and the strides of the storage, so
+    NumPy uses its memory without copying it (also for transposed views),
+    only storages that are not a contiguous buffer are copied. The data is a
+    read-only memoryview, so the NumPy arrays are read-only, see export.
+    """
+    view = memoryview(data)
+    if not view.c_contiguous:
+        view = memoryview(array("d", _gather(data, shape, strides, offset)))
+        strides = tuple(_contiguous_strides(shape))
+        offset = 0
+    return {
+        "version": 3,
+        "shape": tuple(shape),
+        "typestr": TYPESTR,
+        "data": view.toreadonly(),
+        "offset": 8 * offset,
+        "strides": tuple(8 * stride for stride in strides),
+    }
+
+
+def _native_format(format: str) -> str | None:
+    """return the format without the native byte order (e.g. "<d" -> "d"), None
+    if it has the other byte order"""
+    if format[:1] in ("@", "="):
+        return format[1:]
+    if format[:1] == ("<" if sys.byteorder == "little" else ">"):
+        return format[1:]
+    if format[:1] in ("<", ">", "!"):
+        return None
+    return format
+
+
+def _gather(
+    data: Iterable[float], shape: Tuple[int], strides: Tuple[int], offset: int
+) -> Iterable[float]:
+    """return the values of a strided storage row-major"""
+    starts = [offset]
+    for length, stride in zip(shape[:-1], strides[:-1]):
+        starts = [start + i * stride for start in starts for i in range(length)]
+    length, stride = shape[-1], strides[-1]
+    if stride == 0:
+        return chain.from_iterable([data[start]] * length for start in starts)
+    return chain.from_iterable(
+        data[start : start + (length - 1) * stride + 1 : stride] for start in starts
+    )
+
+
+def _contiguous_strides(shape: Tuple[int]) -> Iterable[int]:
+    """return the strides of a row-major storage of a shape"""
+    stride = 1
+    strides = []
+    for length in reversed(shape):
+        strides.append(stride)
+        stride *= length
+    return reversed(strides)
@@ -0,0 +1 @@
+from .expr import Expression, lazy
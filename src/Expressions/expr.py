@@ -0,0 +1,389 @@
+# lazy expressions of vectors and matrices
+from abc import ABC, abstractmethod
+from array import array
+from typing import List, Tuple
+
+from ..Matrices import DiagonalMatrix, Matrix, SparseMatrix
+from ..Vectors import Vector, VectorBatch
+
+# the values a lazy expression can contain, the diagonal and sparse matrices
+# are converted to dense ones by the elementwise operations
+VALUE_TYPES = Vector | VectorBatch | Matrix | DiagonalMatrix | SparseMatrix
+
+
+def lazy(value: object) -> object:
+    """return a lazy expression wrapping a Vector, VectorBatch or matrix (Matrix,
+    DiagonalMatrix or SparseMatrix)
+
+    The operators of the expression (+, -, *, /, @) don't compute anything,
+    they build a tree which is evaluated by evaluate(): chains of matrix
+    products are multiplied in the cheapest order and chains of elementwise
+    operations are fused in a single pass.
+    """
+    if isinstance(value, Expression):
+        return value
+    return Leaf(value)
+
+
+class Expression(ABC):
+    """base class for the nodes of a lazy expression
+
+    shape is () for scalars, (n,) for vectors and (rows, columns) for matrices
+    and vector batches.
+    """
+
+    __slots__ = ("shape",)
+
+    def __add__(self, other: object) -> object:
+        """definition of lazy addition"""
+        return Elementwise.binary("+", self, other)
+
+    def __radd__(self, other: object) -> object:
+        """definition of lazy reverse addition"""
+        return Elementwise.binary("+", other, self)
+
+    def __neg__(self) -> object:
+        """definition of lazy negation"""
+        return Elementwise("neg", (self,), self.shape)
+
+    def __sub__(self, other: object) -> object:
+        """definition of lazy subtraction"""
+        return Elementwise.binary("-", self, other)
+
+    def __rsub__(self, other: object) -> object:
+        """definition of lazy reverse subtraction"""
+        return Elementwise.binary("-", other, self)
+
+    def __mul__(self, other: float | object) -> object:
+        """definition of lazy product for scalar and inner product of vectors"""
+        if isinstance(other, int | float):
+            return Elementwise("*", (other, self), self.shape)
+        return Dot(self, lazy(other))
+
+    def __rmul__(self, other: float | object) -> object:
+        """definition of lazy product for scalar"""
+        if isinstance(other, int | float):
+            return Elementwise("*", (other, self), self.shape)
+        return Dot(lazy(other), self)
+
+    def __truediv__(self, other: float) -> object:
+        """definition of lazy division by scalar"""
+        if not isinstance(other, int | float):
+            raise TypeError("Tried dividing an expression with a non numerical value")
+        if other == 0:
+            raise ZeroDivisionError("Tried dividing an expression for zero")
+        return Elementwise("/", (self, other), self.shape)
+
+    def __matmul__(self, other: object) -> object:
+        """definition of lazy matrix product"""
+        return MatMul.chain(self, lazy(other))
+
+    def __rmatmul__(self, other: object) -> object:
+        """definition of lazy reverse matrix product"""
+        return MatMul.chain(lazy(other), self)
+
+    @abstractmethod
+    def evaluate(self) -> object:
+        """compute the value of the expression"""
+
+    def explain(self) -> str:
+        """return the plan used by evaluate() and its estimated flop count"""
+        lines, flops = self._plan("")
+        return "\n".join(lines + [f"estimated flops: {flops:,}"])
+
+    @abstractmethod
+    def _plan(self, prefix: str) -> Tuple[List[str], int]:
+        """return the lines describing the plan and the flops of this node
+
+        Args:
+            prefix (str): indentation and name of the node in its parent
+        """
+
+    @staticmethod
+    def _plan_operands(
+        prefix: str, operands: List[object], names: List[str]
+    ) -> Tuple[List[str], int]:
+        """return the plans of the operands of a node, indented below it"""
+        indent = " " * (len(prefix) - len(prefix.lstrip(" ")) + 2)
+        lines, flops = [], 0
+        for name, operand in zip(names, operands):
+            operand_lines, operand_flops = operand._plan(indent + name)
+            lines += operand_lines
+            flops += operand_flops
+        return lines, flops
+
+    def _label(self) -> str:
+        """return a short description of the node"""
+        return f"{type(self).__name__}[{'x'.join(map(str, self.shape))}]"
+
+    def _size(self) -> int:
+        """return the number of values of the result"""
+        size = 1
+        for length in self.shape:
+            size *= length
+        return size
+
+
+class Leaf(Expression):
+    """an already computed value"""
+
+    __slots__ = ("value",)
+
+    def __init__(self, value: object) -> None:
+        """Create an object from a Vector, VectorBatch or a matrix"""
+        if not isinstance(value, VALUE_TYPES):
+            raise TypeError(
+                "Lazy expressions can contain only vectors and matrices, "
+                + f"not {type(value).__name__}"
+            )
+        shape = (len(value),) if isinstance(value, Vector) else tuple(value.size())
+        self.shape: Tuple[int] = shape
+        self.value = value
+
+    def evaluate(self) -> object:
+        """return the wrapped value"""
+        return self.value
+
+    def _plan(self, prefix: str) -> Tuple[List[str], int]:
+        return [prefix + self._label()], 0
+
+    def _label(self) -> str:
+        return f"{type(self.value).__name__}[{'x'.join(map(str, self.shape))}]"
+
+
+class Elementwise(Expression):
+    """elementwise operation (+, -, neg, product and division by scalar)
+
+    All the elementwise operations directly below this node are compiled into a
+    single function applied value by value, in one pass over the operands and
+    with a single allocation for the result.
+    """
+
+    __slots__ = ("op", "operands")
+
+    def __init__(self, op: str, operands: Tuple[object], shape: Tuple[int]) -> None:
+        self.op: str = op
+        self.operands: Tuple[object] = operands
+        self.shape: Tuple[int] = shape
+
+    @classmethod
+    def binary(cls, op: str, left: object, right: object) -> object:
+        """return the node of an addition or subtraction, checking the shapes"""
+        if not isinstance(left, Expression | VALUE_TYPES):
+            return NotImplemented
+        if not isinstance(right, Expression | VALUE_TYPES):
+            return NotImplemented
+        left, right = lazy(left), lazy(right)
+        if left.shape != right.shape or len(left.shape) == 0:
+            raise TypeError(
+                f"Operands must have the same shape\n\t"
+                + f"instead got: {left._label()} and {right._label()}"
+            )
+        return cls(op, (left, right), left.shape)
+
+    def evaluate(self) -> object:
+        """compute the fused kernel in a single pass over all the operands"""
+        inputs, scalars = [], {}
+        kernel = Elementwise._compile(
+            self._source(inputs, scalars), len(inputs), scalars
+        )
+        values = [operand.evaluate() for operand in inputs]
+        if not self.shape:
+            # product, division or negation of an inner product (a float)
+            return kernel(*values)
+        values = [
+            (
+                value.to_dense()
+                if isinstance(value, DiagonalMatrix | SparseMatrix)
+                else value
+            )
+            for value in values
+        ]
+        first = values[0]
+        flats = [Elementwise._flat(value) for value in values]
+        if isinstance(first, Vector):
+            return type(first)._from_coords(tuple(map(kernel, *flats)))
+        if isinstance(first, VectorBatch):
+            return VectorBatch._from_data(array("d", map(kernel, *flats)), first.dim)
+        if isinstance(first, Matrix):
+            return first._elementwise(map(kernel, *flats))
+        raise TypeError(f"Cannot fuse elementwise operations on {type(first).__name__}")
+
+    def _source(self, inputs: List[Expression], scalars: dict) -> str:
+        """return the source of the kernel, collecting its inputs and scalars"""
+        sources = []
+        for operand in self.operands:
+            if isinstance(operand, int | float):
+                name = f"s{len(scalars)}"
+                scalars[name] = operand
+                sources.append(name)
+            elif isinstance(operand, Elementwise):
+                sources.append(f"({operand._source(inputs, scalars)})")
+            else:
+                sources.append(f"a{len(inputs)}")
+                inputs.append(operand)
+        if self.op == "neg":
+            return f"-{sources[0]}"
+        return f" {self.op} ".join(sources)
+
+    def _plan(self, prefix: str) -> Tuple[List[str], int]:
+        inputs, scalars = [], {}
+        source = self._source(inputs, scalars)
+        scalars = "".join(f", {name} = {value}" for name, value in scalars.items())
+        lines = [
+            prefix
+            + f"fused elementwise {self._label()}: {source}{scalars}"
+            + f" (1 pass, {len(inputs)} inputs)"
+        ]
+        names = [f"a{i} = " for i in range(len(inputs))]
+        operand_lines, flops = Expression._plan_operands(prefix, inputs, names)
+        return lines + operand_lines, flops + self._count_operations() * self._size()
+
+    def _count_operations(self) -> int:
+        """return the number of operations per value of the fused kernel"""
+        return 1 + sum(
+            operand._count_operations()
+            for operand in self.operands
+            if isinstance(operand, Elementwise)
+        )
+
+    def _label(self) -> str:
+        return f"[{'x'.join(map(str, self.shape))}]"
+
+    @staticmethod
+    def _compile(source: str, n_inputs: int, scalars: dict):
+        """return the function computing the kernel for a single value"""
+        arguments = ", ".join(f"a{i}" for i in range(n_inputs))
+        return eval(f"lambda {arguments}: {source}", {"__builtins__": {}, **scalars})
+
+    @staticmethod
+    def _flat(value: object):
+        """return the values of a vector, batch or matrix in row-major order"""
+        if isinstance(value, Vector):
+            return value.coords
+        if isinstance(value, VectorBatch):
+            return value.data
+        return value._flat()
+
+
+class Dot(Expression):
+    """inner product of two vectors"""
+
+    __slots__ = ("left", "right")
+
+    def __init__(self, left: Expression, right: Expression) -> None:
+        if len(left.shape) != 1 or left.shape != right.shape:
+            raise TypeError(
+                f"The inner product needs two vectors of the same dimension\n\t"
+                + f"instead got: {left._label()} and {right._label()}"
+            )
+        self.left: Expression = left
+        self.right: Expression = right
+        self.shape: Tuple[int] = ()
+
+    def evaluate(self) -> float:
+        return self.left.evaluate() * self.right.evaluate()
+
+    def _plan(self, prefix: str) -> Tuple[List[str], int]:
+        lines = [prefix + f"inner product of vec{self.left.shape[0]}D"]
+        operand_lines, flops = Expression._plan_operands(
+            prefix, [self.left, self.right], ["", ""]
+        )
+        return lines + operand_lines, flops + 2 * self.left.shape[0]
+
+
+class MatMul(Expression):
+    """chain of matrix products A0 @ A1 @ ... @ An, the last one can be a vector
+
+    The order of the products is chosen with the classic dynamic programming
+    algorithm for the matrix chain, e.g. A @ B @ v is computed as A @ (B @ v).
+    """
+
+    __slots__ = ("operands", "_order")
+
+    def __init__(self, operands: Tuple[Expression]) -> None:
+        for left, right in zip(operands, operands[1:]):
+            if len(left.shape) != 2 or len(right.shape) == 0:
+                raise TypeError(
+                    "Matrix products need matrices, only the last one can be a vector"
+                )
+            if left.shape[1] != right.shape[0]:
+                raise TypeError(
+                    f"Cannot multiply a {left._label()} with a {right._label()}"
+                )
+        self.operands: Tuple[Expression] = operands
+        self.shape: Tuple[int] = operands[0].shape[:1] + operands[-1].shape[1:]
+        self._order = None
+
+    @classmethod
+    def chain(cls, left: Expression, right: Expression) -> object:
+        """return the node of left @ right, merging the chains of both sides"""
+        operands = []
+        for operand in (left, right):
+            operands += operand.operands if isinstance(operand, MatMul) else (operand,)
+        return cls(tuple(operands))
+
+    def evaluate(self) -> object:
+        splits, _ = self._optimal_order()
+        values = [operand.evaluate() for operand in self.operands]
+        return MatMul._multiply(values, splits, 0, len(values) - 1)
+
+    def _optimal_order(self) -> Tuple[List[List[int]], int]:
+        """return the split table of the cheapest order and its multiply-adds"""
+        if self._order is None:
+            # dimensions of the chain, vectors are n x 1 matrices
+            dims = [operand.shape[0] for operand in self.operands]
+            dims.append(
+                self.operands[-1].shape[1] if len(self.operands[-1].shape) == 2 else 1
+            )
+            n = len(self.operands)
+            costs = [[0] * n for _ in range(n)]
+            splits = [[0] * n for _ in range(n)]
+            for length in range(1, n):
+                for i in range(n - length):
+                    j = i + length
+                    costs[i][j], splits[i][j] = min(
+                        (
+                            costs[i][k]
+                            + costs[k + 1][j]
+                            + dims[i] * dims[k + 1] * dims[j + 1],
+                            k,
+                        )
+                        for k in range(i, j)
+                    )
+            self._order = splits, costs[0][n - 1]
+        return self._order
+
+    def _plan(self, prefix: str) -> Tuple[List[str], int]:
+        splits, multiply_adds = self._optimal_order()
+        labels = [f"A{i}" for i in range(len(self.operands))]
+        order = MatMul._parenthesize(labels, splits, 0, len(labels) - 1)
+        lines = [prefix + f"matrix chain {self._label()}: {order}"]
+        operand_lines, flops = Expression._plan_operands(
+            prefix, self.operands, [f"{label} = " for label in labels]
+        )
+        return lines + operand_lines, flops + 2 * multiply_adds
+
+    @staticmethod
+    def _multiply(
+        values: List[object], splits: List[List[int]], i: int, j: int
+    ) -> object:
+        """multiply values[i : j + 1] following the split table"""
+        if i == j:
+            return values[i]
+        k = splits[i][j]
+        return MatMul._multiply(values, splits, i, k) @ MatMul._multiply(
+            values, splits, k + 1, j
+        )
+
+    @staticmethod
+    def _parenthesize(
+        labels: List[str], splits: List[List[int]], i: int, j: int
+    ) -> str:
+        """return the order of the products as a string"""
+        if i == j:
+            return labels[i]
+        k = splits[i][j]
+        left = MatMul._parenthesize(labels, splits, i, k)
+        right = MatMul._parenthesize(labels, splits, k + 1, j)
+        return f"({left} @ {right})"
@@ -0,0 +1 @@
+from .counters import disable, enable, instrument, is_enabled, report, reset, stats
@@ -0,0 +1,291 @@
+# opt-in counters of calls, time, created objects and flops of the operators
+import atexit
+import functools
+import json
+import os
+import sys
+from contextlib import contextmanager
+from time import perf_counter_ns
+from typing import Callable, Dict, Iterator
+
+from ..Matrices import Matrix, SMatrix
+from ..Vectors import Vec2, Vec3, Vector
+
+# setting this environment variable (to anything but "" or "0") enables the
+# counters when the library is imported, and prints the report at exit.
+# With the value "json" the report is printed as JSON instead of a table
+ENV_VARIABLE = "VMTL_INSTRUMENT"
+
+# classes instrumented by default
+CLASSES = (Vector, Vec2, Vec3, Matrix, SMatrix)
+
+# methods never instrumented: attribute access, printing and object creation
+_SKIPPED = frozenset(
+    (
+        "__new__",
+        "__init_subclass__",
+        "__getattribute__",
+        "__getattr__",
+        "__setattr__",
+        "__delattr__",
+        "__repr__",
+        "__str__",
+        "__format__",
+    )
+)
+
+
+def _vector_size(vector: Vector, *args) -> int:
+    return len(vector)
+
+
+def _vector_mul(vector: Vector, other: object) -> int:
+    return 2 * len(vector) - 1 if isinstance(other, Vector) else len(vector)
+
+
+def _matrix_size(matrix: Matrix, *args) -> int:
+    n_rows, n_columns = matrix.size()
+    return n_rows * n_columns
+
+
+def _matrix_matmul(matrix: Matrix, other: object, *args, **kwargs) -> int:
+    n_rows, n_columns = matrix.size()
+    if isinstance(other, Matrix):
+        return 2 * n_rows * n_columns * other.size()[1]
+    return 2 * n_rows * n_columns
+
+
+def _lu_flops(matrix: SMatrix) -> int:
+    return 2 * matrix.size()[0] ** 3 // 3
+
+
+def _solve_flops(matrix: SMatrix, b: object) -> int:
+    return 2 * matrix.size()[0] ** 2
+
+
+# estimated floating point operations of the methods doing the arithmetic,
+# the methods delegating to them (__rmul__, solve, ...) count them through
+# the calls they make
+FLOPS: Dict[type, Dict[str, Callable[..., int]]] = {
+    Vector: {
+        "__add__": _vector_size,
+        "__sub__": _vector_size,
+        "__neg__": _vector_size,
+        "__mul__": _vector_mul,
+        "module": lambda vector: 2 * len(vector),
+        "normalize": _vector_size,
+        "get_normalized": _vector_size,
+    },
+    Vec3: {
+        "__matmul__": lambda vector, other: 9,
+    },
+    Matrix: {
+        "__add__": _matrix_size,
+        "__sub__": _matrix_size,
+        "__neg__": _matrix_size,
+        "__mul__": _matrix_size,
+        "__truediv__": _matrix_size,
+        "matmul": _matrix_matmul,
+    },
+    SMatrix: {
+        "_lu_decompose": _lu_flops,
+        "_solve_coords": _solve_flops,
+    },
+}
+
+# per operator: calls, nanoseconds, created objects and flops
+_records: Dict[str, list] = {}
+# objects created and flops since the counters were enabled, the value of an
+# operator is the difference before and after its call (nested calls included)
+_totals = [0, 0]
+# original attributes of the instrumented classes, restored by disable()
+_originals: list = []
+
+
+def is_enabled() -> bool:
+    """return true if the counters are enabled"""
+    return len(_originals) > 0
+
+
+def enable(classes: tuple = CLASSES) -> None:
+    """Start counting the calls of the methods of the classes
+
+    The methods are replaced with counting wrappers, and restored by
+    disable(): when the counters are not enabled the library runs its
+    own methods, with no cost at all.
+
+    Args:
+        classes (tuple, optional): the classes to instrument, their subclasses
+            count the methods they inherit. Defaults to CLASSES.
+    """
+    if is_enabled():
+        return
+    for cls in classes:
+        for name, attribute in list(vars(cls).items()):
+            wrapped = _wrap_attribute(cls, name, attribute)
+            if wrapped is not None:
+                _originals.append((cls, name, attribute))
+                setattr(cls, name, wrapped)
+    for cls in _roots(classes):
+        _originals.append((cls, "__new__", None))
+        cls.__new__ = staticmethod(_counting_new)
+
+
+def disable() -> None:
+    """Stop counting and restore the original methods, the counts are kept"""
+    while _originals:
+        cls, name, attribute = _originals.pop()
+        if attribute is None:
+            delattr(cls, name)
+        else:
+            setattr(cls, name, attribute)
+
+
+def reset() -> None:
+    """clear all the counts"""
+    _records.clear()
+    _totals[:] = [0, 0]
+
+
+@contextmanager
+def instrument(classes: tuple = CLASSES) -> Iterator[Dict[str, dict]]:
+    """Context manager counting the calls made inside its block
+
+    The counters are reset when entering the block, and restored to their
+    previous state (enabled or not) when leaving it.
+
+    Yields:
+        Dict[str, dict]: the counts, filled while the block runs, see stats()
+    """
+    was_enabled = is_enabled()
+    reset()
+    enable(classes)
+    counts: Dict[str, dict] = {}
+    try:
+        yield counts
+    finally:
+        if not was_enabled:
+            disable()
+        counts.update(stats())
+
+
+def stats() -> Dict[str, dict]:
+    """Return the counts of every operator called
+
+    Returns:
+        Dict[str, dict]: for each operator ("Class.method") the number of calls,
+            the total time in seconds, the objects created and the estimated
+            floating point operations. Time, objects and flops include the
+            nested calls. "Class.__new__" counts the objects of each class.
+    """
+    return {
+        name: {
+            "calls": calls,
+            "time": time_ns / 1e9,
+            "objects": objects,
+            "flops": flops,
+        }
+        for name, (calls, time_ns, objects, flops) in _records.items()
+    }
+
+
+def report(format: str = "table") -> str:
+    """return the counts as a table sorted by total time, or as JSON"""
+    counts = stats()
+    if format == "json":
+        return json.dumps(counts, indent=2)
+    if format != "table":
+        raise ValueError(f"Unknown format {format!r}, use 'table' or 'json'")
+    lines = [
+        f"{'operator':<48} {'calls':>10} {'total ms':>12} {'mean us':>10}"
+        + f" {'objects':>10} {'flops':>14}"
+    ]
+    for name, count in sorted(counts.items(), key=lambda item: -item[1]["time"]):
+        lines.append(
+            f"{name:<48} {count['calls']:>10} {count['time'] * 1e3:>12.3f}"
+            + f" {count['time'] * 1e6 / count['calls']:>10.2f}"
+            + f" {count['objects']:>10} {count['flops']:>14}"
+        )
+    return "\n".join(lines)
+
+
+def _wrap_attribute(cls: type, name: str, attribute: object) -> object | None:
+    """return the counting version of a class attribute, None if it's not a method"""
+    if name in _SKIPPED:
+        return None
+    key = f"{cls.__name__}.{name}"
+    flops = next(
+        (FLOPS[base][name] for base in cls.__mro__ if name in FLOPS.get(base, {})),
+        None,
+    )
+    if isinstance(attribute, staticmethod):
+        return staticmethod(_wrap(attribute.__func__, key, flops))
+    if isinstance(attribute, classmethod):
+        return classmethod(_wrap(attribute.__func__, key, flops))
+    if isinstance(attribute, property):
+        if attribute.fget is None:
+            return None
+        return attribute.getter(_wrap(attribute.fget, key, flops))
+    if callable(attribute) and not isinstance(attribute, type):
+        return _wrap(attribute, key, flops)
+    return None
+
+
+def _wrap(func: Callable, key: str, flops: Callable[..., int] | None) -> Callable:
+    """return func counting its calls in the record of key"""
+
+    @functools.wraps(func)
+    def counting(*args, **kwargs):
+        objects, total_flops = _totals
+        if flops is not None:
+            try:
+                _totals[1] += flops(*args, **kwargs)
+            except Exception:
+                # wrong arguments, the method itself will raise the error
+                pass
+        start = perf_counter_ns()
+        try:
+            return func(*args, **kwargs)
+        finally:
+            elapsed = perf_counter_ns() - start
+            record = _records.get(key)
+            if record is None:
+                record = _records[key] = [0, 0, 0, 0]
+            record[0] += 1
+            record[1] += elapsed
+            record[2] += _totals[0] - objects
+            record[3] += _totals[1] - total_flops
+
+    return counting
+
+
+def _counting_new(cls: type, *args, **kwargs) -> object:
+    """replaces __new__ of the instrumented classes, counts the created objects"""
+    _totals[0] += 1
+    record = _records.get(f"{cls.__name__}.__new__")
+    if record is None:
+        record = _records[f"{cls.__name__}.__new__"] = [0, 0, 0, 0]
+    record[0] += 1
+    record[2] += 1
+    return object.__new__(cls)
+
+
+def _roots(classes: tuple) -> list:
+    """return the classes that are not subclasses of other classes in classes"""
+    return [
+        cls
+        for cls in classes
+        if not any(cls is not other and issubclass(cls, other) for other in classes)
+    ]
+
+
+def _report_at_exit(format: str) -> None:
+    print(report(format), file=sys.stderr)
+
+
+if os.environ.get(ENV_VARIABLE, "0") not in ("", "0"):
+    enable()
+    atexit.register(
+        _report_at_exit,
+        "json" if os.environ[ENV_VARIABLE].lower() == "json" else "table",
+    )
@@ -0,0 +1,8 @@
+from .matC import CMatrix
+from .matD import DiagonalMatrix
+from .matF import FrozenMatrix
+from .matL import Boost
+from .matnm import Matrix
+from .matnn import SMatrix
+from .matR import Rotation
+from .matS import SparseMatrix
@@ -1 +1,331 @@
 # class for complex matrices
+import operator
+from array import array
+from typing import Iterable, Tuple
+
+from .. import Backends
+from ..Vectors import CVector, Vec2, Vector
+from . import matmul
+from .matnm import Matrix
+
+
+class CMatrix:
+    """class for n*m matrices with complex values
+
+    The values are stored row-major in a single array('d') with the real and
+    the imaginary parts interleaved (re, im, re, im, ...), so a n x m complex
+    matrix is also a n x 2m real matrix: the complex product is computed by
+    the real matrix product kernels (see matmul), tiles and processes included,
+    and no complex is ever created per value.
+    """
+
+    __slots__ = ("_data", "_shape")
+
+    def __init__(self, *rows: Iterable[complex]) -> None:
+        """Create an object from an unpacked tuple of rows of complex (or real) values"""
+        if len(rows) == 0:
+            raise TypeError("Matrices should have at least one row")
+        rows = [tuple(row) for row in rows]
+        n_columns = len(rows[0])
+        if n_columns == 0:
+            raise TypeError("Each row should have at least one element in a matrix")
+        if any(len(row) != n_columns for row in rows):
+            raise TypeError(
+                "Matrices should have the same number of elements in each row"
+            )
+        data = array("d")
+        for row in rows:
+            for value in row:
+                if isinstance(value, Vec2):
+                    data.extend(value.coords)
+                elif isinstance(value, complex | int | float):
+                    data.extend((value.real, value.imag))
+                else:
+                    raise TypeError(
+                        "Complex matrices values can only be complex, int, float or Vec2"
+                    )
+        self._data: array = data
+        self._shape: Tuple[int] = (len(rows), n_columns)
+
+    @property
+    def coords(self) -> Tuple[Tuple[complex]]:
+        """return the values of the matrix as a tuple of rows of complex"""
+        return tuple(tuple(self.row(i)) for i in range(self._shape[0]))
+
+    @property
+    def real(self) -> object:
+        """return the real parts of the values as a Matrix"""
+        return Matrix._from_buffer(self._data[0::2], self._shape)
+
+    @property
+    def imag(self) -> object:
+        """return the imaginary parts of the values as a Matrix"""
+        return Matrix._from_buffer(self._data[1::2], self._shape)
+
+    def __repr__(self) -> str:
+        """return a string in the form of CMatrix((row 0), (row 1), ...)"""
+        return "CMatrix(" + ", ".join(map(str, self.coords)) + ")"
+
+    def __getitem__(self, key: int | Tuple[int]) -> complex | object:
+        """return a value (m[i, j]) as a complex, or a row (m[i]) as a CVector"""
+        if isinstance(key, tuple) and len(key) == 2:
+            i = CMatrix.__normalize_index(key[0], self._shape[0])
+            j = CMatrix.__normalize_index(key[1], self._shape[1])
+            k = 2 * (i * self._shape[1] + j)
+            return complex(self._data[k], self._data[k + 1])
+        if isinstance(key, int):
+            return self.row(key)
+        raise TypeError("Complex matrices are indexed with m[row] or m[row, column]")
+
+    def __setitem__(self, key: Tuple[int], value: complex) -> None:
+        """set in place a single value of the matrix (m[i, j] = value)"""
+        if not isinstance(key, tuple) or len(key) != 2:
+            raise TypeError("Matrix values should be set as m[row, column]")
+        if not isinstance(value, complex | int | float):
+            raise TypeError("Complex matrices values can only be complex, int or float")
+        i = CMatrix.__normalize_index(key[0], self._shape[0])
+        j = CMatrix.__normalize_index(key[1], self._shape[1])
+        k = 2 * (i * self._shape[1] + j)
+        self._data[k : k + 2] = array("d", (value.real, value.imag))
+
+    def __eq__(self, other: object) -> bool:
+        """two complex matrices are equal if they have the same shape and values"""
+        if not isinstance(other, CMatrix):
+            return NotImplemented
+        return self._shape == other._shape and self._data == other._data
+
+    def __add__(self, other: object) -> object:
+        """definition of addition"""
+        if not isinstance(other, CMatrix):
+            return NotImplemented
+        CMatrix.__check_raise_same_size_error(self, other)
+        values = array("d", map(operator.add, self._data, other._data))
+        return CMatrix._from_buffer(values, self._shape)
+
+    def __neg__(self) -> object:
+        """definition of negation"""
+        values = array("d", map(operator.neg, self._data))
+        return CMatrix._from_buffer(values, self._shape)
+
+    def __sub__(self, other: object) -> object:
+        """definition of subtraction"""
+        if not isinstance(other, CMatrix):
+            return NotImplemented
+        CMatrix.__check_raise_same_size_error(self, other)
+        values = array("d", map(operator.sub, self._data, other._data))
+        return CMatrix._from_buffer(values, self._shape)
+
+    def __mul__(self, other: complex) -> object:
+        """definition of product for scalar"""
+        if not isinstance(other, complex | int | float):
+            raise TypeError("Tried multiplying a matrix with a non numerical value")
+        return CMatrix._from_buffer(CVector._scale(self._data, other), self._shape)
+
+    def __rmul__(self, other: complex) -> object:
+        """definition of product for scalar"""
+        return self * other
+
+    def __truediv__(self, other: complex) -> object:
+        """definition of division by scalar"""
+        if not isinstance(other, complex | int | float):
+            raise TypeError("Tried dividing a matrix with a non numerical value")
+        if other == 0:
+            raise ZeroDivisionError("Tried dividing a matrix for zero")
+        return self * (1 / other)
+
+    def __matmul__(self, other: object) -> object:
+        """definition of matrix product, with a (complex) matrix or vector"""
+        if not isinstance(other, CMatrix | CVector | Matrix | Vector):
+            return NotImplemented
+        return self.matmul(other)
+
+    def __rmatmul__(self, other: object) -> object:
+        """definition of matrix product of a real Matrix with a complex matrix"""
+        if not isinstance(other, Matrix):
+            return NotImplemented
+        return CMatrix.from_parts(other) @ self
+
+    def matmul(
+        self,
+        other: object,
+        workers: int | None = None,
+        block_size: int = matmul.BLOCK_SIZE,
+        precision: str | None = None,
+        backend: str | None = None,
+    ) -> object:
+        """Complex matrix product, with the same options of Matrix.matmul
+
+        Every row of self is a real row (re, im, ...) of length 2k, and every
+        column of other becomes the two real columns (re, -im, ...) and
+        (im, re, ...): their real products are the real and the imaginary
+        part of the complex product, already interleaved in the result.
+
+        Args:
+            other (object): a CMatrix (or a real Matrix) with as many rows as the
+                columns of self, or a CVector (or a real Vector) with as many
+                components
+            workers (int, optional): number of processes, see Matrix.matmul
+            block_size (int, optional): size of the tiles
+            precision (str, optional): precision policy of the inner products
+            backend (str, optional): the backend of the real product, see Backends
+
+        Returns:
+            object: a CMatrix, or a CVector if other is a vector
+        """
+        if isinstance(other, Matrix):
+            other = CMatrix.from_parts(other)
+        elif isinstance(other, Vector):
+            other = CVector.from_parts(other)
+        n_rows, n_columns = self._shape
+        if isinstance(other, CVector):
+            if len(other) != n_columns:
+                raise TypeError(
+                    f"Cannot multiply a {n_rows}x{n_columns} matrix "
+                    + f"with a cvec{len(other)}D"
+                )
+            columns, m = other.data, 1
+        elif isinstance(other, CMatrix):
+            if other._shape[0] != n_columns:
+                raise TypeError(
+                    f"Cannot multiply a {n_rows}x{n_columns} matrix "
+                    + f"with a {other._shape[0]}x{other._shape[1]} matrix"
+                )
+            columns, m = other.get_transposed()._data, other._shape[1]
+        else:
+            raise TypeError(
+                "Complex matrices can only be multiplied with a matrix or a vector"
+            )
+
+        # the real transposed right operand, 2m rows of length 2k
+        k = 2 * n_columns
+        conjugates = CMatrix.__conjugate(columns)
+        swapped = array("d", bytes(8 * len(columns)))
+        swapped[0::2], swapped[1::2] = columns[1::2], columns[0::2]
+        bt_flat = array("d")
+        for j in range(0, m * k, k):
+            bt_flat.extend(conjugates[j : j + k])
+            bt_flat.extend(swapped[j : j + k])
+        values = Backends.get_backend(backend).matmul(
+            self._data, bt_flat, (n_rows, k, 2 * m), workers, block_size, precision
+        )
+        if isinstance(other, CVector):
+            return CVector._from_data(values)
+        return CMatrix._from_buffer(values, (n_rows, m))
+
+    def row(self, i: int) -> object:
+        """return a copy of the i-th row as a CVector"""
+        i = CMatrix.__normalize_index(i, self._shape[0])
+        length = 2 * self._shape[1]
+        return CVector._from_data(self._data[i * length : (i + 1) * length])
+
+    def column(self, j: int) -> object:
+        """return a copy of the j-th column as a CVector"""
+        j = CMatrix.__normalize_index(j, self._shape[1])
+        step = 2 * self._shape[1]
+        data = array("d", bytes(16 * self._shape[0]))
+        data[0::2], data[1::2] = (
+            self._data[2 * j :: step],
+            self._data[2 * j + 1 :: step],
+        )
+        return CVector._from_data(data)
+
+    def size(self) -> Tuple[int]:
+        """return the number of rows and of columns of the matrix"""
+        return self._shape
+
+    def copy(self) -> object:
+        """return a copy of the matrix"""
+        return CMatrix._from_buffer(array("d", self._data), self._shape)
+
+    def is_zero(self) -> bool:
+        """return true if all the values of the matrix are zero"""
+        return not any(self._data)
+
+    def conjugate(self) -> object:
+        """return the complex conjugate matrix (not in place)"""
+        return CMatrix._from_buffer(CMatrix.__conjugate(self._data), self._shape)
+
+    def get_transposed(self) -> object:
+        """return the transposed matrix (not in place, without conjugation)"""
+        return CMatrix._from_buffer(self.__transposed_data(False), self._shape[::-1])
+
+    def get_conjugate_transposed(self) -> object:
+        """return the conjugate transposed (hermitian adjoint) matrix"""
+        return CMatrix._from_buffer(self.__transposed_data(True), self._shape[::-1])
+
+    def is_hermitian(self, tol: float = 0.0) -> bool:
+        """return true if the matrix is equal to its conjugate transposed, within tol"""
+        if self._shape[0] != self._shape[1]:
+            return False
+        adjoint = self.__transposed_data(True)
+        return all(abs(a - b) <= tol for a, b in zip(self._data, adjoint))
+
+    def __transposed_data(self, conjugate: bool) -> array:
+        """return the interleaved values of the (conjugate) transposed matrix"""
+        n_rows, n_columns = self._shape
+        step = 2 * n_columns
+        out = array("d", bytes(8 * len(self._data)))
+        for j in range(n_columns):
+            start = 2 * j * n_rows
+            out[start : start + 2 * n_rows : 2] = self._data[2 * j :: step]
+            out[start + 1 : start + 2 * n_rows : 2] = self._data[2 * j + 1 :: step]
+        return CMatrix.__conjugate(out) if conjugate else out
+
+    @classmethod
+    def from_parts(cls, real: object, imag: object | None = None) -> object:
+        """Create a complex matrix from the Matrix of the real parts and the
+        Matrix of the imaginary parts (zero if None)"""
+        if not isinstance(real, Matrix) or not isinstance(imag, Matrix | None):
+            raise TypeError("The real and imaginary parts should be Matrix")
+        data = array("d", bytes(16 * real._shape[0] * real._shape[1]))
+        data[0::2] = array("d", real._flat())
+        if imag is not None:
+            if imag._shape != real._shape:
+                raise TypeError("The real and imaginary parts must have the same size")
+            data[1::2] = array("d", imag._flat())
+        return cls._from_buffer(data, real._shape)
+
+    @classmethod
+    def identity(cls, n: int) -> object:
+        """return the n x n identity matrix"""
+        if not isinstance(n, int) or n < 1:
+            raise ValueError("The size of the identity should be a positive integer")
+        data = array("d", bytes(16 * n * n))
+        data[0 :: 2 * (n + 1)] = array("d", [1.0]) * n
+        return cls._from_buffer(data, (n, n))
+
+    @classmethod
+    def _from_buffer(cls, data: array, shape: Tuple[int]) -> object:
+        """Create an object from an interleaved row-major array('d') (no checks, no copy)"""
+        matrix = cls.__new__(cls)
+        matrix._data = data
+        matrix._shape = shape
+        return matrix
+
+    @staticmethod
+    def __conjugate(data: array) -> array:
+        """return a copy of the interleaved values with the imaginary parts negated"""
+        out = array("d", data)
+        out[1::2] = array("d", map(operator.neg, data[1::2]))
+        return out
+
+    @staticmethod
+    def __normalize_index(index: int, length: int) -> int:
+        """return the positive index, raise an error if it's out of range"""
+        if not isinstance(index, int):
+            raise TypeError("Matrix indices must be integers")
+        if index < 0:
+            index += length
+        if not 0 <= index < length:
+            raise IndexError("Matrix index out of range")
+        return index
+
+    @staticmethod
+    def __check_raise_same_size_error(x: object, y: object) -> None:
+        """raise an error if the matrices don't have the same size"""
+        if x._shape != y._shape:
+            raise TypeError(
+                f"Matrices must have the same size\n\t"
+                + f"instead got: {x._shape[0]}x{x._shape[1]} and "
+                + f"{y._shape[0]}x{y._shape[1]}"
+            )
@@ -1 +1,219 @@
 # class for diagonal matrices
+import math
+import operator
+from array import array
+from functools import partial
+from itertools import chain, cycle, repeat
+from typing import Tuple
+
+from ..Vectors import Vector
+from .matnm import Matrix
+from .matnn import SMatrix
+
+
+class DiagonalMatrix:
+    """class for n*n diagonal matrices
+
+    Only the n values of the diagonal are stored, so products, inverse,
+    determinant and powers are O(n), and the product with a dense n*m Matrix
+    just scales its rows (D @ A) or its columns (A @ D) in O(n*m).
+    """
+
+    __slots__ = ("_diagonal",)
+
+    def __init__(self, *diagonal: float) -> None:
+        """Create an object from an unpacked tuple of the values of the diagonal"""
+        if len(diagonal) == 0:
+            raise TypeError(
+                "DiagonalMatrix objects must have at least 1 argument, 0 where given"
+            )
+        if any(not isinstance(value, int | float) for value in diagonal):
+            raise TypeError("Matrices values can only be integers or floats")
+        self._diagonal: array = array("d", diagonal)
+
+    @property
+    def diagonal(self) -> Tuple[float]:
+        """return the values of the diagonal"""
+        return tuple(self._diagonal)
+
+    @property
+    def determinant(self) -> float:
+        """return the determinant, the product of the diagonal"""
+        return math.prod(self._diagonal)
+
+    @property
+    def trace(self) -> float:
+        """return the trace, the sum of the diagonal"""
+        return math.fsum(self._diagonal)
+
+    def __str__(self) -> str:
+        """Return a pretty visualization of the matrix"""
+        return str(self.to_dense()).replace("Matrix", "DiagonalMatrix", 1)
+
+    def __repr__(self) -> str:
+        """return a string in the form of DiagonalMatrix(d0, d1, ...)"""
+        return "DiagonalMatrix(" + ", ".join(map(str, self._diagonal)) + ")"
+
+    def __getitem__(self, key: Tuple[int]) -> float:
+        """return the value in position m[i, j]"""
+        if not isinstance(key, tuple) or len(key) != 2:
+            raise TypeError("Matrix values should be read as m[row, column]")
+        if any(not isinstance(index, int) for index in key):
+            raise TypeError("Matrix indices must be integers")
+        n = len(self._diagonal)
+        i, j = (index + n if index < 0 else index for index in key)
+        if not 0 <= i < n or not 0 <= j < n:
+            raise IndexError("Matrix index out of range")
+        return self._diagonal[i] if i == j else 0.0
+
+    def __add__(self, other: object) -> object:
+        """definition of addition between diagonal matrices"""
+        if not isinstance(other, DiagonalMatrix):
+            return NotImplemented
+        DiagonalMatrix.__check_raise_same_size_error(self, other)
+        return self._from_diagonal(
+            array("d", map(operator.add, self._diagonal, other._diagonal))
+        )
+
+    def __neg__(self) -> object:
+        """definition of negation"""
+        return self._from_diagonal(array("d", map(operator.neg, self._diagonal)))
+
+    def __sub__(self, other: object) -> object:
+        """definition of subtraction between diagonal matrices"""
+        if not isinstance(other, DiagonalMatrix):
+            return NotImplemented
+        DiagonalMatrix.__check_raise_same_size_error(self, other)
+        return self._from_diagonal(
+            array("d", map(operator.sub, self._diagonal, other._diagonal))
+        )
+
+    def __mul__(self, other: float) -> object:
+        """definition of product for scalar"""
+        if not isinstance(other, int | float):
+            return NotImplemented
+        return self._from_diagonal(
+            array("d", map(partial(operator.mul, other), self._diagonal))
+        )
+
+    def __rmul__(self, other: float) -> object:
+        """definition of product for scalar"""
+        return self * other
+
+    def __truediv__(self, other: float) -> object:
+        """definition of division by scalar"""
+        if not isinstance(other, int | float):
+            raise TypeError("Tried dividing a matrix with a non numerical value")
+        if other == 0:
+            raise ZeroDivisionError("Tried dividing a matrix for zero")
+        return self._from_diagonal(
+            array("d", map(operator.truediv, self._diagonal, repeat(other)))
+        )
+
+    def __matmul__(self, other: object) -> object:
+        """definition of product with a DiagonalMatrix, a Vector or a Matrix
+
+        The product with a Matrix scales its rows, the result has the same type
+        (Matrix or SMatrix) of other.
+        """
+        n = len(self._diagonal)
+        if isinstance(other, DiagonalMatrix):
+            DiagonalMatrix.__check_raise_same_size_error(self, other)
+            return self._from_diagonal(
+                array("d", map(operator.mul, self._diagonal, other._diagonal))
+            )
+        if isinstance(other, Vector):
+            if len(other) != n:
+                raise TypeError(
+                    f"Cannot multiply a {n}x{n} matrix with a vec{len(other)}D"
+                )
+            return type(other)._from_coords(
+                tuple(map(operator.mul, self._diagonal, other.coords))
+            )
+        if isinstance(other, Matrix):
+            n_rows, n_columns = other.size()
+            if n_rows != n:
+                raise TypeError(
+                    f"Cannot multiply a {n}x{n} matrix "
+                    + f"with a {n_rows}x{n_columns} matrix"
+                )
+            scales = chain.from_iterable(map(repeat, self._diagonal, repeat(n_columns)))
+            return other._elementwise(map(operator.mul, other._flat(), scales))
+        return NotImplemented
+
+    def __rmatmul__(self, other: object) -> object:
+        """definition of product of a Matrix with a diagonal matrix (scales the columns)"""
+        if not isinstance(other, Matrix):
+            return NotImplemented
+        n = len(self._diagonal)
+        n_rows, n_columns = other.size()
+        if n_columns != n:
+            raise TypeError(
+                f"Cannot multiply a {n_rows}x{n_columns} matrix "
+                + f"with a {n}x{n} matrix"
+            )
+        return other._elementwise(
+            map(operator.mul, other._flat(), cycle(self._diagonal))
+        )
+
+    def __pow__(self, other: int) -> object:
+        """definition of integer power, negative powers use the inverse"""
+        if not isinstance(other, int):
+            raise TypeError("The exponent must be an integer")
+        if other < 0:
+            return self.invert() ** -other
+        return self._from_diagonal(
+            array("d", map(pow, self._diagonal, repeat(float(other))))
+        )
+
+    def size(self) -> Tuple[int]:
+        """return the number of rows and the number of columns"""
+        n = len(self._diagonal)
+        return n, n
+
+    def copy(self) -> object:
+        """return a deepcopy of the matrix"""
+        return self._from_diagonal(array("d", self._diagonal))
+
+    def invert(self) -> object:
+        """return the inverse matrix (not in place)
+
+        Raises:
+            ValueError: if the matrix is singular
+        """
+        if not all(self._diagonal):
+            raise ValueError("The matrix is singular")
+        return self._from_diagonal(
+            array("d", map(operator.truediv, repeat(1.0), self._diagonal))
+        )
+
+    def to_dense(self) -> object:
+        """return the dense SMatrix with the same values"""
+        n = len(self._diagonal)
+        data = array("d", bytes(8 * n * n))
+        data[:: n + 1] = self._diagonal
+        return SMatrix._from_buffer(data, (n, n))
+
+    @classmethod
+    def _from_diagonal(cls, diagonal: array) -> object:
+        """Create an object from an already validated array('d') (no checks, no copy)"""
+        matrix = cls.__new__(cls)
+        matrix._diagonal = diagonal
+        return matrix
+
+    @classmethod
+    def identity(cls, n: int) -> object:
+        """return the n x n identity matrix"""
+        if not isinstance(n, int) or n < 1:
+            raise ValueError("The size of the identity should be a positive integer")
+        return cls._from_diagonal(array("d", repeat(1.0, n)))
+
+    @staticmethod
+    def __check_raise_same_size_error(x: object, y: object) -> None:
+        """raise an error if the matrices don't have the same size"""
+        if len(x._diagonal) != len(y._diagonal):
+            raise TypeError(
+                f"Matrices must have the same size\n\t"
+                + f"instead got: {x.size()[0]}x{x.size()[1]} and "
+                + f"{y.size()[0]}x{y.size()[1]}"
+            )
@@ -1 +1,97 @@
 # class for frozen (immutable) matrices
+import operator
+from array import array
+from typing import Tuple
+
+from .matnm import Matrix
+
+
+class FrozenMatrix(Matrix):
+    """class for frozen (immutable) n*m matrices
+
+    The buffer of a frozen matrix is a read-only memoryview, so also its rows,
+    columns, submatrices and transposed matrix cannot be changed.
+    Frozen matrices are hashable and their derived quantities (determinant,
+    transposed matrix) are computed only once and cached.
+
+    subclass of Matrix
+    """
+
+    __slots__ = ()
+
+    def __init__(self, *coords: Tuple[float], shape: Tuple[int] | None = None) -> None:
+        """Create an object from an unpacked tuple of rows, or from a buffer
+        (its values are copied, the buffer can still be changed)"""
+        super().__init__(*coords, shape=shape)
+        if not isinstance(self._data, array):
+            self._data = array("d", self._data)
+        self._data = memoryview(self._data).toreadonly()
+
+    @property
+    def determinant(self) -> float:
+        """return the determinant, only defined for square matrices (cached)"""
+        return self._cached("determinant", lambda: Matrix.determinant.fget(self))
+
+    def __setitem__(self, key: Tuple[int], value: float) -> None:
+        """not defined, frozen matrices cannot be changed"""
+        raise TypeError("FrozenMatrix objects are immutable")
+
+    def __eq__(self, other: object) -> bool:
+        """two frozen matrices are equal if they have the same size and values"""
+        if not isinstance(other, FrozenMatrix):
+            return NotImplemented
+        return self._shape == other._shape and all(
+            map(operator.eq, self._flat(), other._flat())
+        )
+
+    def __hash__(self) -> int:
+        """return the hash of the size and the values (cached)"""
+        return self._cached("hash", lambda: hash((self._shape, tuple(self._flat()))))
+
+    def transpose(self) -> None:
+        """not defined, frozen matrices cannot be changed"""
+        raise TypeError("FrozenMatrix objects are immutable")
+
+    def gauss_method(self, tol: float | None = None) -> None:
+        """not defined, frozen matrices cannot be changed (see rank and rref)"""
+        raise TypeError("FrozenMatrix objects are immutable")
+
+    def gauss_reversed(self, tol: float | None = None) -> None:
+        """not defined, frozen matrices cannot be changed (see rank and rref)"""
+        raise TypeError("FrozenMatrix objects are immutable")
+
+    def gauss(self, tol: float | None = None) -> None:
+        """not defined, frozen matrices cannot be changed (see rank and rref)"""
+        raise TypeError("FrozenMatrix objects are immutable")
+
+    def get_transposed(self) -> object:
+        """not in place, return a view sharing the buffer of the matrix (cached)"""
+        return self._cached("transposed", lambda: Matrix.get_transposed(self))
+
+    def _is_cacheable(self) -> bool:
+        """the buffer is a read-only copy, the values never change"""
+        return True
+
+    @classmethod
+    def _from_buffer(
+        cls,
+        data: array,
+        shape: Tuple[int],
+        strides: Tuple[int] | None = None,
+        offset: int = 0,
+        version: list | None = None,
+    ) -> object:
+        """Create an object on a buffer, see Matrix._from_buffer
+
+        The buffer is wrapped in a read-only memoryview if it's not one already.
+        """
+        if not isinstance(data, memoryview) or not data.readonly:
+            data = memoryview(data).toreadonly()
+        return super()._from_buffer(data, shape, strides, offset, version)
+
+    @classmethod
+    def from_matrix(cls, matrix: object) -> object:
+        """Create a frozen copy of a Matrix"""
+        if not isinstance(matrix, Matrix):
+            raise TypeError("The argument should be a Matrix")
+        return cls._from_buffer(array("d", matrix._flat()), matrix.size())
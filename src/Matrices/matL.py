@@ -0,0 +1,190 @@
+# class for Lorentz boosts
+import math
+from array import array
+from functools import lru_cache
+from typing import Iterable, List, Tuple
+
+from ..Vectors import FourVector, Vec3, Vector, VectorBatch
+from .matnn import SMatrix
+
+# number of boosts (by velocity) whose parameters and matrix are kept, the
+# least recently used are discarded first
+BOOST_CACHE_SIZE = 1024
+
+
+class Boost:
+    """class for Lorentz boosts of four-vectors (t, x, y, z), in units where c = 1
+
+    Boost(bx, by, bz) transforms the four-vectors to the frame moving with
+    velocity (bx, by, bz): the boost of a particle's own velocity takes it
+    to its rest frame (see rest_frame).
+    The Lorentz factor and the 4x4 matrix are computed once per velocity and
+    kept in a bounded LRU cache shared by all the boosts, so the boosts
+    created again for the same velocity (e.g. one per event) cost nothing.
+    Batches of four-vectors are boosted column by column, in a single call.
+    """
+
+    __slots__ = ("_beta", "_gamma", "_factor", "_matrix")
+
+    def __init__(self, bx: float, by: float, bz: float) -> None:
+        """Create the boost to the frame moving with velocity (bx, by, bz), |beta| < 1"""
+        if any(not isinstance(value, int | float) for value in (bx, by, bz)):
+            raise TypeError("The velocity values can only be integers or floats")
+        beta = (float(bx), float(by), float(bz))
+        if math.hypot(*beta) >= 1:
+            raise ValueError("The velocity of a boost should be smaller than 1 (c)")
+        self._beta: Tuple[float] = beta
+        self._gamma, self._factor, self._matrix = _boost_parameters(*beta)
+
+    @property
+    def beta(self) -> object:
+        """return the velocity of the boost as a Vec3"""
+        return Vec3._from_coords(self._beta)
+
+    @property
+    def gamma(self) -> float:
+        """return the Lorentz factor, 1 / sqrt(1 - beta^2)"""
+        return self._gamma
+
+    @property
+    def rapidity(self) -> float:
+        """return the rapidity of the boost, atanh(|beta|)"""
+        return math.atanh(math.hypot(*self._beta))
+
+    @property
+    def matrix(self) -> object:
+        """return the 4x4 boost matrix as a SMatrix"""
+        return SMatrix._from_buffer(array("d", self._matrix), (4, 4))
+
+    def __repr__(self) -> str:
+        """return a string in the form of Boost(bx, by, bz)"""
+        return "Boost(" + ", ".join(map(str, self._beta)) + ")"
+
+    def __eq__(self, other: object) -> bool:
+        """two boosts are equal if they have the same velocity"""
+        if not isinstance(other, Boost):
+            return NotImplemented
+        return self._beta == other._beta
+
+    def __matmul__(self, other: object) -> object:
+        """definition of boost of a FourVector, or of a VectorBatch of four-vectors
+
+        The batch is boosted not in place, its rows are (t, x, y, z).
+        """
+        if isinstance(other, FourVector):
+            return type(other)._from_coords(self.__boost(*other.coords))
+        if isinstance(other, VectorBatch):
+            Boost.__check_raise_batch_dim_error(other)
+            return VectorBatch._from_data(self.__boost_flat(other.data), 4)
+        if isinstance(other, Vector):
+            raise TypeError(f"Cannot boost a vec{len(other)}D, only FourVector")
+        return NotImplemented
+
+    def inverse(self) -> object:
+        """return the inverse boost, with the opposite velocity"""
+        bx, by, bz = self._beta
+        return Boost(-bx, -by, -bz)
+
+    def apply(self, vectors: Iterable[object]) -> List[object]:
+        """return the boosted copies of a collection of FourVector, in a single call"""
+        vectors = list(vectors)
+        if any(not isinstance(vector, FourVector) for vector in vectors):
+            raise TypeError("Only collections of FourVector can be boosted")
+        return [
+            type(vector)._from_coords(self.__boost(*vector.coords))
+            for vector in vectors
+        ]
+
+    def boost(self, vectors: object) -> None:
+        """Boost in place a FourVector, a VectorBatch or a collection of FourVector
+
+        Args:
+            vectors (object): a FourVector, a VectorBatch of dimension 4 (its
+                buffer is overwritten) or an iterable of FourVector
+        """
+        if isinstance(vectors, FourVector):
+            vectors._set_coords(self.__boost(*vectors.coords))
+        elif isinstance(vectors, VectorBatch):
+            Boost.__check_raise_batch_dim_error(vectors)
+            vectors.data[:] = self.__boost_flat(vectors.data)
+        else:
+            vectors = list(vectors)
+            if any(not isinstance(vector, FourVector) for vector in vectors):
+                raise TypeError("Only collections of FourVector can be boosted")
+            for vector in vectors:
+                vector._set_coords(self.__boost(*vector.coords))
+
+    def __boost(self, t: float, x: float, y: float, z: float) -> Tuple[float]:
+        """return the boosted coordinates of a single four-vector"""
+        bx, by, bz = self._beta
+        gamma = self._gamma
+        projection = bx * x + by * y + bz * z
+        shift = self._factor * projection - gamma * t
+        return gamma * (t - projection), x + shift * bx, y + shift * by, z + shift * bz
+
+    def __boost_flat(self, data: Iterable[float]) -> array:
+        """return the boosted flat coordinates t0, x0, y0, z0, t1, ... of many vectors
+
+        t' = gamma (t - beta . r) and r' = r + (k beta . r - gamma t) beta, with
+        k = gamma^2 / (1 + gamma): 13 operations per vector instead of the
+        28 of the matrix product.
+        """
+        bx, by, bz = self._beta
+        gamma, factor = self._gamma, self._factor
+        ts, xs, ys, zs = data[0::4], data[1::4], data[2::4], data[3::4]
+        projections = [bx * x + by * y + bz * z for x, y, z in zip(xs, ys, zs)]
+        shifts = [factor * p - gamma * t for t, p in zip(ts, projections)]
+        out = array("d", bytes(8 * len(data)))
+        out[0::4] = array("d", [gamma * (t - p) for t, p in zip(ts, projections)])
+        out[1::4] = array("d", [x + s * bx for x, s in zip(xs, shifts)])
+        out[2::4] = array("d", [y + s * by for y, s in zip(ys, shifts)])
+        out[3::4] = array("d", [z + s * bz for z, s in zip(zs, shifts)])
+        return out
+
+    @classmethod
+    def from_velocity(cls, beta: object) -> object:
+        """Create the boost to the frame moving with velocity beta (Vec3)"""
+        if not isinstance(beta, Vec3):
+            raise TypeError("The velocity of a boost should be a Vec3")
+        return cls(*beta.coords)
+
+    @classmethod
+    def rest_frame(cls, momentum: object) -> object:
+        """Create the boost to the rest frame of a four-momentum (E, px, py, pz)
+
+        Raises:
+            ValueError: if the four-vector is not timelike (E > |p|)
+        """
+        if not isinstance(momentum, FourVector):
+            raise TypeError("The rest frame is defined only for a FourVector")
+        t, x, y, z = momentum.coords
+        if t <= math.hypot(x, y, z):
+            raise ValueError("The rest frame is defined only for timelike vectors")
+        return cls(x / t, y / t, z / t)
+
+    @staticmethod
+    def cache_info() -> object:
+        """return the statistics of the cache of the boost matrices"""
+        return _boost_parameters.cache_info()
+
+    @staticmethod
+    def __check_raise_batch_dim_error(batch: object) -> None:
+        """raise an error if the vectors of the batch are not four-vectors"""
+        if batch.dim != 4:
+            raise TypeError(f"Cannot boost a batch of vec{batch.dim}D, only 4D")
+
+
+@lru_cache(maxsize=BOOST_CACHE_SIZE)
+def _boost_parameters(bx: float, by: float, bz: float) -> Tuple[object]:
+    """return gamma, gamma^2 / (1 + gamma) and the flat row-major boost matrix"""
+    speed = math.hypot(bx, by, bz)
+    gamma = 1 / math.sqrt((1 - speed) * (1 + speed))
+    factor = gamma * gamma / (1 + gamma)
+    beta = (bx, by, bz)
+    matrix = [gamma, -gamma * bx, -gamma * by, -gamma * bz]
+    for i in range(3):
+        matrix.append(-gamma * beta[i])
+        matrix.extend(
+            (1.0 if i == j else 0.0) + factor * beta[i] * beta[j] for j in range(3)
+        )
+    return gamma, factor, tuple(matrix)
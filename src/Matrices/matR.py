@@ -0,0 +1,244 @@
+# class for rotations in 3 dimensions
+import math
+from array import array
+from typing import Iterable, List, Tuple
+
+from ..Vectors import Vec3, Vector, VectorBatch
+from .matnn import SMatrix
+
+
+class Rotation:
+    """class for rotations in 3 dimensions (right-handed, counter clockwise)
+
+    A rotation is stored both as a unit quaternion (w, x, y, z) and as the
+    3x3 rotation matrix, computed once when the rotation is created: sines and
+    cosines are never computed again when the rotation is applied.
+    Rotations are composed with @ (r2 @ r1 applies r1 first, like matrices),
+    so a sequence of rotations is applied to the vectors as a single one.
+    """
+
+    __slots__ = ("_quaternion", "_matrix")
+
+    def __init__(self, w: float, x: float, y: float, z: float) -> None:
+        """Create an object from a quaternion, it's normalized to unit length"""
+        if any(not isinstance(value, int | float) for value in (w, x, y, z)):
+            raise TypeError("The quaternion values can only be integers or floats")
+        norm = math.hypot(w, x, y, z)
+        if norm == 0:
+            raise ValueError("The quaternion of a rotation cannot be zero")
+        self._quaternion: Tuple[float] = (w / norm, x / norm, y / norm, z / norm)
+        self._matrix: Tuple[float] = Rotation.__quaternion_to_matrix(self._quaternion)
+
+    @property
+    def quaternion(self) -> Tuple[float]:
+        """return the unit quaternion (w, x, y, z) of the rotation"""
+        return self._quaternion
+
+    @property
+    def matrix(self) -> object:
+        """return the 3x3 rotation matrix as a SMatrix"""
+        return SMatrix._from_buffer(array("d", self._matrix), (3, 3))
+
+    @property
+    def angle(self) -> float:
+        """return the angle of rotation, between 0 and pi"""
+        w = self._quaternion[0]
+        return 2 * math.atan2(math.hypot(*self._quaternion[1:]), abs(w))
+
+    @property
+    def axis(self) -> object:
+        """return the unit axis of rotation (Vec3), undefined for the identity"""
+        w, x, y, z = self._quaternion
+        norm = math.copysign(math.hypot(x, y, z), w)
+        if norm == 0:
+            raise ValueError("The axis of the identity rotation it's undefined")
+        return Vec3._from_coords((x / norm, y / norm, z / norm))
+
+    def __repr__(self) -> str:
+        """return a string in the form of Rotation(w, x, y, z)"""
+        return "Rotation(" + ", ".join(map(str, self._quaternion)) + ")"
+
+    def __eq__(self, other: object) -> bool:
+        """two rotations are equal if they have the same quaternion (q and -q too)"""
+        if not isinstance(other, Rotation):
+            return NotImplemented
+        return self._quaternion == other._quaternion or self._quaternion == tuple(
+            -value for value in other._quaternion
+        )
+
+    def __matmul__(self, other: object) -> object:
+        """definition of composition with a Rotation, and of rotation of a Vec3 or a VectorBatch
+
+        (r2 @ r1) @ v is r2 @ (r1 @ v), the batch is rotated not in place.
+        """
+        if isinstance(other, Rotation):
+            w1, x1, y1, z1 = self._quaternion
+            w2, x2, y2, z2 = other._quaternion
+            return Rotation(
+                w1 * w2 - x1 * x2 - y1 * y2 - z1 * z2,
+                w1 * x2 + x1 * w2 + y1 * z2 - z1 * y2,
+                w1 * y2 - x1 * z2 + y1 * w2 + z1 * x2,
+                w1 * z2 + x1 * y2 - y1 * x2 + z1 * w2,
+            )
+        if isinstance(other, Vec3):
+            return type(other)._from_coords(self.__rotate(*other.coords))
+        if isinstance(other, VectorBatch):
+            Rotation.__check_raise_batch_dim_error(other)
+            return VectorBatch._from_data(self.__rotate_flat(other.data), 3)
+        if isinstance(other, Vector):
+            raise TypeError(f"Cannot rotate a vec{len(other)}D, only Vec3")
+        return NotImplemented
+
+    def __pow__(self, other: int) -> object:
+        """definition of integer power, the same rotation applied other times"""
+        if not isinstance(other, int):
+            raise TypeError("The exponent must be an integer")
+        if other < 0:
+            return self.inverse() ** -other
+        result, base = Rotation.identity(), self
+        while other:
+            if other & 1:
+                result = base @ result
+            base = base @ base
+            other >>= 1
+        return result
+
+    def inverse(self) -> object:
+        """return the inverse rotation (not in place)"""
+        w, x, y, z = self._quaternion
+        return Rotation(w, -x, -y, -z)
+
+    def apply(self, vectors: Iterable[object]) -> List[object]:
+        """return the rotated copies of a collection of Vec3, in a single call"""
+        vectors = list(vectors)
+        if any(not isinstance(vector, Vec3) for vector in vectors):
+            raise TypeError("Only collections of Vec3 can be rotated")
+        a, b, c, d, e, f, g, h, i = self._matrix
+        return [
+            type(vector)._from_coords(
+                (a * x + b * y + c * z, d * x + e * y + f * z, g * x + h * y + i * z)
+            )
+            for vector in vectors
+            for x, y, z in (vector.coords,)
+        ]
+
+    def rotate(self, vectors: object) -> None:
+        """Rotate in place a Vec3, a VectorBatch or a collection of Vec3
+
+        Args:
+            vectors (object): a Vec3, a VectorBatch of dimension 3 (its buffer
+                is overwritten) or an iterable of Vec3
+        """
+        if isinstance(vectors, Vec3):
+            vectors._set_coords(self.__rotate(*vectors.coords))
+        elif isinstance(vectors, VectorBatch):
+            Rotation.__check_raise_batch_dim_error(vectors)
+            vectors.data[:] = self.__rotate_flat(vectors.data)
+        else:
+            vectors = list(vectors)
+            if any(not isinstance(vector, Vec3) for vector in vectors):
+                raise TypeError("Only collections of Vec3 can be rotated")
+            for vector in vectors:
+                vector._set_coords(self.__rotate(*vector.coords))
+
+    def __rotate(self, x: float, y: float, z: float) -> Tuple[float]:
+        """return the rotated coordinates of a single vector"""
+        a, b, c, d, e, f, g, h, i = self._matrix
+        return a * x + b * y + c * z, d * x + e * y + f * z, g * x + h * y + i * z
+
+    def __rotate_flat(self, data: Iterable[float]) -> array:
+        """return the rotated flat coordinates x0, y0, z0, x1, ... of many vectors"""
+        a, b, c, d, e, f, g, h, i = self._matrix
+        xs, ys, zs = data[0::3], data[1::3], data[2::3]
+        out = array("d", bytes(8 * len(data)))
+        out[0::3] = array("d", [a * x + b * y + c * z for x, y, z in zip(xs, ys, zs)])
+        out[1::3] = array("d", [d * x + e * y + f * z for x, y, z in zip(xs, ys, zs)])
+        out[2::3] = array("d", [g * x + h * y + i * z for x, y, z in zip(xs, ys, zs)])
+        return out
+
+    @classmethod
+    def identity(cls) -> object:
+        """return the rotation that leaves the vectors unchanged"""
+        return cls(1.0, 0.0, 0.0, 0.0)
+
+    @classmethod
+    def from_axis_angle(cls, axis: object, phi: float) -> object:
+        """Create the counter clockwise rotation of phi around an axis (Vec3)"""
+        if not isinstance(axis, Vec3):
+            raise TypeError("The axis of rotation should be a Vec3")
+        if not isinstance(phi, int | float):
+            raise TypeError("The angle of rotation should be a float or an integer")
+        if axis.is_zero():
+            raise ValueError("The axis of rotation cannot be a zero vector")
+        scale = math.sin(phi / 2) / axis.module
+        x, y, z = axis.coords
+        return cls(math.cos(phi / 2), scale * x, scale * y, scale * z)
+
+    @classmethod
+    def about_x(cls, phi: float) -> object:
+        """Create the counter clockwise rotation of phi around the x-axis"""
+        return cls.from_axis_angle(Vec3._from_coords((1.0, 0.0, 0.0)), phi)
+
+    @classmethod
+    def about_y(cls, phi: float) -> object:
+        """Create the counter clockwise rotation of phi around the y-axis"""
+        return cls.from_axis_angle(Vec3._from_coords((0.0, 1.0, 0.0)), phi)
+
+    @classmethod
+    def about_z(cls, phi: float) -> object:
+        """Create the counter clockwise rotation of phi around the z-axis"""
+        return cls.from_axis_angle(Vec3._from_coords((0.0, 0.0, 1.0)), phi)
+
+    @classmethod
+    def from_matrix(cls, matrix: object) -> object:
+        """Create a rotation from a 3x3 rotation matrix
+
+        Raises:
+            TypeError: if the matrix is not 3x3
+            ValueError: if the matrix is not a rotation (orthogonal, determinant 1)
+        """
+        if not isinstance(matrix, SMatrix) or matrix.size() != (3, 3):
+            raise TypeError("The rotation matrix should be a 3x3 SMatrix")
+        m = tuple(matrix._flat())
+        product = (matrix @ matrix.get_transposed())._flat()
+        if any(
+            abs(value - (1.0 if k % 4 == 0 else 0.0)) > 1e-9
+            for k, value in enumerate(product)
+        ) or not math.isclose(matrix.determinant, 1.0, abs_tol=1e-9):
+            raise ValueError("The matrix is not a rotation matrix")
+        # Shepperd's method: start from the largest of the four components
+        trace = m[0] + m[4] + m[8]
+        largest = max(range(4), key=lambda k: trace if k == 0 else m[4 * k - 4])
+        if largest == 0:
+            s = 2 * math.sqrt(1 + trace)
+            return cls(s / 4, (m[7] - m[5]) / s, (m[2] - m[6]) / s, (m[3] - m[1]) / s)
+        if largest == 1:
+            s = 2 * math.sqrt(1 + m[0] - m[4] - m[8])
+            return cls((m[7] - m[5]) / s, s / 4, (m[1] + m[3]) / s, (m[2] + m[6]) / s)
+        if largest == 2:
+            s = 2 * math.sqrt(1 + m[4] - m[0] - m[8])
+            return cls((m[2] - m[6]) / s, (m[1] + m[3]) / s, s / 4, (m[5] + m[7]) / s)
+        s = 2 * math.sqrt(1 + m[8] - m[0] - m[4])
+        return cls((m[3] - m[1]) / s, (m[2] + m[6]) / s, (m[5] + m[7]) / s, s / 4)
+
+    @staticmethod
+    def __quaternion_to_matrix(quaternion: Tuple[float]) -> Tuple[float]:
+        """return the flat row-major rotation matrix of a unit quaternion"""
+        w, x, y, z = quaternion
+        return (
+            1 - 2 * (y * y + z * z),
+            2 * (x * y - w * z),
+            2 * (x * z + w * y),
+            2 * (x * y + w * z),
+            1 - 2 * (x * x + z * z),
+            2 * (y * z - w * x),
+            2 * (x * z - w * y),
+            2 * (y * z + w * x),
+            1 - 2 * (x * x + y * y),
+        )
+
+    @staticmethod
+    def __check_raise_batch_dim_error(batch: object) -> None:
+        """raise an error if the vectors of the batch are not 3-dimensional"""
+        if batch.dim != 3:
+            raise TypeError(f"Cannot rotate a batch of vec{batch.dim}D, only Vec3")
@@ -0,0 +1,340 @@
+# class for sparse matrices
+import math
+import operator
+from array import array
+from bisect import bisect_left
+from functools import partial
+from itertools import accumulate, chain, repeat
+from typing import Iterable, Tuple
+
+from ..Vectors import Vector
+from .matnm import Matrix
+
+
+class SparseMatrix:
+    """class for sparse n*m matrices
+
+    Only the nonzero values are stored, in compressed sparse row (CSR) format:
+    the values of the i-th row are values[indptr[i] : indptr[i + 1]] and their
+    columns are indices[indptr[i] : indptr[i + 1]] (sorted).
+    Memory and the product with a Vector are O(nnz), the number of nonzero values.
+    """
+
+    __slots__ = ("_shape", "_indptr", "_indices", "_values")
+
+    def __init__(
+        self,
+        shape: Tuple[int],
+        rows: Iterable[int] = (),
+        columns: Iterable[int] = (),
+        values: Iterable[float] = (),
+    ) -> None:
+        """Create an object from the coordinate (COO) format
+
+        Args:
+            shape (Tuple[int]): number of rows and columns
+            rows (Iterable[int]): row of every value
+            columns (Iterable[int]): column of every value
+            values (Iterable[float]): the values, repeated positions are summed
+        """
+        SparseMatrix.__check_shape(shape)
+        n_rows, n_columns = shape
+        rows, columns, values = tuple(rows), tuple(columns), tuple(values)
+        if not len(rows) == len(columns) == len(values):
+            raise TypeError("rows, columns and values should have the same length")
+        if any(not isinstance(value, int | float) for value in values):
+            raise TypeError("Matrices values can only be integers or floats")
+        if any(not isinstance(i, int) or not 0 <= i < n_rows for i in rows) or any(
+            not isinstance(j, int) or not 0 <= j < n_columns for j in columns
+        ):
+            raise IndexError("Sparse matrix index out of range")
+
+        # sort by (row, column) and sum the values in the same position
+        keys = list(
+            map(operator.add, map(partial(operator.mul, n_columns), rows), columns)
+        )
+        order = sorted(range(len(keys)), key=keys.__getitem__)
+        indptr = array("q", bytes(8 * (n_rows + 1)))
+        indices, data = array("q"), array("d")
+        last_key = -1
+        for position in order:
+            if keys[position] == last_key:
+                data[-1] += values[position]
+                continue
+            last_key = keys[position]
+            indptr[rows[position] + 1] += 1
+            indices.append(columns[position])
+            data.append(values[position])
+        self._shape = (n_rows, n_columns)
+        self._indptr = array("q", accumulate(indptr))
+        self._indices = indices
+        self._values = data
+
+    @property
+    def nnz(self) -> int:
+        """return the number of stored values"""
+        return len(self._values)
+
+    def __str__(self) -> str:
+        """return a string in the form of SparseMatrix {n} x {m}, {nnz} nonzero"""
+        n_rows, n_columns = self._shape
+        return f"SparseMatrix {n_rows} x {n_columns}, {self.nnz} nonzero"
+
+    def __repr__(self) -> str:
+        """return a string in the form of SparseMatrix((n, m), rows, columns, values)"""
+        rows, columns, values = self.to_coo()
+        return (
+            f"SparseMatrix({self._shape}, {tuple(rows)}, "
+            + f"{tuple(columns)}, {tuple(values)})"
+        )
+
+    def __getitem__(self, key: Tuple[int]) -> float:
+        """return the value in position m[i, j], zero if it's not stored"""
+        if not isinstance(key, tuple) or len(key) != 2:
+            raise TypeError("Sparse matrix values should be read as m[row, column]")
+        i, j = (
+            SparseMatrix.__normalize_index(index, length)
+            for index, length in zip(key, self._shape)
+        )
+        start, stop = self._indptr[i], self._indptr[i + 1]
+        position = bisect_left(self._indices, j, start, stop)
+        if position < stop and self._indices[position] == j:
+            return self._values[position]
+        return 0.0
+
+    def __add__(self, other: object) -> object:
+        """definition of addition between sparse matrices"""
+        return self._merge(other, operator.add)
+
+    def __neg__(self) -> object:
+        """definition of negation"""
+        return self._with_values(array("d", map(operator.neg, self._values)))
+
+    def __sub__(self, other: object) -> object:
+        """definition of subtraction between sparse matrices"""
+        return self._merge(other, operator.sub)
+
+    def __mul__(self, other: float) -> object:
+        """definition of product for scalar"""
+        if not isinstance(other, int | float):
+            return NotImplemented
+        return self._with_values(
+            array("d", map(partial(operator.mul, other), self._values))
+        )
+
+    def __rmul__(self, other: float) -> object:
+        """definition of product for scalar"""
+        return self * other
+
+    def __truediv__(self, other: float) -> object:
+        """definition of division by scalar"""
+        if not isinstance(other, int | float):
+            raise TypeError("Tried dividing a matrix with a non numerical value")
+        if other == 0:
+            raise ZeroDivisionError("Tried dividing a matrix for zero")
+        return self._with_values(
+            array("d", map(operator.truediv, self._values, repeat(other)))
+        )
+
+    def __matmul__(self, other: object) -> object:
+        """definition of product with a Vector (O(nnz)) or a dense Matrix"""
+        n_rows, n_columns = self._shape
+        if isinstance(other, Vector):
+            if len(other) != n_columns:
+                raise TypeError(
+                    f"Cannot multiply a {n_rows}x{n_columns} matrix "
+                    + f"with a vec{len(other)}D"
+                )
+            values = tuple(self._multiply_coords(tuple(other.coords)))
+            cls = type(other) if n_rows == len(other) else Vector
+            return cls._from_coords(values)
+        if isinstance(other, Matrix):
+            other_rows, other_columns = other.size()
+            if other_rows != n_columns:
+                raise TypeError(
+                    f"Cannot multiply a {n_rows}x{n_columns} matrix "
+                    + f"with a {other_rows}x{other_columns} matrix"
+                )
+            # every column of the result is the product with a column of other
+            columns = other.get_transposed()
+            values = chain.from_iterable(
+                self._multiply_coords(tuple(columns[j].coords))
+                for j in range(other_columns)
+            )
+            return Matrix._from_buffer(
+                array("d", values), (n_rows, other_columns), (1, n_rows)
+            )
+        return NotImplemented
+
+    def __rmatmul__(self, other: object) -> object:
+        """definition of product of a dense Matrix with a sparse matrix"""
+        if not isinstance(other, Matrix):
+            return NotImplemented
+        # A @ S = (S^T @ A^T)^T
+        return (self.get_transposed() @ other.get_transposed()).get_transposed()
+
+    def size(self) -> Tuple[int]:
+        """return the number of rows and the number of columns"""
+        return self._shape
+
+    def copy(self) -> object:
+        """return a deepcopy of the matrix"""
+        return self._with_values(array("d", self._values), copy_indices=True)
+
+    def transpose(self) -> None:
+        """in place, O(nnz)"""
+        transposed = self.get_transposed()
+        self._shape = transposed._shape
+        self._indptr = transposed._indptr
+        self._indices = transposed._indices
+        self._values = transposed._values
+
+    def get_transposed(self) -> object:
+        """not in place, O(nnz): the CSR format of the transposed matrix is the
+        compressed sparse column (CSC) format of the matrix
+        """
+        n_rows, n_columns = self._shape
+        counts = array("q", bytes(8 * (n_columns + 1)))
+        for j in self._indices:
+            counts[j + 1] += 1
+        indptr = array("q", accumulate(counts))
+        next_position = array("q", indptr)
+        indices = array("q", bytes(8 * self.nnz))
+        values = array("d", bytes(8 * self.nnz))
+        for i in range(n_rows):
+            for position in range(self._indptr[i], self._indptr[i + 1]):
+                j = self._indices[position]
+                target = next_position[j]
+                indices[target] = i
+                values[target] = self._values[position]
+                next_position[j] = target + 1
+        return SparseMatrix._from_csr((n_columns, n_rows), indptr, indices, values)
+
+    def to_coo(self) -> Tuple[array]:
+        """return rows, columns and values of the nonzero values (COO format)"""
+        rows = array(
+            "q",
+            chain.from_iterable(
+                repeat(i, self._indptr[i + 1] - self._indptr[i])
+                for i in range(self._shape[0])
+            ),
+        )
+        return rows, array("q", self._indices), array("d", self._values)
+
+    def to_csr(self) -> Tuple[array]:
+        """return indptr, indices and values of the compressed sparse row format"""
+        return (
+            array("q", self._indptr),
+            array("q", self._indices),
+            array("d", self._values),
+        )
+
+    def to_csc(self) -> Tuple[array]:
+        """return indptr, indices and values of the compressed sparse column format"""
+        return self.get_transposed().to_csr()
+
+    def to_dense(self) -> object:
+        """return the dense Matrix with the same values"""
+        n_rows, n_columns = self._shape
+        data = array("d", bytes(8 * n_rows * n_columns))
+        for i in range(n_rows):
+            for position in range(self._indptr[i], self._indptr[i + 1]):
+                data[i * n_columns + self._indices[position]] = self._values[position]
+        return Matrix._from_buffer(data, self._shape)
+
+    def _multiply_coords(self, coords: Tuple[float]) -> Iterable[float]:
+        """return the product with the coordinates of a vector, O(nnz)"""
+        indptr, indices, values = self._indptr, self._indices, self._values
+        take = coords.__getitem__
+        return (
+            math.sumprod(
+                values[indptr[i] : indptr[i + 1]],
+                map(take, indices[indptr[i] : indptr[i + 1]]),
+            )
+            for i in range(self._shape[0])
+        )
+
+    def _merge(self, other: object, combine) -> object:
+        """combine elementwise two sparse matrices of the same size, O(nnz)"""
+        if not isinstance(other, SparseMatrix):
+            return NotImplemented
+        if self._shape != other._shape:
+            raise TypeError(
+                f"Matrices must have the same size\n\t"
+                + f"instead got: {self._shape[0]}x{self._shape[1]} and "
+                + f"{other._shape[0]}x{other._shape[1]}"
+            )
+        indptr, indices, values = array("q", [0]), array("q"), array("d")
+        for i in range(self._shape[0]):
+            merged = dict(
+                zip(
+                    self._indices[self._indptr[i] : self._indptr[i + 1]],
+                    self._values[self._indptr[i] : self._indptr[i + 1]],
+                )
+            )
+            for j, value in zip(
+                other._indices[other._indptr[i] : other._indptr[i + 1]],
+                other._values[other._indptr[i] : other._indptr[i + 1]],
+            ):
+                merged[j] = combine(merged.get(j, 0.0), value)
+            for j in sorted(merged):
+                if merged[j] != 0:
+                    indices.append(j)
+                    values.append(merged[j])
+            indptr.append(len(values))
+        return SparseMatrix._from_csr(self._shape, indptr, indices, values)
+
+    def _with_values(self, values: array, copy_indices: bool = False) -> object:
+        """return a matrix with the same nonzero positions and new values"""
+        indptr, indices = self._indptr, self._indices
+        if copy_indices:
+            indptr, indices = array("q", indptr), array("q", indices)
+        return SparseMatrix._from_csr(self._shape, indptr, indices, values)
+
+    @classmethod
+    def _from_csr(
+        cls, shape: Tuple[int], indptr: array, indices: array, values: array
+    ) -> object:
+        """Create an object from already validated CSR arrays (no checks, no copy)"""
+        matrix = cls.__new__(cls)
+        matrix._shape = tuple(shape)
+        matrix._indptr = indptr
+        matrix._indices = indices
+        matrix._values = values
+        return matrix
+
+    @classmethod
+    def from_dense(cls, matrix: object) -> object:
+        """Create a sparse matrix with the nonzero values of a dense Matrix"""
+        if not isinstance(matrix, Matrix):
+            raise TypeError("The argument should be a Matrix")
+        n_rows, n_columns = matrix.size()
+        indptr, indices, values = array("q", [0]), array("q"), array("d")
+        for i, row in enumerate(matrix.coords):
+            for j, value in enumerate(row):
+                if value != 0:
+                    indices.append(j)
+                    values.append(value)
+            indptr.append(len(values))
+        return cls._from_csr((n_rows, n_columns), indptr, indices, values)
+
+    @staticmethod
+    def __normalize_index(index: int, length: int) -> int:
+        """return a positive index, raise an error if it's out of range"""
+        if not isinstance(index, int):
+            raise TypeError("Sparse matrix indices must be integers")
+        if index < 0:
+            index += length
+        if not 0 <= index < length:
+            raise IndexError("Sparse matrix index out of range")
+        return index
+
+    @staticmethod
+    def __check_shape(shape: Tuple[int]) -> None:
+        """raise an error if the shape is not made of two positive integers"""
+        if (
+            not isinstance(shape, tuple)
+            or len(shape) != 2
+            or any(not isinstance(length, int) or length < 1 for length in shape)
+        ):
+            raise TypeError("The shape should be a tuple of two positive integers")
@@ -0,0 +1,177 @@
+# kernels for the dense matrix product
+import os
+from array import array
+from concurrent.futures import ProcessPoolExecutor
+from itertools import repeat
+from multiprocessing.shared_memory import SharedMemory
+from typing import Iterable, List, Tuple
+
+from ..Precision import kernels
+
+# number of rows of the left operand (and of columns of the right operand)
+# multiplied together, the tile of the right operand is reused for a whole
+# block of rows while it's still in cache
+BLOCK_SIZE = 64
+
+# products with less multiply-adds (n * k * m) than this always run in the
+# current process, below it the start of the pool costs more than it saves
+PARALLEL_THRESHOLD = 2**25
+
+# number of processes used by the @ operator, 1 means single process
+default_workers = 1
+
+# right operand rows already converted in the current worker process
+_worker_cache: dict = {}
+
+
+def multiply(
+    a_flat: Iterable[float],
+    bt_flat: Iterable[float],
+    shape: Tuple[int],
+    workers: int | None = None,
+    block_size: int = BLOCK_SIZE,
+    precision: str | None = None,
+) -> array:
+    """return the flat row-major product of two contiguous matrices
+
+    Args:
+        a_flat (Iterable[float]): the left operand n x k, row-major
+        bt_flat (Iterable[float]): the right operand k x m already transposed
+            (m x k row-major), so that its columns are contiguous
+        shape (Tuple[int]): n, k and m
+        workers (int, optional): number of processes, None uses default_workers.
+            Small products always run in the current process.
+        block_size (int, optional): number of rows and columns of each tile
+        precision (str, optional): precision policy of the inner products,
+            None uses the global policy.
+
+    Returns:
+        array: the n x m product as a flat array('d')
+    """
+    n, k, m = shape
+    # resolved here, the worker processes don't share the global policy
+    precision = kernels.resolve(precision)
+    workers = default_workers if workers is None else workers
+    if not isinstance(workers, int) or workers < 1:
+        raise ValueError("The number of workers should be a positive integer")
+    if not isinstance(block_size, int) or block_size < 1:
+        raise ValueError("The block size should be a positive integer")
+    workers = min(workers, os.cpu_count() or 1, -(-n // block_size))
+    if workers == 1 or n * k * m < PARALLEL_THRESHOLD:
+        return _multiply_rows(
+            a_flat, _rows(bt_flat, k, m), k, m, 0, n, block_size, precision
+        )
+    return _parallel_multiply(a_flat, bt_flat, shape, workers, block_size, precision)
+
+
+def _rows(flat: Iterable[float], length: int, n_rows: int) -> List[Tuple[float]]:
+    """split a flat buffer in rows, tuples are the fastest input of math.sumprod"""
+    return [tuple(flat[i * length : (i + 1) * length]) for i in range(n_rows)]
+
+
+def _multiply_rows(
+    a_flat: Iterable[float],
+    bt_rows: List[Tuple[float]],
+    k: int,
+    m: int,
+    start: int,
+    stop: int,
+    block_size: int,
+    precision: str,
+) -> array:
+    """return the rows from start to stop of the product, flat row-major"""
+    dot = kernels.dot_function(precision)
+    out = array("d", bytes(8 * (stop - start) * m))
+    for block_start in range(start, stop, block_size):
+        block_stop = min(block_start + block_size, stop)
+        a_rows = _rows(
+            a_flat[block_start * k : block_stop * k], k, block_stop - block_start
+        )
+        for j in range(0, m, block_size):
+            bt_block = bt_rows[j : j + block_size]
+            for i, a_row in enumerate(a_rows, block_start - start):
+                out[i * m + j : i * m + j + len(bt_block)] = array(
+                    "d", map(dot, repeat(a_row), bt_block)
+                )
+    return out
+
+
+def _parallel_multiply(
+    a_flat: Iterable[float],
+    bt_flat: Iterable[float],
+    shape: Tuple[int],
+    workers: int,
+    block_size: int,
+    precision: str,
+) -> array:
+    """split the rows of the product in blocks computed by a pool of processes
+
+    The operands and the result live in shared memory, so that only the names of
+    the segments and the row ranges are sent to the workers.
+    """
+    n, k, m = shape
+    segments = [
+        SharedMemory(create=True, size=8 * size) for size in (n * k, m * k, n * m)
+    ]
+    try:
+        for segment, values in zip(segments, (a_flat, bt_flat)):
+            with segment.buf.cast("d") as buffer:
+                buffer[:] = array("d", values)
+        names = tuple(segment.name for segment in segments)
+        # at least a block per task, and a few tasks per worker to balance the load
+        rows_per_task = max(block_size, -(-n // (4 * workers)))
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            tasks = [
+                pool.submit(
+                    _worker_multiply,
+                    names,
+                    shape,
+                    start,
+                    min(start + rows_per_task, n),
+                    block_size,
+                    precision,
+                )
+                for start in range(0, n, rows_per_task)
+            ]
+            for task in tasks:
+                task.result()
+        with segments[2].buf.cast("d") as buffer:
+            return array("d", buffer)
+    finally:
+        for segment in segments:
+            segment.close()
+            segment.unlink()
+
+
+def _worker_multiply(
+    names: Tuple[str],
+    shape: Tuple[int],
+    start: int,
+    stop: int,
+    block_size: int,
+    precision: str,
+) -> None:
+    """compute the rows from start to stop of the product in a worker process"""
+    n, k, m = shape
+    a_segment, bt_segment, out_segment = (SharedMemory(name) for name in names)
+    try:
+        if names[1] not in _worker_cache:
+            _worker_cache.clear()
+            with bt_segment.buf.cast("d") as bt_flat:
+                _worker_cache[names[1]] = _rows(bt_flat, k, m)
+        with a_segment.buf.cast("d") as a_flat:
+            rows = _multiply_rows(
+                a_flat,
+                _worker_cache[names[1]],
+                k,
+                m,
+                start,
+                stop,
+                block_size,
+                precision,
+            )
+        with out_segment.buf.cast("d") as out:
+            out[start * m : stop * m] = rows
+    finally:
+        for segment in (a_segment, bt_segment, out_segment):
+            segment.close()
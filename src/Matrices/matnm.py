@@ -1,16 +1,69 @@
 # class for n*m matrices
-import math
-from typing import Tuple
+import operator
+import sys
+from array import array
+from itertools import chain, repeat
+from typing import Iterable, List, Tuple
+
+from .. import Backends
+from ..Buffers import convert
+from ..Precision import kernels
+from ..Vectors import Vector
+from . import matmul
 
 
 class Matrix:
-    def __init__(self, *coords: Tuple[float]) -> None:
+    """class for n*m matrices
+
+    The values are stored in a single flat array('d') described by the shape
+    (rows, columns), the strides (distance in the buffer between two rows and
+    between two columns) and the offset of the first value. Transposed
+    matrices, rows, columns and submatrices are views sharing the same buffer.
+
+    Derived quantities (e.g. the LU factorization of square matrices) are
+    cached, the views of a buffer share a version counter increased by every
+    in place change, which invalidates the caches of all of them. They are
+    not cached for the matrices on the buffer of another object (e.g. an
+    array or a NumPy array passed to the constructor), which can be changed
+    without the matrix knowing it.
+    """
+
+    __slots__ = ("_data", "_shape", "_strides", "_offset", "_version", "_cache")
+
+    def __init__(self, *coords: Tuple[float], shape: Tuple[int] | None = None) -> None:
+        """Create an object from an unpacked tuple of rows, or from a buffer
+
+        Args:
+            coords (Tuple[float]): the rows, or a single buffer (array,
+                memoryview, bytes, NumPy array, ...) with the values row-major,
+                used without copying them (see Buffers.as_doubles). The
+                values of a Matrix, Vector or Tensor are copied, their views
+                (get_transposed, to_tensor, ...) share them.
+            shape (Tuple[int], optional): the number of rows and columns of
+                the values in the buffer, None uses the shape of a 2-D buffer.
+        """
+        if len(coords) == 1 and convert.is_buffer(coords[0]):
+            self._set_buffer(coords[0], shape)
+            return
+        if shape is not None:
+            raise TypeError("The shape of a matrix is given only with a buffer")
         Matrix.__check_len(coords)
-        self.coords: Tuple[float] = tuple(coords)
+        self._set_rows(coords)
 
     @property
-    def determinant(self):
-        pass
+    def coords(self) -> Tuple[Tuple[float]]:
+        """return the values of the matrix as a tuple of rows"""
+        return tuple(
+            tuple(self._data[self._row_slice(i)]) for i in range(self._shape[0])
+        )
+
+    @property
+    def determinant(self) -> float:
+        """return the determinant, only defined for square matrices"""
+        n_rows, n_columns = self._shape
+        if n_rows != n_columns:
+            raise TypeError("The determinant is defined only for square matrices")
+        return self._square_view().determinant
 
     def __str__(self):
         """Return a pretty visualization of the matrix"""
@@ -26,32 +79,129 @@ class Matrix:
         return string + ")"
 
     def __repr__(self):
-        n_rows, n_columns = self.size()
-        return "Not implemented"
+        """return a string in the form of Matrix((row 0), (row 1), ...)"""
+        return f"{type(self).__name__}(" + ", ".join(map(str, self.coords)) + ")"
 
-    def __add__():
-        pass
+    def __buffer__(self, flags: int) -> memoryview:
+        """return a read-only 2-D memoryview on the values (buffer protocol)
 
-    def __neg__():
-        pass
+        The memoryview shares the buffer of a contiguous matrix, the values of
+        the other views (e.g. transposed) are copied. The values are changed
+        only through the matrix, which keeps its cached factors up to date.
+        """
+        return convert.export(self._data, self._shape, self._strides, self._offset)
 
-    def __sub__():
-        pass
+    @property
+    def __array_interface__(self) -> dict:
+        """return the NumPy array interface, with the strides of the buffer, so
+        NumPy shares (read-only) the values also of the transposed views and
+        submatrices"""
+        return convert.array_interface(
+            self._data, self._shape, self._strides, self._offset
+        )
 
-    def __mul__():
-        pass
+    def __getitem__(self, key: int | slice | Tuple[int | slice]) -> object:
+        """return a value, a row, a column or a submatrix of the matrix
 
-    def __rmul__():
-        pass
+        Rows, columns and submatrices are views sharing the buffer of the matrix,
+        no value is copied. Rows and columns are read-only, so that the values
+        are changed only through the matrix (and its cached factors are updated).
 
-    def __matmul__():
-        pass
+        Args:
+            key: m[i] is the i-th row (Vector), m[i, j] a single value,
+                m[:, j] the j-th column (Vector), m[i0:i1, j0:j1] a submatrix
+        """
+        row_key, column_key = key if isinstance(key, tuple) else (key, slice(None))
+        n_rows, n_columns = self._shape
+        if isinstance(row_key, int) and isinstance(column_key, int):
+            i = Matrix.__normalize_index(row_key, n_rows)
+            j = Matrix.__normalize_index(column_key, n_columns)
+            return self._data[self._index(i, j)]
+        if isinstance(row_key, int):
+            i = Matrix.__normalize_index(row_key, n_rows)
+            row = memoryview(self._data)[self._row_slice(i)].toreadonly()
+            return Vector._from_coords(row[Matrix.__check_slice(column_key)])
+        if isinstance(column_key, int):
+            j = Matrix.__normalize_index(column_key, n_columns)
+            column = memoryview(self._data)[self._column_slice(j)].toreadonly()
+            return Vector._from_coords(column[Matrix.__check_slice(row_key)])
 
-    def __truediv__():
-        pass
+        row_start, row_len, row_step = Matrix.__normalize_slice(row_key, n_rows)
+        column_start, column_len, column_step = Matrix.__normalize_slice(
+            column_key, n_columns
+        )
+        row_stride, column_stride = self._strides
+        return Matrix._from_buffer(
+            self._data,
+            (row_len, column_len),
+            (row_stride * row_step, column_stride * column_step),
+            self._index(row_start, column_start),
+            self._version,
+        )
 
-    def __pow__():
-        pass
+    def __setitem__(self, key: Tuple[int], value: float) -> None:
+        """set in place a single value of the matrix (m[i, j] = value)"""
+        if not isinstance(key, tuple) or len(key) != 2:
+            raise TypeError("Matrix values should be set as m[row, column]")
+        if not isinstance(value, int | float):
+            raise TypeError("Matrices values can only be integers or floats")
+        i = Matrix.__normalize_index(key[0], self._shape[0])
+        j = Matrix.__normalize_index(key[1], self._shape[1])
+        self._data[self._index(i, j)] = value
+        self._touch()
+
+    def __add__(self, other: object) -> object:
+        """definition of addition"""
+        if not isinstance(other, Matrix):
+            return NotImplemented
+        Matrix.__check_raise_same_size_error(self, other)
+        values = Backends.get_backend().add(self._flat(), other._flat())
+        return type(self)._from_buffer(values, self._shape)
+
+    def __neg__(self) -> object:
+        """definition of negation"""
+        values = Backends.get_backend().neg(self._flat())
+        return type(self)._from_buffer(values, self._shape)
+
+    def __sub__(self, other: object) -> object:
+        """definition of subtraction"""
+        if not isinstance(other, Matrix):
+            return NotImplemented
+        Matrix.__check_raise_same_size_error(self, other)
+        values = Backends.get_backend().sub(self._flat(), other._flat())
+        return type(self)._from_buffer(values, self._shape)
+
+    def __mul__(self, other: float) -> object:
+        """definition of product for scalar"""
+        if not isinstance(other, int | float):
+            return NotImplemented
+        values = Backends.get_backend().scale(self._flat(), other)
+        return type(self)._from_buffer(values, self._shape)
+
+    def __rmul__(self, other: float) -> object:
+        """definition of product for scalar"""
+        return self * other
+
+    def __matmul__(self, other: object) -> object:
+        """definition of matrix product, with a Matrix or a Vector"""
+        if not isinstance(other, Matrix | Vector):
+            return NotImplemented
+        return self.matmul(other)
+
+    def __truediv__(self, other: float) -> object:
+        """definition of division by scalar"""
+        if not isinstance(other, int | float):
+            raise TypeError("Tried dividing a matrix with a non numerical value")
+        if other == 0:
+            raise ZeroDivisionError("Tried dividing a matrix for zero")
+        return self._elementwise(map(operator.truediv, self._flat(), repeat(other)))
+
+    def __pow__(self, other: int) -> object:
+        """definition of integer power, only defined for square matrices"""
+        n_rows, n_columns = self._shape
+        if n_rows != n_columns:
+            raise TypeError("The power is defined only for square matrices")
+        return self._square_view() ** other
 
     def to_int():
         pass
@@ -59,40 +209,476 @@ class Matrix:
     def to_float():
         pass
 
-    def is_zero():
-        pass
+    def matmul(
+        self,
+        other: object,
+        workers: int | None = None,
+        block_size: int = matmul.BLOCK_SIZE,
+        precision: str | None = None,
+        backend: str | None = None,
+    ) -> object:
+        """Matrix product, with the options to run it in parallel
+
+        The product is computed in tiles of block_size rows of self by
+        block_size columns of other, with other transposed beforehand so
+        that its columns are contiguous.
+
+        Args:
+            other (object): a Matrix with as many rows as the columns of self,
+                or a Vector with as many coordinates
+            workers (int, optional): number of processes sharing the operands
+                through shared memory, None uses matmul.default_workers.
+                Small products always run in the current process.
+            block_size (int, optional): size of the tiles.
+            precision (str, optional): precision policy of the inner products
+                (FAST, COMPENSATED or EXACT), None uses the policy of the Vector
+                or the global one.
+            backend (str, optional): the backend computing the product (see
+                Backends), None uses the global one.
+
+        Returns:
+            object: a Matrix, or a Vector if other is a Vector
+        """
+        if precision is not None:
+            kernels.check_policy(precision)
+        kernel = Backends.get_backend(backend)
+        n_rows, n_columns = self._shape
+        if isinstance(other, Vector):
+            if len(other) != n_columns:
+                raise TypeError(
+                    f"Cannot multiply a {n_rows}x{n_columns} matrix "
+                    + f"with a vec{len(other)}D"
+                )
+            # the backend reads the buffer with the strides, also the views
+            # that are not contiguous (e.g. transposed) are not copied
+            values = kernel.matvec(
+                self._data,
+                tuple(other.coords),
+                self._shape,
+                precision or other.precision,
+                self._strides,
+                self._offset,
+            )
+            cls = type(other) if n_rows == len(other) else Vector
+            return cls._from_coords(tuple(values))
+        if not isinstance(other, Matrix):
+            raise TypeError("Matrices can only be multiplied with a Matrix or a Vector")
+        if other._shape[0] != n_columns:
+            raise TypeError(
+                f"Cannot multiply a {n_rows}x{n_columns} matrix "
+                + f"with a {other._shape[0]}x{other._shape[1]} matrix"
+            )
+        shape = (n_rows, other._shape[1])
+        values = kernel.matmul(
+            self._flat(),
+            other.get_transposed()._flat(),
+            (n_rows, n_columns, other._shape[1]),
+            workers,
+            block_size,
+            precision,
+        )
+        cls = type(self) if shape == self._shape else Matrix
+        return cls._from_buffer(values, shape)
+
+    def is_zero(self) -> bool:
+        """return true if all the values of the matrix are zero"""
+        return not any(self._flat())
 
     def is_one():
         pass
 
-    def is_diagonal():
-        pass
+    def is_diagonal(self) -> bool:
+        """return true if the matrix is square and all the values outside the
+        diagonal are zero, see to_diagonal() to promote it to a DiagonalMatrix
+        """
+        n_rows, n_columns = self._shape
+        if n_rows != n_columns:
+            return False
+        flat = self._flat()
+        return sum(map(bool, flat)) == sum(map(bool, flat[:: n_rows + 1]))
 
-    def transpose():
-        """in place"""
-        pass
+    def to_diagonal(self) -> object:
+        """return a DiagonalMatrix with the diagonal of the matrix
 
-    # ? remove gauss method for child classes?
-    def gauss_method():
-        pass
+        Raises:
+            ValueError: if the matrix is not diagonal
+        """
+        if not self.is_diagonal():
+            raise ValueError("The matrix is not diagonal")
+        from .matD import DiagonalMatrix
 
-    def gauss_reversed():
-        pass
+        n = self._shape[0]
+        return DiagonalMatrix._from_diagonal(array("d", self._flat()[:: n + 1]))
+
+    def is_contiguous(self) -> bool:
+        """return true if the values are stored row-major without gaps"""
+        n_rows, n_columns = self._shape
+        row_stride, column_stride = self._strides
+        return (column_stride == 1 or n_columns == 1) and (
+            row_stride == n_columns or n_rows == 1
+        )
+
+    def row(self, i: int) -> object:
+        """return a read-only Vector view on the i-th row of the matrix"""
+        i = Matrix.__normalize_index(i, self._shape[0])
+        row = memoryview(self._data)[self._row_slice(i)]
+        return Vector._from_coords(row.toreadonly())
+
+    def column(self, j: int) -> object:
+        """return a read-only Vector view on the j-th column of the matrix"""
+        j = Matrix.__normalize_index(j, self._shape[1])
+        column = memoryview(self._data)[self._column_slice(j)]
+        return Vector._from_coords(column.toreadonly())
+
+    def copy(self) -> object:
+        """return a deepcopy of the matrix (always contiguous)"""
+        return self._elementwise(self._flat())
+
+    def to_tensor(self) -> object:
+        """return a rank-2 Tensor sharing the buffer of the matrix"""
+        from ..Tensors import Tensor
+
+        return Tensor.from_matrix(self)
+
+    def transpose(self) -> None:
+        """in place, only the shape and the strides are swapped"""
+        self._shape = self._shape[::-1]
+        self._strides = self._strides[::-1]
+        self._touch()
+
+    def get_transposed(self) -> object:
+        """not in place, return a view sharing the buffer of the matrix"""
+        return type(self)._from_buffer(
+            self._data,
+            self._shape[::-1],
+            self._strides[::-1],
+            self._offset,
+            self._version,
+        )
+
+    def gauss_method(self, tol: float | None = None) -> Tuple[int]:
+        """In place Gaussian elimination with partial pivoting (row echelon form)
+
+        The rows are combined directly in the buffer of the matrix, a slice
+        at a time. The pivots are scaled to 1 and the values below them are
+        set to exactly zero.
+
+        Args:
+            tol (float, optional): values with absolute value <= tol are
+                considered zero. Defaults to max(n, m) * eps * max(|values|).
+
+        Returns:
+            Tuple[int]: the columns of the pivots
+        """
+        return self.__eliminate(self.__tolerance(tol), reduced=False)
 
-    def gauss(self):
-        self.gauss_method()
-        self.gauss_reversed()
+    def gauss_reversed(self, tol: float | None = None) -> Tuple[int]:
+        """In place backward elimination of a matrix in row echelon form
 
-    def size(self):
-        return len(self.coords), len(self.coords[0])
+        The pivots become 1 and the values above them zero, so that a matrix
+        reduced by gauss_method becomes the reduced row echelon form.
+
+        Args:
+            tol (float, optional): values with absolute value <= tol are
+                considered zero, see gauss_method
+
+        Returns:
+            Tuple[int]: the columns of the pivots
+        """
+        tol = self.__tolerance(tol)
+        n_rows, n_columns = self._shape
+        pivots = []
+        for i in range(n_rows):
+            row = self._data[self._row_slice(i)]
+            column = next((j for j in range(n_columns) if abs(row[j]) > tol), None)
+            if column is None:
+                break
+            pivots.append(column)
+        for i in range(len(pivots) - 1, -1, -1):
+            self.__reduce_column(i, pivots[i], range(i))
+        self._touch()
+        return tuple(pivots)
+
+    def gauss(self, tol: float | None = None) -> Tuple[int]:
+        """In place reduction to reduced row echelon form, return the pivot columns"""
+        tol = self.__tolerance(tol)
+        self.gauss_method(tol)
+        return self.gauss_reversed(tol)
+
+    def rref(self, tol: float | None = None) -> object:
+        """return the reduced row echelon form (not in place), see gauss"""
+        reduced = self.__working_copy()
+        reduced.gauss(self.__tolerance(tol))
+        return self._elementwise(reduced._data)
+
+    def rank(self, tol: float | None = None) -> int:
+        """return the rank, the number of pivots of the row echelon form"""
+        return len(self.__working_copy().gauss_method(self.__tolerance(tol)))
+
+    def null_space(self, tol: float | None = None) -> List[object]:
+        """Return a basis of the null space, the vectors x such that self @ x = 0
+
+        Returns:
+            List[object]: a Vector for each column without pivot in the reduced
+                row echelon form, empty if the columns are independent
+        """
+        reduced = self.__working_copy()
+        pivots = reduced.gauss(self.__tolerance(tol))
+        basis = []
+        for free in sorted(set(range(self._shape[1])) - set(pivots)):
+            coords = [0.0] * self._shape[1]
+            coords[free] = 1.0
+            for i, pivot in enumerate(pivots):
+                coords[pivot] = -reduced._data[reduced._index(i, free)]
+            basis.append(Vector._from_coords(tuple(coords)))
+        return basis
+
+    def is_consistent(self, b: object, tol: float | None = None) -> bool:
+        """Return true if the linear system self @ x = b has at least one solution
+
+        The system is consistent if the augmented matrix (self | b) has the
+        same rank of self (Rouche-Capelli theorem).
+
+        Args:
+            b (object): a Vector with as many coordinates as the rows of self
+            tol (float, optional): see gauss_method
+        """
+        n_rows, n_columns = self._shape
+        if not isinstance(b, Vector):
+            raise TypeError("The right-hand side should be a Vector")
+        if len(b) != n_rows:
+            raise TypeError(
+                f"Cannot check a {n_rows}x{n_columns} system with a vec{len(b)}D"
+            )
+        augmented = array("d", bytes(8 * n_rows * (n_columns + 1)))
+        for i in range(n_rows):
+            start = i * (n_columns + 1)
+            augmented[start : start + n_columns] = array(
+                "d", self._data[self._row_slice(i)]
+            )
+        augmented[n_columns :: n_columns + 1] = array("d", b.coords)
+        augmented = Matrix._from_buffer(augmented, (n_rows, n_columns + 1))
+        return n_columns not in augmented.gauss_method(augmented.__tolerance(tol))
+
+    def size(self) -> Tuple[int]:
+        """return the number of rows and the number of columns"""
+        return self._shape
+
+    def _set_buffer(self, buffer: object, shape: Tuple[int] | None) -> None:
+        """use the values of a buffer row-major, with a shape (rows, columns)"""
+        values = convert.as_doubles(buffer)
+        # the matrices and the tensors (with a version counter) and the vectors
+        # of the library are copied, the cache would miss their in place changes
+        if isinstance(buffer, Vector) or hasattr(buffer, "_version"):
+            values = array("d", values)
+        if shape is None:
+            shape = convert.buffer_shape(buffer)
+            if len(shape) != 2:
+                raise TypeError(
+                    "The shape (rows, columns) of a matrix in a buffer with "
+                    + f"{len(shape)} dimensions should be given"
+                )
+        if (
+            len(shape) != 2
+            or any(not isinstance(length, int) or length < 1 for length in shape)
+            or shape[0] * shape[1] != len(values)
+        ):
+            raise TypeError(
+                f"Cannot arrange {len(values)} values in a matrix of shape {shape}"
+            )
+        self._data = values
+        self._shape = tuple(shape)
+        self._strides = (shape[1], 1)
+        self._offset = 0
+        self._version = [0]
+        self._cache = {}
+
+    def _set_rows(self, coords: Tuple[Tuple[float]]) -> None:
+        """store already validated rows in a new contiguous buffer"""
+        self._data = array("d", chain.from_iterable(coords))
+        self._shape = (len(coords), len(coords[0]))
+        self._strides = (len(coords[0]), 1)
+        self._offset = 0
+        self._version = [0]
+        self._cache = {}
+
+    def _is_cacheable(self) -> bool:
+        """return true if the values change only through the matrix and its views
+        (the arrays of the library and the immutable buffers), false for the
+        buffers of other objects (e.g. a NumPy array) that can change them"""
+        return isinstance(self._data, array) or convert.is_immutable(self._data)
+
+    def _square_view(self) -> object:
+        """Return a SMatrix view of a square matrix, sharing its buffer, version
+        and cache, so that the LU factors it computes are kept by self"""
+        from .matnn import SMatrix
+
+        view = SMatrix._from_buffer(
+            self._data, self._shape, self._strides, self._offset, self._version
+        )
+        view._cache = self._cache
+        return view
+
+    def _touch(self) -> None:
+        """to be called after every in place change of the values"""
+        self._version[0] += 1
+
+    def _cached(self, key: str, compute) -> object:
+        """return the cached value of key, computing it if the matrix changed
+
+        Nothing is cached if the buffer can be changed without increasing the
+        version, see _is_cacheable.
+        """
+        if not self._is_cacheable():
+            return compute()
+        version = self._version[0]
+        cached = self._cache.get(key)
+        if cached is None or cached[0] != version:
+            cached = (version, compute())
+            self._cache[key] = cached
+        return cached[1]
+
+    def _index(self, i: int, j: int) -> int:
+        """return the position in the buffer of the value in row i and column j"""
+        return self._offset + i * self._strides[0] + j * self._strides[1]
+
+    def __eliminate(self, tol: float, reduced: bool) -> Tuple[int]:
+        """row reduction with partial pivoting, see gauss_method"""
+        n_rows, n_columns = self._shape
+        data = self._data
+        pivots = []
+        for column in range(n_columns):
+            row = len(pivots)
+            if row == n_rows:
+                break
+            below = data[self._column_slice(column)][row:]
+            largest = max(map(abs, below))
+            if largest <= tol:
+                # the column is already zero below the pivots found so far
+                for i in range(row, n_rows):
+                    data[self._index(i, column)] = 0.0
+                continue
+            pivot = row + list(map(abs, below)).index(largest)
+            if pivot != row:
+                row_slice, pivot_slice = self._row_slice(row), self._row_slice(pivot)
+                row_values = array("d", data[row_slice])
+                data[row_slice] = array("d", data[pivot_slice])
+                data[pivot_slice] = row_values
+            targets = range(n_rows) if reduced else range(row + 1, n_rows)
+            self.__reduce_column(row, column, targets)
+            pivots.append(column)
+        self._touch()
+        return tuple(pivots)
+
+    def __reduce_column(self, row: int, column: int, targets: Iterable[int]) -> None:
+        """make 1 the pivot in (row, column) and zero the column in the target rows"""
+        data = self._data
+        pivot_tail = self.__tail_slice(row, column)
+        pivot = data[self._index(row, column)]
+        values = array("d", map(operator.truediv, data[pivot_tail], repeat(pivot)))
+        data[pivot_tail] = values
+        for i in targets:
+            if i == row:
+                continue
+            factor = data[self._index(i, column)]
+            if factor:
+                tail = self.__tail_slice(i, column)
+                data[tail] = array(
+                    "d",
+                    map(
+                        operator.sub,
+                        data[tail],
+                        map(operator.mul, repeat(factor), values),
+                    ),
+                )
+            data[self._index(i, column)] = 0.0
+
+    def __tail_slice(self, i: int, j: int) -> slice:
+        """return the slice of the buffer with the values of row i from column j"""
+        start = self._index(i, j)
+        column_stride = self._strides[1]
+        return slice(
+            start, start + (self._shape[1] - j - 1) * column_stride + 1, column_stride
+        )
+
+    def __working_copy(self) -> object:
+        """return a contiguous writable Matrix copy, reduced by rank, rref, ..."""
+        return Matrix._from_buffer(array("d", self._flat()), self._shape)
+
+    def __tolerance(self, tol: float | None) -> float:
+        """return the tolerance of the row reduction, see gauss_method"""
+        if tol is not None:
+            if not isinstance(tol, int | float) or tol < 0:
+                raise ValueError("The tolerance should be a positive number or zero")
+            return tol
+        largest = max(map(abs, self._flat()))
+        return max(self._shape) * sys.float_info.epsilon * largest
+
+    def _row_slice(self, i: int) -> slice:
+        """return the slice of the buffer containing the i-th row"""
+        start = self._index(i, 0)
+        column_stride = self._strides[1]
+        return slice(
+            start, start + (self._shape[1] - 1) * column_stride + 1, column_stride
+        )
+
+    def _column_slice(self, j: int) -> slice:
+        """return the slice of the buffer containing the j-th column"""
+        start = self._index(0, j)
+        row_stride = self._strides[0]
+        return slice(start, start + (self._shape[0] - 1) * row_stride + 1, row_stride)
+
+    def _flat(self) -> Iterable[float]:
+        """return the values row-major, without copying if the matrix is contiguous"""
+        n_rows, n_columns = self._shape
+        if self.is_contiguous():
+            if self._offset == 0 and len(self._data) == n_rows * n_columns:
+                return self._data
+            return memoryview(self._data)[
+                self._offset : self._offset + n_rows * n_columns
+            ]
+        if n_columns == 1:
+            return self._data[self._column_slice(0)]
+        return array(
+            "d",
+            chain.from_iterable(self._data[self._row_slice(i)] for i in range(n_rows)),
+        )
+
+    def _elementwise(self, values: Iterable[float]) -> object:
+        """return a new contiguous matrix with the size of self from the values"""
+        return type(self)._from_buffer(array("d", values), self._shape)
 
     @classmethod
-    def orlata(a, b):  # search the name in english
-        pass
+    def _from_buffer(
+        cls,
+        data: array,
+        shape: Tuple[int],
+        strides: Tuple[int] | None = None,
+        offset: int = 0,
+        version: list | None = None,
+    ) -> object:
+        """Create an object on an already validated buffer (no checks, no copy)
+
+        Args:
+            data (array): the flat buffer of floats, shared with the new matrix
+            shape (Tuple[int]): number of rows and columns
+            strides (Tuple[int], optional): distance in the buffer between two
+                rows and two columns. Defaults to row-major contiguous.
+            offset (int, optional): position of the first value. Defaults to 0.
+            version (list, optional): the version counter of the buffer, to be
+                passed when the new matrix is a view on an existing one.
+        """
+        matrix = cls.__new__(cls)
+        matrix._data = data
+        matrix._shape = tuple(shape)
+        matrix._strides = (shape[1], 1) if strides is None else tuple(strides)
+        matrix._offset = offset
+        matrix._version = [0] if version is None else version
+        matrix._cache = {}
+        return matrix
 
     @classmethod
-    def get_transposed():
-        """not in place"""
+    def orlata(a, b):  # search the name in english
         pass
 
     @staticmethod
@@ -100,8 +686,50 @@ class Matrix:
         return matrix.size()
 
     @staticmethod
-    def have_same_size():
-        pass
+    def have_same_size(a: object, b: object) -> bool:
+        """Return true if the arguments have the same number of rows and columns"""
+        if not isinstance(a, Matrix) or not isinstance(b, Matrix):
+            raise TypeError("Both arguments should be Matrix")
+        return a.size() == b.size()
+
+    @staticmethod
+    def __normalize_index(index: int, length: int) -> int:
+        """return a positive index, raise an error if it's out of range"""
+        if not isinstance(index, int):
+            raise TypeError("Matrix indices must be integers or slices")
+        if index < 0:
+            index += length
+        if not 0 <= index < length:
+            raise IndexError("Matrix index out of range")
+        return index
+
+    @staticmethod
+    def __check_slice(key: slice) -> slice:
+        """raise an error if the key is not a slice"""
+        if not isinstance(key, slice):
+            raise TypeError("Matrix indices must be integers or slices")
+        return key
+
+    @staticmethod
+    def __normalize_slice(key: slice, length: int) -> Tuple[int]:
+        """return start, number of elements and step of a slice"""
+        start, stop, step = Matrix.__check_slice(key).indices(length)
+        if step < 0:
+            raise ValueError("Matrix slices with negative steps are not supported")
+        n_elements = len(range(start, stop, step))
+        if n_elements == 0:
+            raise IndexError("Matrix slices should contain at least one element")
+        return start, n_elements, step
+
+    @staticmethod
+    def __check_raise_same_size_error(x: object, y: object) -> None:
+        """raise an error if the matrices don't have the same size"""
+        if not Matrix.have_same_size(x, y):
+            raise TypeError(
+                f"Matrices must have the same size\n\t"
+                + f"instead got: {x.size()[0]}x{x.size()[1]} and "
+                + f"{y.size()[0]}x{y.size()[1]}"
+            )
 
     @staticmethod
     def __check_len(coords):
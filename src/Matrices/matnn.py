@@ -1,31 +1,326 @@
 import math
-from typing import Tuple
+import operator
+from array import array
+from functools import partial
+from itertools import chain, repeat
+from typing import List, Tuple
 
+from ..Buffers import convert
+from ..Vectors import Vector, VectorBatch
 from .matnm import Matrix
 
+# largest 1-norm for which the Pade approximant of each degree is accurate
+# to double precision, and the coefficients of the approximants
+_PADE_THETA = {
+    3: 1.495585217958292e-2,
+    5: 2.539398330063230e-1,
+    7: 9.504178996162932e-1,
+    9: 2.097847961257068e0,
+    13: 5.371920351148152e0,
+}
+_PADE_COEFFICIENTS = {
+    3: (120.0, 60.0, 12.0, 1.0),
+    5: (30240.0, 15120.0, 3360.0, 420.0, 30.0, 1.0),
+    7: (17297280.0, 8648640.0, 1995840.0, 277200.0, 25200.0, 1512.0, 56.0, 1.0),
+    9: (
+        17643225600.0,
+        8821612800.0,
+        2075673600.0,
+        302702400.0,
+        30270240.0,
+        2162160.0,
+        110880.0,
+        3960.0,
+        90.0,
+        1.0,
+    ),
+    13: (
+        64764752532480000.0,
+        32382376266240000.0,
+        7771770303897600.0,
+        1187353796428800.0,
+        129060195264000.0,
+        10559470521600.0,
+        670442572800.0,
+        33522128640.0,
+        1323241920.0,
+        40840800.0,
+        960960.0,
+        16380.0,
+        182.0,
+        1.0,
+    ),
+}
+
 
 class SMatrix(Matrix):
-    def __init__(self, *coords: Tuple[float]) -> None:
+    __slots__ = ()
+
+    def __init__(self, *coords: Tuple[float], shape: Tuple[int] | None = None) -> None:
+        """Create an object from an unpacked tuple of rows, or from a buffer
+        (see Matrix)"""
+        if len(coords) == 1 and convert.is_buffer(coords[0]):
+            self._set_buffer(coords[0], shape)
+            if self._shape[0] != self._shape[1]:
+                raise TypeError(
+                    f"The matrix in the buffer is not square: {self._shape}"
+                )
+            return
+        if shape is not None:
+            raise TypeError("The shape of a matrix is given only with a buffer")
         SMatrix.__check_len(coords)
-        self.coords: Tuple[float] = tuple(coords)
+        self._set_rows(coords)
+
+    @property
+    def determinant(self) -> float:
+        """return the determinant, computed from the (cached) LU factorization"""
+        lu_rows, _, sign = self._lu_factors()
+        if lu_rows is None:
+            return 0.0
+        return sign * math.prod(row[i] for i, row in enumerate(lu_rows))
 
     @property
     def trace():
         pass
 
+    def __pow__(self, other: int) -> object:
+        """definition of integer power, by repeated squaring
+
+        A ** k costs O(log k) matrix products, negative powers are powers of
+        the inverse.
+
+        Raises:
+            ValueError: if the exponent is negative and the matrix is singular
+        """
+        if not isinstance(other, int):
+            raise TypeError("The exponent must be an integer")
+        if other < 0:
+            return self.invert() ** -other
+        result, base = None, self
+        while other:
+            if other & 1:
+                result = base if result is None else result @ base
+            other >>= 1
+            if other:
+                base = base @ base
+        if result is None:
+            return SMatrix.identity(self._shape[0])
+        return result.copy() if result is self else result
+
+    def expm(self) -> object:
+        """return the matrix exponential e^self
+
+        Scaling and squaring with Pade approximants (Higham, 2005): the
+        matrix is divided by 2^s until its 1-norm is small enough for a Pade
+        approximant of degree 3, 5, 7, 9 or 13 to be accurate to double
+        precision, then the approximant is squared s times.
+        For e^(A t) use (A * t).expm().
+        """
+        n = self._shape[0]
+        norm = SMatrix.__norm_1(self)
+        identity = SMatrix.identity(n)
+        for degree in (3, 5, 7, 9):
+            if norm <= _PADE_THETA[degree]:
+                return SMatrix.__pade(self, identity, degree)
+        squarings = max(0, math.ceil(math.log2(norm / _PADE_THETA[13])))
+        result = SMatrix.__pade(self * 2.0**-squarings, identity, 13)
+        for _ in range(squarings):
+            result = result @ result
+        return result
+
     def is_symmetric():
         pass
 
     def is_antisymmetric():
         pass
 
-    @classmethod
-    def invert():
-        pass
+    def lu(self) -> Tuple[object, object, Tuple[int]]:
+        """return the LU factorization with partial pivoting of the matrix
+
+        Returns:
+            Tuple[object, object, Tuple[int]]: L (lower triangular with ones on
+                the diagonal), U (upper triangular) and the permutation of the
+                rows, such that row i of L @ U is row permutation[i] of self
+
+        Raises:
+            ValueError: if the matrix is singular
+        """
+        lu_rows, permutation, _ = self._lu_factors()
+        SMatrix.__check_raise_singular_error(lu_rows)
+        n = len(lu_rows)
+        lower = [
+            row[:i] + (1.0,) + (0.0,) * (n - i - 1) for i, row in enumerate(lu_rows)
+        ]
+        upper = [(0.0,) * i + row[i:] for i, row in enumerate(lu_rows)]
+        return (
+            SMatrix._from_buffer(array("d", chain.from_iterable(lower)), (n, n)),
+            SMatrix._from_buffer(array("d", chain.from_iterable(upper)), (n, n)),
+            permutation,
+        )
+
+    def solve(self, b: object) -> object:
+        """solve the linear system self @ x = b
+
+        The LU factorization is computed once and cached, so every following
+        solve costs O(n^2) until the matrix is changed in place.
+
+        Args:
+            b (object): a Vector, a VectorBatch (every vector is a right-hand
+                side) or a Matrix (every column is a right-hand side)
+
+        Raises:
+            ValueError: if the matrix is singular
+
+        Returns:
+            object: x, of the same type of b
+        """
+        n = self._shape[0]
+        if isinstance(b, Vector):
+            if len(b) != n:
+                raise TypeError(f"Cannot solve a {n}x{n} system with a vec{len(b)}D")
+            return type(b)._from_coords(tuple(self._solve_coords(b.coords)))
+        if isinstance(b, VectorBatch):
+            if b.dim != n:
+                raise TypeError(f"Cannot solve a {n}x{n} system with vec{b.dim}D")
+            solutions = chain.from_iterable(
+                self._solve_coords(b.data[i * n : (i + 1) * n]) for i in range(len(b))
+            )
+            return VectorBatch._from_data(array("d", solutions), n)
+        if isinstance(b, Matrix):
+            if b._shape[0] != n:
+                raise TypeError(
+                    f"Cannot solve a {n}x{n} system with a "
+                    + f"{b._shape[0]}x{b._shape[1]} matrix"
+                )
+            columns = b.get_transposed()
+            solutions = chain.from_iterable(
+                self._solve_coords(columns._data[columns._row_slice(j)])
+                for j in range(b._shape[1])
+            )
+            # the solutions are the columns of x, stored one after the other
+            return type(b)._from_buffer(array("d", solutions), b._shape, (1, n))
+        raise TypeError("The right-hand side should be a Vector, VectorBatch or Matrix")
+
+    def invert(self) -> object:
+        """return the inverse matrix (not in place)
+
+        Raises:
+            ValueError: if the matrix is singular
+        """
+        n = self._shape[0]
+        return self.solve(SMatrix.identity(n))
+
+    def _lu_factors(self) -> Tuple[List[Tuple[float]] | None, Tuple[int], int]:
+        """return the cached LU factorization (Doolittle, partial pivoting)
+
+        Returns:
+            rows of L and U packed together (L below the diagonal, U on and above),
+            or None if the matrix is singular, the permutation of the rows and
+            its sign (+1 or -1)
+        """
+        return self._cached("lu", self._lu_decompose)
+
+    def _lu_decompose(self) -> Tuple[List[Tuple[float]] | None, Tuple[int], int]:
+        """compute the LU factorization, see _lu_factors"""
+        n = self._shape[0]
+        rows = [list(self._data[self._row_slice(i)]) for i in range(n)]
+        permutation = list(range(n))
+        sign = 1
+        for k in range(n):
+            pivot = max(range(k, n), key=lambda i: abs(rows[i][k]))
+            if rows[pivot][k] == 0:
+                return None, tuple(permutation), 0
+            if pivot != k:
+                rows[k], rows[pivot] = rows[pivot], rows[k]
+                permutation[k], permutation[pivot] = permutation[pivot], permutation[k]
+                sign = -sign
+            pivot_row = rows[k]
+            pivot_tail = pivot_row[k + 1 :]
+            for row in rows[k + 1 :]:
+                factor = row[k] / pivot_row[k]
+                row[k] = factor
+                if factor:
+                    row[k + 1 :] = map(
+                        operator.sub,
+                        row[k + 1 :],
+                        map(partial(operator.mul, factor), pivot_tail),
+                    )
+        return [tuple(row) for row in rows], tuple(permutation), sign
+
+    def _solve_coords(self, b: Tuple[float]) -> List[float]:
+        """solve self @ x = b with forward and back substitution, O(n^2)"""
+        lu_rows, permutation, _ = self._lu_factors()
+        SMatrix.__check_raise_singular_error(lu_rows)
+        n = len(lu_rows)
+        b = tuple(b)
+        y = []
+        for i, row in enumerate(lu_rows):
+            y.append(b[permutation[i]] - math.sumprod(row[:i], y))
+        x = [0.0] * n
+        for i in range(n - 1, -1, -1):
+            row = lu_rows[i]
+            x[i] = (y[i] - math.sumprod(row[i + 1 :], x[i + 1 :])) / row[i]
+        return x
 
     @classmethod
-    def identity():
-        pass
+    def identity(cls, n: int) -> object:
+        """return the n x n identity matrix"""
+        if not isinstance(n, int) or n < 1:
+            raise ValueError("The size of the identity should be a positive integer")
+        data = array("d", bytes(8 * n * n))
+        data[:: n + 1] = array("d", repeat(1.0, n))
+        return cls._from_buffer(data, (n, n))
+
+    @staticmethod
+    def __norm_1(matrix: object) -> float:
+        """return the 1-norm, the maximum sum of the absolute values of a column"""
+        return max(
+            math.fsum(map(abs, matrix._data[matrix._column_slice(j)]))
+            for j in range(matrix._shape[1])
+        )
+
+    @staticmethod
+    def __pade(a: object, identity: object, degree: int) -> object:
+        """return the Pade approximant of e^a of a degree, solving (V - U) R = V + U"""
+        b = _PADE_COEFFICIENTS[degree]
+        a2 = a @ a
+        if degree == 13:
+            a4 = a2 @ a2
+            a6 = a4 @ a2
+            u = a @ (
+                a6 @ (b[13] * a6 + b[11] * a4 + b[9] * a2)
+                + b[7] * a6
+                + b[5] * a4
+                + b[3] * a2
+                + b[1] * identity
+            )
+            v = (
+                a6 @ (b[12] * a6 + b[10] * a4 + b[8] * a2)
+                + b[6] * a6
+                + b[4] * a4
+                + b[2] * a2
+                + b[0] * identity
+            )
+        else:
+            # even powers of a: identity, a^2, a^4, ...
+            powers = [identity, a2]
+            while len(powers) <= degree // 2:
+                powers.append(powers[-1] @ a2)
+            u = a @ sum(
+                (b[2 * k + 1] * power for k, power in enumerate(powers[1:], 1)),
+                b[1] * identity,
+            )
+            v = sum(
+                (b[2 * k] * power for k, power in enumerate(powers[1:], 1)),
+                b[0] * identity,
+            )
+        return (v - u).solve(v + u).copy()
+
+    @staticmethod
+    def __check_raise_singular_error(lu_rows: List[Tuple[float]] | None) -> None:
+        """raise an error if the factorization found a singular matrix"""
+        if lu_rows is None:
+            raise ValueError("The matrix is singular")
 
     @staticmethod
     def __check_len(coords):
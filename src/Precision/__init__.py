@@ -0,0 +1,12 @@
+from .kernels import (
+    COMPENSATED,
+    EXACT,
+    FAST,
+    POLICIES,
+    dot,
+    get_precision,
+    norm,
+    precision,
+    set_precision,
+    total,
+)
@@ -0,0 +1,137 @@
+# reductions (dot products, norms, sums) with a selectable precision
+import math
+import operator
+from contextlib import contextmanager
+from fractions import Fraction
+from typing import Callable, Iterable, Iterator
+
+# the precision policies, from the fastest to the most accurate:
+# - FAST uses math.sumprod and math.hypot, computed in C in a single pass;
+# - COMPENSATED sums with math.fsum, the sum of the rounded products is exact;
+# - EXACT computes the products and the sums with fractions.Fraction and
+#   rounds only the final result, which is the correctly rounded value
+FAST = "fast"
+COMPENSATED = "compensated"
+EXACT = "exact"
+POLICIES = (FAST, COMPENSATED, EXACT)
+
+# the policy used by the objects without their own policy
+_default = [FAST]
+
+
+def get_precision() -> str:
+    """return the global precision policy"""
+    return _default[0]
+
+
+def set_precision(policy: str) -> None:
+    """set the global precision policy, one of FAST, COMPENSATED or EXACT"""
+    _default[0] = check_policy(policy)
+    DOT[None], NORM[None] = DOT[policy], NORM[policy]
+
+
+@contextmanager
+def precision(policy: str) -> Iterator[None]:
+    """Context manager setting the global precision policy inside its block"""
+    previous = _default[0]
+    set_precision(policy)
+    try:
+        yield
+    finally:
+        set_precision(previous)
+
+
+def check_policy(policy: str) -> str:
+    """return the policy, raise an error if it's not one of POLICIES"""
+    if policy not in POLICIES:
+        raise ValueError(
+            f"Unknown precision policy {policy!r}, use one of {', '.join(POLICIES)}"
+        )
+    return policy
+
+
+def resolve(policy: str | None) -> str:
+    """return policy, or the global policy if it's None"""
+    return _default[0] if policy is None else policy
+
+
+def dot(a: Iterable[float], b: Iterable[float], policy: str | None = None) -> float:
+    """return the inner product of two sequences of the same length"""
+    return DOT[policy](a, b)
+
+
+def norm(a: Iterable[float], policy: str | None = None) -> float:
+    """return the euclidean norm of a sequence"""
+    return NORM[policy](*a)
+
+
+def total(values: Iterable[float], policy: str | None = None) -> float:
+    """return the sum of the values"""
+    policy = resolve(policy)
+    if policy == FAST:
+        return sum(values)
+    if policy == COMPENSATED:
+        return math.fsum(values)
+    values = tuple(values)
+    if not all(map(math.isfinite, values)):
+        # inf or nan, as the sum of floats
+        return sum(values)
+    return float(sum(map(Fraction, values)))
+
+
+def dot_function(policy: str | None = None) -> Callable[..., float]:
+    """return the inner product function of a policy, for maps over many pairs"""
+    return DOT[policy]
+
+
+def _compensated_dot(a: Iterable[float], b: Iterable[float]) -> float:
+    return math.fsum(map(operator.mul, a, b))
+
+
+def _exact_dot(a: Iterable[float], b: Iterable[float]) -> float:
+    a, b = tuple(a), tuple(b)
+    if not all(map(math.isfinite, a + b)):
+        # inf or nan, as the products of floats
+        return math.sumprod(a, b)
+    return float(sum(map(operator.mul, map(Fraction, a), map(Fraction, b))))
+
+
+def _compensated_norm(*coords: float) -> float:
+    largest = max(map(abs, coords), default=0.0)
+    if largest == 0 or not math.isfinite(largest):
+        return math.hypot(*coords)
+    # scaled by a power of 2 (exactly) so that the squares cannot overflow
+    exponent = math.frexp(largest)[1]
+    scaled = [math.ldexp(coord, -exponent) for coord in coords]
+    return math.ldexp(math.sqrt(math.fsum(map(operator.mul, scaled, scaled))), exponent)
+
+
+def _exact_norm(*coords: float) -> float:
+    if not all(map(math.isfinite, coords)):
+        # inf if a coordinate is infinite, otherwise nan
+        return math.hypot(*coords)
+    squares = sum(map(_square, map(Fraction, coords)))
+    if squares == 0:
+        return 0.0
+    # the integer square root of squares * 2**shift has 57 significant bits,
+    # more than a float, and it's scaled back by 2**(shift / 2)
+    p, q = squares.numerator, squares.denominator
+    shift = 114 - p.bit_length() + q.bit_length()
+    shift += shift % 2
+    numerator, denominator = (p << shift, q) if shift >= 0 else (p, q << -shift)
+    scaled, remainder = divmod(numerator, denominator)
+    root = math.isqrt(scaled)
+    # sticky bit, so that float never rounds an inexact root as an exact tie
+    root |= bool(remainder) or root * root != scaled
+    return math.ldexp(float(root), -shift // 2)
+
+
+def _square(value: Fraction) -> Fraction:
+    return value * value
+
+
+# the kernels of every policy, the key None is the global policy: the
+# operators look them up directly, without a function call
+DOT = {FAST: math.sumprod, COMPENSATED: _compensated_dot, EXACT: _exact_dot}
+NORM = {FAST: math.hypot, COMPENSATED: _compensated_norm, EXACT: _exact_norm}
+DOT[None], NORM[None] = DOT[FAST], NORM[FAST]
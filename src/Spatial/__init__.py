@@ -0,0 +1,2 @@
+from .kdtree import KDTree
+from .pairwise import gram, pairwise_distances
@@ -0,0 +1,288 @@
+# k-d tree spatial index over a set of points
+import heapq
+import math
+import operator
+from itertools import repeat
+from typing import Iterable, List, Tuple
+
+from ..Vectors import Vector, VectorBatch
+
+# maximum number of points in a leaf, the points of a leaf are scanned in a
+# single call to math.dist instead of descending the tree further
+LEAF_SIZE = 16
+
+# fraction of the points that can be moved by update() before the whole tree
+# is rebuilt, until then only the bounding boxes of the nodes are refitted
+REBUILD_RATIO = 0.25
+
+
+class KDTree:
+    """class for a k-d tree over a set of points with the same dimension
+
+    Every node stores the bounding box of its points and the searches skip
+    the nodes whose box is too far from the query, so nearest neighbours,
+    radius and box queries visit O(log n) nodes on average instead of
+    computing the distance from every point.
+    Moved points (update) only refit the boxes of their nodes, the tree is
+    rebuilt when too many points have moved since the last build.
+    The queries return the indices of the points in the original collection.
+    """
+
+    __slots__ = (
+        "dim",
+        "_points",
+        "_order",
+        "_position",
+        "_leaf_of",
+        "_start",
+        "_stop",
+        "_left",
+        "_right",
+        "_parent",
+        "_low",
+        "_high",
+        "_moved",
+        "_leaf_size",
+    )
+
+    def __init__(self, points: Iterable[object], leaf_size: int = LEAF_SIZE) -> None:
+        """Create the index of a collection of Vector (same dimension) or a VectorBatch
+
+        Args:
+            points (Iterable[object]): the points, a VectorBatch or Vectors
+            leaf_size (int, optional): maximum number of points of a leaf.
+                Defaults to LEAF_SIZE.
+        """
+        if not isinstance(leaf_size, int) or leaf_size < 1:
+            raise ValueError("The size of the leaves should be a positive integer")
+        if isinstance(points, VectorBatch):
+            dim = points.dim
+            data = points.data
+            coords = [tuple(data[i : i + dim]) for i in range(0, len(data), dim)]
+        else:
+            points = list(points)
+            if len(points) == 0 or any(not isinstance(p, Vector) for p in points):
+                raise TypeError("The points should be a non empty collection of Vector")
+            dim = len(points[0])
+            if any(len(point) != dim for point in points):
+                raise TypeError("All the points must have the same dimension")
+            coords = [tuple(point.coords) for point in points]
+
+        self.dim: int = dim
+        self._leaf_size: int = leaf_size
+        self._points: List[Tuple[float]] = coords
+        self.rebuild()
+
+    def __len__(self) -> int:
+        """return the number of points of the index"""
+        return len(self._points)
+
+    def rebuild(self) -> None:
+        """build again the whole tree from the current position of the points"""
+        n = len(self._points)
+        self._order: List[int] = list(range(n))
+        self._leaf_of: List[int] = [0] * n
+        self._start, self._stop, self._left, self._right = [], [], [], []
+        self._parent, self._low, self._high = [], [], []
+        columns = [list(column) for column in zip(*self._points)]
+        # the nodes are split at the median of the widest side of their cell,
+        # the part of space they cover, (start, stop, parent, is left child
+        # and sides of the cell) of the nodes still to build
+        sides = [max(column) - min(column) for column in columns]
+        stack = [(0, n, -1, False, sides)]
+        while stack:
+            start, stop, parent, is_left, sides = stack.pop()
+            node = self.__add_node(start, stop, parent)
+            if parent >= 0:
+                if is_left:
+                    self._left[parent] = node
+                else:
+                    self._right[parent] = node
+            if stop - start <= self._leaf_size:
+                for position in range(start, stop):
+                    self._leaf_of[position] = node
+                continue
+            axis = max(range(self.dim), key=sides.__getitem__)
+            column = columns[axis]
+            self._order[start:stop] = sorted(
+                self._order[start:stop], key=column.__getitem__
+            )
+            middle = (start + stop) // 2
+            split = column[self._order[middle]]
+            left_sides, right_sides = list(sides), list(sides)
+            left_sides[axis] = split - column[self._order[start]]
+            right_sides[axis] = column[self._order[stop - 1]] - split
+            stack.append((middle, stop, node, False, right_sides))
+            stack.append((start, middle, node, True, left_sides))
+        self._position: List[int] = [0] * n
+        for position, i in enumerate(self._order):
+            self._position[i] = position
+        self._moved: int = 0
+        self.__refit(range(len(self._start) - 1, -1, -1))
+
+    def update(self, indices: Iterable[int], points: Iterable[object]) -> None:
+        """Move some points of the index to new positions
+
+        Only the boxes of the leaves containing the points and of their
+        ancestors are refitted, O(m log n) for m points. The tree is rebuilt
+        when more than REBUILD_RATIO of the points moved since the last build,
+        because the boxes of a refitted tree overlap more and more.
+
+        Args:
+            indices (Iterable[int]): indices of the points in the original collection
+            points (Iterable[object]): the new positions (Vector)
+        """
+        dirty = set()
+        for i, point in zip(indices, points, strict=True):
+            if not isinstance(point, Vector) or len(point) != self.dim:
+                raise TypeError(f"The new positions should be vec{self.dim}D")
+            self._points[i] = tuple(point.coords)
+            dirty.add(self._leaf_of[self._position[i]])
+            self._moved += 1
+        if self._moved > REBUILD_RATIO * len(self._points):
+            self.rebuild()
+            return
+        # the nodes are numbered before their children, so the children of a
+        # node are refitted before it when going by decreasing number
+        ancestors = set()
+        for node in dirty:
+            node = self._parent[node]
+            while node >= 0 and node not in ancestors:
+                ancestors.add(node)
+                node = self._parent[node]
+        self.__refit(sorted(dirty | ancestors, reverse=True))
+
+    def nearest(self, point: object, k: int = 1) -> List[Tuple[float, int]]:
+        """Return the k points nearest to point
+
+        Returns:
+            List[Tuple[float, int]]: distance and index of the k nearest points,
+                sorted by distance
+        """
+        query = self.__query_coords(point)
+        if not isinstance(k, int) or k < 1:
+            raise ValueError("The number of neighbours should be a positive integer")
+        k = min(k, len(self._points))
+        # max-heap of the best points found (negative distances) and
+        # min-heap of the nodes to visit by distance of their box
+        best: List[Tuple[float, int]] = []
+        nodes = [(0.0, 0)]
+        while nodes:
+            distance, node = heapq.heappop(nodes)
+            if len(best) == k and distance >= -best[0][0]:
+                break
+            left = self._left[node]
+            if left < 0:
+                ids = self._order[self._start[node] : self._stop[node]]
+                candidates = [self._points[i] for i in ids]
+                for d, i in zip(map(math.dist, repeat(query), candidates), ids):
+                    if len(best) < k:
+                        heapq.heappush(best, (-d, i))
+                    elif d < -best[0][0]:
+                        heapq.heapreplace(best, (-d, i))
+                continue
+            for child in (left, self._right[node]):
+                heapq.heappush(nodes, (self.__box_distance(query, child), child))
+        return sorted((-d, i) for d, i in best)
+
+    def nearest_many(self, points: Iterable[object], k: int = 1) -> List[list]:
+        """return nearest(point, k) for every point of a collection or VectorBatch"""
+        return [self.nearest(point, k) for point in points]
+
+    def within_radius(self, point: object, radius: float) -> List[int]:
+        """return the indices (sorted) of the points at distance <= radius from point"""
+        query = self.__query_coords(point)
+        if not isinstance(radius, int | float) or radius < 0:
+            raise ValueError("The radius should be a positive number or zero")
+        found = []
+        nodes = [0]
+        while nodes:
+            node = nodes.pop()
+            if self.__box_distance(query, node) > radius:
+                continue
+            left = self._left[node]
+            if left < 0:
+                ids = self._order[self._start[node] : self._stop[node]]
+                candidates = [self._points[i] for i in ids]
+                found.extend(
+                    i
+                    for d, i in zip(map(math.dist, repeat(query), candidates), ids)
+                    if d <= radius
+                )
+                continue
+            nodes.append(left)
+            nodes.append(self._right[node])
+        return sorted(found)
+
+    def within_radius_many(self, points: Iterable[object], radius: float) -> List[list]:
+        """return within_radius(point, radius) for every point of a collection"""
+        return [self.within_radius(point, radius) for point in points]
+
+    def within_box(self, low: object, high: object) -> List[int]:
+        """return the indices (sorted) of the points inside the box from low to high"""
+        low, high = self.__query_coords(low), self.__query_coords(high)
+        found = []
+        nodes = [0]
+        while nodes:
+            node = nodes.pop()
+            node_low, node_high = self._low[node], self._high[node]
+            if any(map(operator.lt, node_high, low)) or any(
+                map(operator.gt, node_low, high)
+            ):
+                continue
+            ids = self._order[self._start[node] : self._stop[node]]
+            if all(map(operator.le, low, node_low)) and all(
+                map(operator.le, node_high, high)
+            ):
+                found.extend(ids)
+            elif self._left[node] < 0:
+                found.extend(
+                    i
+                    for i in ids
+                    if all(map(operator.le, low, self._points[i]))
+                    and all(map(operator.le, self._points[i], high))
+                )
+            else:
+                nodes.append(self._left[node])
+                nodes.append(self._right[node])
+        return sorted(found)
+
+    def __add_node(self, start: int, stop: int, parent: int) -> int:
+        """append a node for the points from start to stop, return its number"""
+        self._start.append(start)
+        self._stop.append(stop)
+        self._left.append(-1)
+        self._right.append(-1)
+        self._parent.append(parent)
+        self._low.append(None)
+        self._high.append(None)
+        return len(self._start) - 1
+
+    def __refit(self, nodes: Iterable[int]) -> None:
+        """compute the boxes of the nodes, the children must come before the parents"""
+        for node in nodes:
+            left = self._left[node]
+            if left < 0:
+                ids = self._order[self._start[node] : self._stop[node]]
+                columns = tuple(zip(*map(self._points.__getitem__, ids)))
+                self._low[node] = tuple(map(min, columns))
+                self._high[node] = tuple(map(max, columns))
+            else:
+                right = self._right[node]
+                self._low[node] = tuple(map(min, self._low[left], self._low[right]))
+                self._high[node] = tuple(map(max, self._high[left], self._high[right]))
+
+    def __box_distance(self, query: Tuple[float], node: int) -> float:
+        """return the distance of query from the box of the node (0 if inside)"""
+        nearest = map(min, map(max, query, self._low[node]), self._high[node])
+        return math.dist(query, tuple(nearest))
+
+    def __query_coords(self, point: object) -> Tuple[float]:
+        """return the coordinates of a query point, checking its dimension"""
+        if not isinstance(point, Vector):
+            raise TypeError("The query point should be a Vector")
+        if len(point) != self.dim:
+            raise TypeError(
+                f"Cannot query an index of vec{self.dim}D with a vec{len(point)}D"
+            )
+        return tuple(map(float, point.coords))
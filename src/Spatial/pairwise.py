@@ -0,0 +1,223 @@
+# pairwise distances and inner products between two sets of vectors
+import math
+import operator
+import os
+from array import array
+from concurrent.futures import ProcessPoolExecutor
+from itertools import repeat
+from typing import Iterable, List, Tuple
+
+from ..Matrices import Matrix, matmul
+from ..Vectors import Vector, VectorBatch
+
+METRICS = ("euclidean", "sqeuclidean", "manhattan", "cosine")
+
+# number of rows of X (and of vectors of Y) combined together, the tile of Y
+# is reused for a whole block of rows of X while it's still in cache
+TILE_SIZE = 256
+
+# rows of Y and their norms in a worker process, set by _init_worker
+_worker_state: dict = {}
+
+
+def gram(
+    x: Iterable[object],
+    y: Iterable[object] | None = None,
+    workers: int = 1,
+    tile_size: int = TILE_SIZE,
+) -> Matrix:
+    """Return the n x m Matrix of the inner products x[i] * y[j]
+
+    Args:
+        x (Iterable[object]): n vectors of the same dimension, or a VectorBatch
+        y (Iterable[object], optional): m vectors with the dimension of x,
+            None uses x again. Defaults to None.
+        workers (int, optional): number of processes, small products always
+            run in the current process. Defaults to 1.
+        tile_size (int, optional): number of rows and columns of each tile
+
+    Returns:
+        Matrix: the inner products
+    """
+    return _pairwise(x, y, "dot", workers, tile_size)
+
+
+def pairwise_distances(
+    x: Iterable[object],
+    y: Iterable[object] | None = None,
+    metric: str = "euclidean",
+    workers: int = 1,
+    tile_size: int = TILE_SIZE,
+) -> Matrix:
+    """Return the n x m Matrix of the distances between x[i] and y[j]
+
+    Every distance between a vector of x and a tile of y is computed by a
+    single map over math.dist (or math.sumprod for the cosine), so no
+    difference vector is ever created and there is no python call per pair.
+    The result is computed in tiles of tile_size x tile_size distances.
+
+    Args:
+        x (Iterable[object]): n vectors of the same dimension, or a VectorBatch
+        y (Iterable[object], optional): m vectors with the dimension of x,
+            None uses x again. Defaults to None.
+        metric (str, optional): "euclidean", "sqeuclidean" (squared euclidean),
+            "manhattan" or "cosine" (1 - cosine of the angle). Defaults to "euclidean".
+        workers (int, optional): number of processes, small problems always
+            run in the current process. Defaults to 1.
+        tile_size (int, optional): number of rows and columns of each tile
+
+    Raises:
+        ValueError: for an unknown metric, or zero vectors with the cosine metric
+
+    Returns:
+        Matrix: the distances
+    """
+    if metric not in METRICS:
+        raise ValueError(f"Unknown metric {metric!r}, use one of {', '.join(METRICS)}")
+    return _pairwise(x, y, metric, workers, tile_size)
+
+
+def _pairwise(
+    x: Iterable[object],
+    y: Iterable[object] | None,
+    metric: str,
+    workers: int,
+    tile_size: int,
+) -> Matrix:
+    """compute the matrix of a metric (or "dot") between the vectors of x and y"""
+    if not isinstance(workers, int) or workers < 1:
+        raise ValueError("The number of workers should be a positive integer")
+    if not isinstance(tile_size, int) or tile_size < 1:
+        raise ValueError("The tile size should be a positive integer")
+    x_rows = _rows(x)
+    y_rows = x_rows if y is None else _rows(y)
+    dim = len(x_rows[0])
+    if len(y_rows[0]) != dim:
+        raise TypeError(
+            f"Cannot compare vec{dim}D with vec{len(y_rows[0])}D, "
+            + "the vectors must have the same dimension"
+        )
+    x_norms = _norms(x_rows, metric)
+    y_norms = x_norms if y is None else _norms(y_rows, metric)
+
+    n, m = len(x_rows), len(y_rows)
+    workers = min(workers, os.cpu_count() or 1, -(-n // tile_size))
+    if workers == 1 or n * m * dim < matmul.PARALLEL_THRESHOLD:
+        values = _tile(x_rows, x_norms, y_rows, y_norms, metric, tile_size)
+    else:
+        values = array("d")
+        with ProcessPoolExecutor(
+            max_workers=workers,
+            initializer=_init_worker,
+            initargs=(y_rows, y_norms, metric, tile_size),
+        ) as pool:
+            blocks = pool.map(
+                _worker_tile,
+                (x_rows[i : i + tile_size] for i in range(0, n, tile_size)),
+                (x_norms[i : i + tile_size] for i in range(0, n, tile_size)),
+            )
+            for block in blocks:
+                values.extend(block)
+    return Matrix._from_buffer(values, (n, m))
+
+
+def _tile(
+    x_rows: List[Tuple[float]],
+    x_norms: List[float],
+    y_rows: List[Tuple[float]],
+    y_norms: List[float],
+    metric: str,
+    tile_size: int,
+) -> array:
+    """return the flat row-major matrix of the metric between x_rows and y_rows"""
+    n, m = len(x_rows), len(y_rows)
+    out = array("d", bytes(8 * n * m))
+    for start in range(0, n, tile_size):
+        x_tile = zip(
+            x_rows[start : start + tile_size], x_norms[start : start + tile_size]
+        )
+        x_tile = list(enumerate(x_tile, start))
+        for j in range(0, m, tile_size):
+            y_tile = y_rows[j : j + tile_size]
+            y_norms_tile = y_norms[j : j + tile_size]
+            if metric == "manhattan":
+                # the manhattan distance is summed a coordinate at a time
+                y_tile = list(zip(*y_tile))
+            for i, (x_row, x_norm) in x_tile:
+                out[i * m + j : i * m + j + len(y_norms_tile)] = array(
+                    "d", _combine(x_row, x_norm, y_tile, y_norms_tile, metric)
+                )
+    return out
+
+
+def _combine(
+    x_row: Tuple[float],
+    x_norm: float,
+    y_tile: List[Tuple[float]],
+    y_norms: List[float],
+    metric: str,
+) -> Iterable[float]:
+    """return the metric between a vector and the vectors of a tile
+
+    For the manhattan distance y_tile holds the columns of the tile, not its rows.
+    """
+    if metric == "manhattan":
+        distances = repeat(0.0)
+        for x, y_column in zip(x_row, y_tile):
+            differences = map(abs, map(operator.sub, repeat(x), y_column))
+            distances = list(map(operator.add, distances, differences))
+        return distances
+    if metric == "euclidean":
+        return map(math.dist, repeat(x_row), y_tile)
+    if metric == "sqeuclidean":
+        return map(pow, map(math.dist, repeat(x_row), y_tile), repeat(2.0))
+    dots = map(math.sumprod, repeat(x_row), y_tile)
+    if metric == "dot":
+        return dots
+    cosines = map(operator.truediv, dots, map(operator.mul, repeat(x_norm), y_norms))
+    return map(operator.sub, repeat(1.0), cosines)
+
+
+def _rows(points: Iterable[object]) -> List[Tuple[float]]:
+    """return the coordinates of a VectorBatch or a collection of vectors"""
+    if isinstance(points, VectorBatch):
+        data, dim = points.data, points.dim
+        return [tuple(data[i : i + dim]) for i in range(0, len(data), dim)]
+    points = list(points)
+    if len(points) == 0 or any(not isinstance(point, Vector) for point in points):
+        raise TypeError("The vectors should be a non empty collection of Vector")
+    dim = len(points[0])
+    if any(len(point) != dim for point in points):
+        raise TypeError("All the vectors must have the same dimension")
+    return [tuple(point.coords) for point in points]
+
+
+def _norms(rows: List[Tuple[float]], metric: str) -> List[float]:
+    """return the norms of the rows needed by the metric"""
+    if metric == "cosine":
+        norms = [math.hypot(*row) for row in rows]
+        if not all(norms):
+            raise ValueError("The cosine distance of a zero vector it's undefined")
+        return norms
+    return [0.0] * len(rows)
+
+
+def _init_worker(
+    y_rows: List[Tuple[float]], y_norms: List[float], metric: str, tile_size: int
+) -> None:
+    """keep the vectors of y in the worker process, they are sent only once"""
+    _worker_state.update(
+        y_rows=y_rows, y_norms=y_norms, metric=metric, tile_size=tile_size
+    )
+
+
+def _worker_tile(x_rows: List[Tuple[float]], x_norms: List[float]) -> array:
+    """compute a block of rows of the result in a worker process"""
+    return _tile(
+        x_rows,
+        x_norms,
+        _worker_state["y_rows"],
+        _worker_state["y_norms"],
+        _worker_state["metric"],
+        _worker_state["tile_size"],
+    )
@@ -0,0 +1,2 @@
+from .binfile import load, read_header, read_rows, save
+from .stream import column_sums, iter_chunks, matmul_file, matvec, norm, transpose
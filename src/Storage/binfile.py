@@ -0,0 +1,152 @@
+# binary file format for matrices and vector batches
+import mmap as _mmap
+import os
+import struct
+import sys
+from array import array
+from typing import Iterable, Tuple
+
+from ..Matrices import Matrix, SMatrix
+from ..Vectors import Vector, VectorBatch
+
+# magic, version, dtype, kind, number of dimensions, rows, columns, padding:
+# the header is 32 bytes long, so the values are aligned to 8 bytes
+HEADER = struct.Struct("<4sBBBBQQ8x")
+MAGIC = b"VMTL"
+VERSION = 1
+
+# only little-endian float64 values are stored for now
+DTYPE_FLOAT64 = 1
+
+# kind of object stored in the file
+KIND_MATRIX = 0
+KIND_SMATRIX = 1
+KIND_VECTOR_BATCH = 2
+
+_LITTLE_ENDIAN = sys.byteorder == "little"
+
+
+def save(obj: object, path: str | os.PathLike) -> None:
+    """Save a Matrix (or SMatrix), a VectorBatch or a sequence of vectors
+
+    The file contains a 32 bytes header (dtype, kind of object and shape)
+    followed by the values as raw little-endian doubles, row-major.
+
+    Args:
+        obj (object): a Matrix, a VectorBatch or a sequence of Vector of the
+            same dimension (saved as a VectorBatch)
+        path (str | os.PathLike): the file to write
+    """
+    if isinstance(obj, Matrix):
+        kind = KIND_SMATRIX if isinstance(obj, SMatrix) else KIND_MATRIX
+        shape, values = obj.size(), obj._flat()
+    elif isinstance(obj, VectorBatch):
+        kind, shape, values = KIND_VECTOR_BATCH, obj.size(), obj.data
+    elif isinstance(obj, Iterable):
+        vectors = tuple(obj)
+        if len(vectors) == 0 or any(not isinstance(v, Vector) for v in vectors):
+            raise TypeError("Only non empty sequences of Vector can be saved")
+        return save(VectorBatch(*vectors), path)
+    else:
+        raise TypeError("Only Matrix, VectorBatch or sequences of Vector can be saved")
+
+    if not _LITTLE_ENDIAN:
+        values = array("d", values)
+        values.byteswap()
+    with open(path, "wb") as file:
+        _write_header(file, kind, shape)
+        file.write(memoryview(values).cast("B"))
+
+
+def read_header(path: str | os.PathLike) -> Tuple[int, Tuple[int]]:
+    """return the kind of object and the shape stored in a file"""
+    with open(path, "rb") as file:
+        return _read_header(file)
+
+
+def load(path: str | os.PathLike, mmap: bool = False) -> object:
+    """Load a Matrix, SMatrix or VectorBatch saved with save()
+
+    Args:
+        path (str | os.PathLike): the file to read
+        mmap (bool, optional): if true the file is memory-mapped instead of read,
+            it opens instantly and only the pages that are touched are read.
+            The values are read-only, the mapping stays open while the object
+            (or any view on it) exists. Defaults to False.
+
+    Returns:
+        object: a Matrix, SMatrix or VectorBatch
+    """
+    return read_rows(path, mmap=mmap)
+
+
+def read_rows(
+    path: str | os.PathLike,
+    start: int = 0,
+    stop: int | None = None,
+    mmap: bool = False,
+) -> object:
+    """Load only the rows from start to stop of a file saved with save()
+
+    Only the bytes of the requested rows are read (or mapped), not the whole file.
+
+    Args:
+        path (str | os.PathLike): the file to read
+        start (int, optional): first row. Defaults to 0.
+        stop (int, optional): row after the last one. Defaults to the last row.
+        mmap (bool, optional): memory-map the rows instead of reading them,
+            see load(). Defaults to False.
+
+    Returns:
+        object: a Matrix, SMatrix (only if all the rows are read) or VectorBatch
+    """
+    with open(path, "rb") as file:
+        kind, (n_rows, n_columns) = _read_header(file)
+        if os.fstat(file.fileno()).st_size < HEADER.size + 8 * n_rows * n_columns:
+            raise ValueError("The file is truncated")
+        stop = n_rows if stop is None else stop
+        if not isinstance(start, int) or not isinstance(stop, int):
+            raise TypeError("The rows range should be made of integers")
+        if not 0 <= start < stop <= n_rows:
+            raise IndexError(f"Rows range {start}:{stop} out of range 0:{n_rows}")
+        n_values = (stop - start) * n_columns
+        first_byte = HEADER.size + 8 * start * n_columns
+        if mmap and _LITTLE_ENDIAN:
+            mapping = _mmap.mmap(file.fileno(), 0, access=_mmap.ACCESS_READ)
+            values = memoryview(mapping)[first_byte : first_byte + 8 * n_values]
+            values = values.cast("d")
+        else:
+            file.seek(first_byte)
+            values = array("d")
+            values.fromfile(file, n_values)
+            if not _LITTLE_ENDIAN:
+                values.byteswap()
+
+    shape = (stop - start, n_columns)
+    if kind == KIND_VECTOR_BATCH:
+        return VectorBatch._from_data(values, n_columns)
+    if kind == KIND_SMATRIX and shape[0] == shape[1]:
+        return SMatrix._from_buffer(values, shape)
+    return Matrix._from_buffer(values, shape)
+
+
+def _write_header(file, kind: int, shape: Tuple[int]) -> None:
+    """write the header at the current position of the file"""
+    file.write(HEADER.pack(MAGIC, VERSION, DTYPE_FLOAT64, kind, 2, *shape))
+
+
+def _read_header(file) -> Tuple[int, Tuple[int]]:
+    """read and check the header, return the kind of object and the shape"""
+    header = file.read(HEADER.size)
+    if len(header) != HEADER.size:
+        raise ValueError("The file is too short to contain a header")
+    magic, version, dtype, kind, n_dims, n_rows, n_columns = HEADER.unpack(header)
+    if magic != MAGIC:
+        raise ValueError("The file is not a vector/matrix binary file")
+    if version != VERSION or dtype != DTYPE_FLOAT64 or n_dims != 2:
+        raise ValueError(
+            f"Unsupported file (version {version}, dtype {dtype}, {n_dims} dimensions)"
+        )
+    if kind not in (KIND_MATRIX, KIND_SMATRIX, KIND_VECTOR_BATCH):
+        raise ValueError(f"Unknown kind of object {kind}")
+    return kind, (n_rows, n_columns)
@@ -0,0 +1,300 @@
+# out-of-core operations over the row chunks of matrices saved with binfile.save
+import math
+import operator
+import os
+from array import array
+from typing import Iterator, Tuple
+
+from ..Matrices import Matrix, matmul
+from ..Vectors import Vector
+from .binfile import _LITTLE_ENDIAN, HEADER, KIND_MATRIX, _read_header, _write_header
+
+# memory used by each chunk of rows when chunk_rows is not given
+CHUNK_BYTES = 2**26
+
+
+def iter_chunks(
+    path: str | os.PathLike, chunk_rows: int | None = None
+) -> Iterator[Tuple[int, Matrix]]:
+    """Iterate over the rows of a file saved with save(), a chunk at a time
+
+    Only one chunk is in memory at any time, the file is opened once.
+
+    Args:
+        path (str | os.PathLike): the file to read
+        chunk_rows (int, optional): number of rows of each chunk,
+            None uses as many rows as fit in CHUNK_BYTES.
+
+    Yields:
+        Tuple[int, Matrix]: the index of the first row and the chunk of rows
+    """
+    with open(path, "rb") as file:
+        _, (n_rows, n_columns) = _read_header(file)
+        if os.fstat(file.fileno()).st_size < HEADER.size + 8 * n_rows * n_columns:
+            raise ValueError("The file is truncated")
+        chunk_rows = _chunk_rows(chunk_rows, n_columns)
+        for start in range(0, n_rows, chunk_rows):
+            stop = min(start + chunk_rows, n_rows)
+            values = array("d")
+            values.fromfile(file, (stop - start) * n_columns)
+            if not _LITTLE_ENDIAN:
+                values.byteswap()
+            yield start, Matrix._from_buffer(values, (stop - start, n_columns))
+
+
+def matvec(
+    path: str | os.PathLike,
+    vector: Vector,
+    out: str | os.PathLike | None = None,
+    chunk_rows: int | None = None,
+) -> Vector | None:
+    """Product of the matrix saved in a file with a Vector, a chunk of rows at a time
+
+    Args:
+        path (str | os.PathLike): the file of the n x m matrix
+        vector (Vector): a vector with m coordinates
+        out (str | os.PathLike, optional): if given the result is written,
+            a chunk at a time, in this file as a n x 1 Matrix instead of
+            being returned. Defaults to None.
+        chunk_rows (int, optional): number of rows of each chunk, see iter_chunks
+
+    Returns:
+        Vector | None: the product, None if it's written in out
+    """
+    if not isinstance(vector, Vector):
+        raise TypeError("The matrix can only be multiplied with a Vector")
+    n_rows, n_columns = _shape(path)
+    if len(vector) != n_columns:
+        raise TypeError(
+            f"Cannot multiply a {n_rows}x{n_columns} matrix with a vec{len(vector)}D"
+        )
+    coords = tuple(vector.coords)
+    with _Writer(out, (n_rows, 1)) as writer:
+        for _, chunk in iter_chunks(path, chunk_rows):
+            values = chunk._flat()
+            writer.write(
+                array(
+                    "d",
+                    (
+                        math.sumprod(values[i : i + n_columns], coords)
+                        for i in range(0, len(values), n_columns)
+                    ),
+                )
+            )
+    return None if out is not None else Vector._from_coords(tuple(writer.values))
+
+
+def matmul_file(
+    path: str | os.PathLike,
+    other: Matrix | str | os.PathLike,
+    out: str | os.PathLike,
+    chunk_rows: int | None = None,
+    workers: int | None = None,
+) -> None:
+    """Product of the matrix saved in a file with another matrix, written in out
+
+    The result is computed and written a chunk of rows at a time, so the
+    memory used doesn't grow with the number of rows.
+    If other is also a file it's read a chunk at a time for every chunk of
+    the left operand, so neither matrix needs to fit in memory.
+
+    Args:
+        path (str | os.PathLike): the file of the n x k left operand
+        other (Matrix | str | os.PathLike): the k x m right operand, in memory
+            or saved in a file
+        out (str | os.PathLike): the file where the n x m product is written
+        chunk_rows (int, optional): number of rows of each chunk, see iter_chunks
+        workers (int, optional): number of processes for the product of each
+            chunk, see Matrix.matmul
+    """
+    n_rows, n_columns = _shape(path)
+    if isinstance(other, Matrix):
+        other_shape = other.size()
+        other_t = other.get_transposed()._flat()
+    elif isinstance(other, str | os.PathLike):
+        other_shape = _shape(other)
+    else:
+        raise TypeError("The right operand should be a Matrix or a file")
+    if other_shape[0] != n_columns:
+        raise TypeError(
+            f"Cannot multiply a {n_rows}x{n_columns} matrix "
+            + f"with a {other_shape[0]}x{other_shape[1]} matrix"
+        )
+
+    m = other_shape[1]
+    with _Writer(out, (n_rows, m)) as writer:
+        for _, chunk in iter_chunks(path, chunk_rows):
+            c = chunk.size()[0]
+            if isinstance(other, Matrix):
+                writer.write(
+                    matmul.multiply(chunk._flat(), other_t, (c, n_columns, m), workers)
+                )
+                continue
+            values = array("d", bytes(8 * c * m))
+            for start, other_chunk in iter_chunks(other, chunk_rows):
+                k = other_chunk.size()[0]
+                partial = matmul.multiply(
+                    chunk[:, start : start + k]._flat(),
+                    other_chunk.get_transposed()._flat(),
+                    (c, k, m),
+                    workers,
+                )
+                values = array("d", map(operator.add, values, partial))
+            writer.write(values)
+
+
+def column_sums(path: str | os.PathLike, chunk_rows: int | None = None) -> Vector:
+    """return the sums of the columns of the matrix saved in a file"""
+    n_columns = _shape(path)[1]
+    sums = [0.0] * n_columns
+    for _, chunk in iter_chunks(path, chunk_rows):
+        sums = list(map(operator.add, sums, _column_reduce(chunk, math.fsum)))
+    return Vector._from_coords(tuple(sums))
+
+
+def norm(
+    path: str | os.PathLike, order: str | float = "fro", chunk_rows: int | None = None
+) -> float:
+    """Norm of the matrix saved in a file, reading a chunk of rows at a time
+
+    Args:
+        path (str | os.PathLike): the file of the matrix
+        order (str | float, optional): "fro" for the Frobenius norm, 1 for the
+            maximum absolute column sum, math.inf for the maximum absolute
+            row sum. Defaults to "fro".
+        chunk_rows (int, optional): number of rows of each chunk, see iter_chunks
+
+    Returns:
+        float: the norm
+    """
+    if order == "fro":
+        return math.sqrt(
+            math.fsum(
+                math.sumprod(values, values)
+                for values in (
+                    chunk._flat() for _, chunk in iter_chunks(path, chunk_rows)
+                )
+            )
+        )
+    if order == 1:
+        sums = [0.0] * _shape(path)[1]
+        for _, chunk in iter_chunks(path, chunk_rows):
+            abs_sums = _column_reduce(chunk, lambda column: math.fsum(map(abs, column)))
+            sums = list(map(operator.add, sums, abs_sums))
+        return max(sums)
+    if order == math.inf:
+        return max(
+            math.fsum(map(abs, row))
+            for _, chunk in iter_chunks(path, chunk_rows)
+            for row in _row_values(chunk)
+        )
+    raise ValueError(f"Unknown norm {order!r}, use 'fro', 1 or math.inf")
+
+
+def transpose(
+    path: str | os.PathLike, out: str | os.PathLike, chunk_rows: int | None = None
+) -> None:
+    """Write the transposed of the matrix saved in a file in out
+
+    Each chunk of rows of the matrix becomes a block of columns of the result,
+    written as one contiguous run of values in each row of out.
+
+    Args:
+        path (str | os.PathLike): the file of the n x m matrix
+        out (str | os.PathLike): the file where the m x n result is written
+        chunk_rows (int, optional): number of rows of each chunk, see iter_chunks
+    """
+    n_rows, n_columns = _shape(path)
+    with _Writer(out, (n_columns, n_rows)) as writer:
+        file = writer.file
+        file.truncate(HEADER.size + 8 * n_rows * n_columns)
+        for start, chunk in iter_chunks(path, chunk_rows):
+            values = chunk._flat()
+            for j in range(n_columns):
+                run = array("d", values[j::n_columns])
+                if not _LITTLE_ENDIAN:
+                    run.byteswap()
+                file.seek(HEADER.size + 8 * (j * n_rows + start))
+                file.write(run)
+
+
+class _Writer:
+    """write the chunks of a result in a file, or keep them in memory if path is None
+
+    The chunks are written in a temporary file next to path, which replaces
+    path only when all of them are written: if an exception stops the stream,
+    the temporary file is removed and path is left as it was.
+    """
+
+    def __init__(self, path: str | os.PathLike | None, shape: Tuple[int]) -> None:
+        self.path = path
+        self.shape = shape
+        self.values = array("d")
+        self.file = None
+        self.temporary = None
+
+    def __enter__(self) -> object:
+        if self.path is not None:
+            self.temporary = f"{os.fspath(self.path)}.{os.getpid()}.tmp"
+            self.file = open(self.temporary, "wb")
+            try:
+                _write_header(self.file, KIND_MATRIX, self.shape)
+            except BaseException:
+                self._discard()
+                raise
+        return self
+
+    def __exit__(self, exc_type, *exc_info) -> None:
+        if self.file is None:
+            return
+        if exc_type is not None:
+            self._discard()
+            return
+        self.file.close()
+        os.replace(self.temporary, self.path)
+
+    def _discard(self) -> None:
+        """close and remove the temporary file"""
+        self.file.close()
+        os.unlink(self.temporary)
+
+    def write(self, values: array) -> None:
+        """append the values of a chunk to the result"""
+        if self.file is None:
+            self.values.extend(values)
+            return
+        if not _LITTLE_ENDIAN:
+            values = array("d", values)
+            values.byteswap()
+        self.file.write(memoryview(values).cast("B"))
+
+
+def _shape(path: str | os.PathLike) -> Tuple[int]:
+    """return the shape stored in the header of a file"""
+    with open(path, "rb") as file:
+        return _read_header(file)[1]
+
+
+def _chunk_rows(chunk_rows: int | None, n_columns: int) -> int:
+    """return the number of rows of each chunk"""
+    if chunk_rows is None:
+        return max(1, CHUNK_BYTES // (8 * max(n_columns, 1)))
+    if not isinstance(chunk_rows, int) or chunk_rows < 1:
+        raise ValueError(
+            "The number of rows of each chunk should be a positive integer"
+        )
+    return chunk_rows
+
+
+def _row_values(chunk: Matrix) -> Iterator[memoryview]:
+    """iterate over the rows of a contiguous chunk"""
+    values = memoryview(chunk._flat())
+    n_columns = chunk.size()[1]
+    return (values[i : i + n_columns] for i in range(0, len(values), n_columns))
+
+
+def _column_reduce(chunk: Matrix, reduce) -> list:
+    """return reduce applied to each column of a contiguous chunk"""
+    values = chunk._flat()
+    n_columns = chunk.size()[1]
+    return [reduce(values[j::n_columns]) for j in range(n_columns)]
@@ -0,0 +1,2 @@
+from .einsum import einsum, einsum_path
+from .tensor import Tensor
@@ -0,0 +1,271 @@
+# einstein summation over tensors, contracted a pair of operands at a time
+import math
+from array import array
+from typing import Dict, List, Tuple
+
+from .. import Backends
+from ..Matrices import Matrix, matmul
+from ..Vectors import Vector
+from .tensor import Tensor
+
+# an operand during the contraction: its labels (one per axis) and its tensor
+Operand = Tuple[str, Tensor]
+
+
+def einsum(
+    spec: str,
+    *operands: object,
+    precision: str | None = None,
+    backend: str | None = None,
+) -> object | float:
+    """Return the einstein summation of the operands described by spec
+
+    For example "ij,jk->ik" is the matrix product, "ii->" the trace,
+    "bij,bjk->bik" a batch of matrix products and "i,ij,j->" the bilinear
+    form of a matrix. Without "->" the result has the labels appearing only
+    once, in alphabetical order.
+    The labels of a single operand not in the result are summed first, then
+    the operands are contracted a pair at a time, each time the pair with
+    the cheapest contraction (see einsum_path), and every contraction is a
+    batch of matrix products computed by the backend: the full index space
+    of all the labels is never looped over.
+
+    Args:
+        spec (str): the labels (letters) of the axes of every operand,
+            separated by commas, optionally followed by "->" and the labels
+            of the result
+        operands (object): Tensor, Matrix (rank 2) or Vector (rank 1)
+        precision (str, optional): the precision policy of the products and
+            of the sums (see Precision), None uses the global one.
+        backend (str, optional): the backend of the products (see Backends),
+            None uses the global one.
+
+    Returns:
+        object | float: a Tensor, or a float if the result has no labels
+
+    Raises:
+        ValueError: if spec is not valid
+        TypeError: if the lengths of the axes with the same label differ
+    """
+    terms, output = _parse(spec, len(operands))
+    tensors = [_as_tensor(operand) for operand in operands]
+    lengths = _lengths(terms, [tensor.shape for tensor in tensors])
+    remaining = [_diagonal(term, tensor) for term, tensor in zip(terms, tensors)]
+    remaining = [
+        _sum_labels(operand, _needed(output, remaining, k), precision)
+        for k, operand in enumerate(remaining)
+    ]
+    path, _ = _greedy_path([labels for labels, _ in remaining], lengths, output)
+    for i, j in path:
+        second = remaining.pop(j)
+        first = remaining.pop(i)
+        keep = set(output).union(*(labels for labels, _ in remaining))
+        remaining.append(_contract(first, second, keep, lengths, precision, backend))
+    labels, tensor = _sum_labels(remaining[0], set(output), precision)
+    if not output:
+        return tensor[()]
+    return tensor.permute(*(labels.index(label) for label in output))
+
+
+def einsum_path(spec: str, *operands: object) -> Tuple[List[Tuple[int]], int, int]:
+    """Return the order of the pairwise contractions chosen by einsum
+
+    Args:
+        spec (str): the labels of the operands, see einsum
+        operands (object): the operands (Tensor, Matrix, Vector), or their shapes
+
+    Returns:
+        Tuple[List[Tuple[int]], int, int]: the pairs of positions contracted
+            one after the other (the result of each pair is appended to the
+            operands left), the estimated multiplications of the pairwise
+            contractions and of a loop over the full index space
+    """
+    terms, output = _parse(spec, len(operands))
+    shapes = [
+        tuple(operand) if isinstance(operand, tuple) else _as_tensor(operand).shape
+        for operand in operands
+    ]
+    lengths = _lengths(terms, shapes)
+    labels = ["".join(dict.fromkeys(term)) for term in terms]
+    # the labels of a single operand not in the result are summed before
+    labels = [
+        "".join(
+            label
+            for label in term
+            if label in output or label in "".join(labels[:k] + labels[k + 1 :])
+        )
+        for k, term in enumerate(labels)
+    ]
+    path, cost = _greedy_path(labels, lengths, output)
+    naive = math.prod(lengths.values()) * max(len(terms) - 1, 1)
+    return path, cost, naive
+
+
+def _parse(spec: str, n_operands: int) -> Tuple[List[str], str]:
+    """return the labels of every operand and of the result"""
+    if not isinstance(spec, str):
+        raise TypeError("The einsum specification should be a string")
+    spec = spec.replace(" ", "")
+    inputs, arrow, output = spec.partition("->")
+    terms = inputs.split(",")
+    if len(terms) != n_operands:
+        raise ValueError(
+            f"The specification has {len(terms)} operands, {n_operands} were given"
+        )
+    if any(not label.isalpha() for label in "".join(terms) + output):
+        raise ValueError("The einsum labels should be letters")
+    if not arrow:
+        labels = "".join(terms)
+        output = "".join(sorted(label for label in labels if labels.count(label) == 1))
+    if len(set(output)) != len(output):
+        raise ValueError("The labels of the result should be different")
+    if not set(output) <= set("".join(terms)):
+        raise ValueError("Every label of the result should label an operand")
+    return terms, output
+
+
+def _as_tensor(operand: object) -> Tensor:
+    """return the operand as a tensor, sharing the buffer of matrices and vectors"""
+    if isinstance(operand, Tensor):
+        return operand
+    if isinstance(operand, Matrix):
+        return Tensor.from_matrix(operand)
+    if isinstance(operand, Vector):
+        return Tensor.from_vector(operand)
+    raise TypeError("The einsum operands should be Tensor, Matrix or Vector")
+
+
+def _lengths(terms: List[str], shapes: List[Tuple[int]]) -> Dict[str, int]:
+    """return the length of the axes of every label, checking the shapes"""
+    lengths: Dict[str, int] = {}
+    for term, shape in zip(terms, shapes):
+        if len(term) != len(shape):
+            raise ValueError(f"The labels {term!r} don't match the shape {shape}")
+        for label, length in zip(term, shape):
+            if lengths.setdefault(label, length) != length:
+                raise TypeError(
+                    f"The axes labelled {label!r} have different lengths: "
+                    + f"{lengths[label]} and {length}"
+                )
+    return lengths
+
+
+def _diagonal(term: str, tensor: Tensor) -> Operand:
+    """return the view on the diagonal of the axes with the same label (e.g. "ii")"""
+    labels = "".join(dict.fromkeys(term))
+    if len(labels) == len(term):
+        return labels, tensor
+    strides = [
+        sum(s for other, s in zip(term, tensor.strides) if other == label)
+        for label in labels
+    ]
+    shape = [tensor.shape[term.index(label)] for label in labels]
+    return labels, Tensor._from_buffer(
+        tensor._data, shape, strides, tensor._offset, tensor._version
+    )
+
+
+def _needed(output: str, operands: List[Operand], k: int) -> set:
+    """return the labels of the result and of all the operands except the k-th"""
+    return set(output).union(
+        *(labels for i, (labels, _) in enumerate(operands) if i != k)
+    )
+
+
+def _sum_labels(operand: Operand, keep: set, precision: str | None) -> Operand:
+    """return the operand with the axes whose label is not in keep summed"""
+    labels, tensor = operand
+    summed = tuple(axis for axis, label in enumerate(labels) if label not in keep)
+    if not summed:
+        return operand
+    if len(summed) == len(labels):
+        total = tensor.sum(precision=precision)
+        return "", Tensor._from_buffer(array("d", (total,)), ())
+    labels = "".join(label for label in labels if label in keep)
+    return labels, tensor.sum(summed, precision)
+
+
+def _greedy_path(
+    labels: List[str], lengths: Dict[str, int], output: str
+) -> Tuple[List[Tuple[int]], int]:
+    """Return the pairs of operands to contract one after the other, and the
+    multiplications they need
+
+    At every step the pair with the fewest multiplications (the product of
+    the lengths of all their labels) is contracted, ties are broken by the
+    size of the result.
+    """
+    labels = list(labels)
+    path = []
+    total = 0
+    while len(labels) > 1:
+        best = None
+        for i in range(len(labels)):
+            for j in range(i + 1, len(labels)):
+                union = set(labels[i]) | set(labels[j])
+                keep = set(output).union(
+                    *(labels[k] for k in range(len(labels)) if k not in (i, j))
+                )
+                cost = math.prod(lengths[label] for label in union)
+                size = math.prod(lengths[label] for label in union & keep)
+                if best is None or (cost, size) < best[0]:
+                    best = ((cost, size), i, j, union & keep)
+        (cost, _), i, j, kept = best
+        path.append((i, j))
+        total += cost
+        second, first = labels.pop(j), labels.pop(i)
+        labels.append("".join(label for label in first + second if label in kept))
+    return path, total
+
+
+def _contract(
+    first: Operand,
+    second: Operand,
+    keep: set,
+    lengths: Dict[str, int],
+    precision: str | None,
+    backend: str | None,
+) -> Operand:
+    """Return the contraction of two operands as a batch of matrix products
+
+    The labels of both operands kept for later are the batch, the labels of
+    both not kept are summed (the inner dimension of the products), and the
+    labels of a single operand are the rows of the first and the columns of
+    the second.
+    """
+    (a_labels, a), (b_labels, b) = first, second
+    shared = [label for label in a_labels if label in b_labels]
+    batch = [label for label in shared if label in keep]
+    summed = [label for label in shared if label not in keep]
+    rows = [label for label in a_labels if label not in b_labels]
+    columns = [label for label in b_labels if label not in a_labels]
+    n_batch, n_rows, n_columns, k = (
+        math.prod(lengths[label] for label in group)
+        for group in (batch, rows, columns, summed)
+    )
+    # the second operand is transposed (columns then summed labels), as the
+    # matrix products of the backends expect it
+    a_flat = _arranged(a, a_labels, batch + rows + summed)
+    bt_flat = _arranged(b, b_labels, batch + columns + summed)
+    kernel = Backends.get_backend(backend)
+    a_block, b_block = n_rows * k, n_columns * k
+    values = array("d")
+    for index in range(n_batch):
+        values.extend(
+            kernel.matmul(
+                a_flat[index * a_block : (index + 1) * a_block],
+                bt_flat[index * b_block : (index + 1) * b_block],
+                (n_rows, k, n_columns),
+                None,
+                matmul.BLOCK_SIZE,
+                precision,
+            )
+        )
+    labels = "".join(batch + rows + columns)
+    shape = [lengths[label] for label in labels]
+    return labels, Tensor._from_buffer(values, shape)
+
+
+def _arranged(tensor: Tensor, labels: str, order: List[str]) -> memoryview:
+    """return the values of the tensor with the axes in the order of the labels"""
+    return memoryview(tensor.permute(*(labels.index(label) for label in order))._flat())
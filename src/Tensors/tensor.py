@@ -0,0 +1,574 @@
+# class for n-dimensional tensors
+import math
+import operator
+from array import array
+from itertools import chain, repeat
+from typing import Iterable, Tuple
+
+from .. import Backends
+from ..Buffers import convert
+from ..Matrices import Matrix
+from ..Precision import kernels
+from ..Vectors import Vector
+
+
+class Tensor:
+    """class for n-dimensional tensors of floats
+
+    Like Matrix, the values are stored in a single flat array('d') described
+    by the shape, the strides (distance in the buffer between two consecutive
+    values along every axis) and the offset of the first value. Indexing,
+    reshape (of contiguous tensors), permute and broadcast_to return views
+    sharing the same buffer, the broadcast axes have stride 0.
+    The elementwise operators broadcast their operands with the rules of
+    NumPy: the shapes are aligned on the last axis and the axes of length 1
+    are repeated.
+    Rank-1 and rank-2 tensors share their buffer with the Vector and the
+    Matrix they are converted to or from (see from_vector and from_matrix).
+    """
+
+    __slots__ = ("_data", "_shape", "_strides", "_offset", "_version")
+
+    def __init__(self, *values: float | Tuple) -> None:
+        """Create an object from an unpacked tuple of values (rank 1) or of
+        nested tuples of the same shape (rank 2 and more), e.g.
+        Tensor(((1, 2), (3, 4)), ((5, 6), (7, 8))) has shape (2, 2, 2).
+        A single buffer (e.g. a NumPy array) is used with its shape, without
+        copying its values (see Buffers.as_doubles), the values of a Tensor,
+        Matrix or Vector are copied (from_matrix and from_vector share them)."""
+        if len(values) == 1 and convert.is_buffer(values[0]):
+            data = convert.as_doubles(values[0])
+            if isinstance(values[0], Tensor | Matrix | Vector):
+                data = array("d", data)
+            shape = convert.buffer_shape(values[0])
+            if math.prod(shape) != len(data):
+                # raw bytes read as doubles
+                shape = (len(data),)
+            self._data = data
+            self._shape = Tensor.__check_shape(shape, len(data))
+            self._strides = Tensor._contiguous_strides(self._shape)
+            self._offset = 0
+            self._version = [0]
+            return
+        if len(values) == 0:
+            raise TypeError(
+                "Tensor objects must have at least 1 argument, 0 where given"
+            )
+        shape = Tensor.__nested_shape(values)
+        data = array("d")
+        Tensor.__extend(data, values, shape)
+        self._data = data
+        self._shape = shape
+        self._strides = Tensor._contiguous_strides(shape)
+        self._offset = 0
+        self._version = [0]
+
+    @property
+    def shape(self) -> Tuple[int]:
+        """return the length of every axis"""
+        return self._shape
+
+    @property
+    def strides(self) -> Tuple[int]:
+        """return the distance in the buffer between two values along every axis"""
+        return self._strides
+
+    @property
+    def rank(self) -> int:
+        """return the number of axes"""
+        return len(self._shape)
+
+    @property
+    def size(self) -> int:
+        """return the number of values"""
+        return math.prod(self._shape)
+
+    @property
+    def coords(self) -> Tuple:
+        """return the values as nested tuples"""
+        values = tuple(self._flat())
+        for length in reversed(self._shape[1:]):
+            values = tuple(
+                values[i : i + length] for i in range(0, len(values), length)
+            )
+        return values
+
+    def __repr__(self) -> str:
+        """return a string in the form of Tensor(nested values)"""
+        return "Tensor(" + ", ".join(map(str, self.coords)) + ")"
+
+    def __len__(self) -> int:
+        """return the length of the first axis"""
+        return self._shape[0]
+
+    def __buffer__(self, flags: int) -> memoryview:
+        """return a read-only memoryview with the shape of the tensor (buffer
+        protocol), sharing the buffer of contiguous tensors (see Matrix.__buffer__)"""
+        return convert.export(self._data, self._shape, self._strides, self._offset)
+
+    @property
+    def __array_interface__(self) -> dict:
+        """return the NumPy array interface, with the strides of the buffer"""
+        return convert.array_interface(
+            self._data, self._shape, self._strides, self._offset
+        )
+
+    def __eq__(self, other: object) -> bool:
+        """two tensors are equal if they have the same shape and values"""
+        if not isinstance(other, Tensor):
+            return NotImplemented
+        return self._shape == other._shape and all(
+            map(operator.eq, self._flat(), other._flat())
+        )
+
+    def __getitem__(self, key: int | slice | Tuple[int | slice]) -> object:
+        """return a value or a view of a part of the tensor
+
+        Args:
+            key: an integer or a slice for each of the first axes, t[i, j, k]
+                is a single value if there is an integer for every axis,
+                otherwise a Tensor sharing the buffer of t (e.g. t[:, 0]).
+        """
+        key = key if isinstance(key, tuple) else (key,)
+        if len(key) > self.rank:
+            raise IndexError(
+                f"Too many indices for a tensor of rank {self.rank}: {len(key)}"
+            )
+        offset = self._offset
+        shape, strides = [], []
+        for index, length, stride in zip(key, self._shape, self._strides):
+            if isinstance(index, slice):
+                start, n_elements, step = Tensor.__normalize_slice(index, length)
+                offset += start * stride
+                shape.append(n_elements)
+                strides.append(stride * step)
+            else:
+                offset += Tensor.__normalize_index(index, length) * stride
+        shape.extend(self._shape[len(key) :])
+        strides.extend(self._strides[len(key) :])
+        if not shape:
+            return self._data[offset]
+        return type(self)._from_buffer(
+            self._data, shape, strides, offset, self._version
+        )
+
+    def __setitem__(self, key: Tuple[int], value: float) -> None:
+        """set in place a single value of the tensor (t[i, j, k] = value)"""
+        key = key if isinstance(key, tuple) else (key,)
+        if len(key) != self.rank:
+            raise TypeError("Tensor values should be set with an index for every axis")
+        if not isinstance(value, int | float):
+            raise TypeError("Tensor values can only be integers or floats")
+        offset = self._offset
+        for index, length, stride in zip(key, self._shape, self._strides):
+            offset += Tensor.__normalize_index(index, length) * stride
+        self._data[offset] = value
+        self._version[0] += 1
+
+    def __add__(self, other: object) -> object:
+        """definition of addition, with broadcasting"""
+        if isinstance(other, int | float):
+            return self._elementwise(map(operator.add, self._flat(), repeat(other)))
+        if not isinstance(other, Tensor):
+            return NotImplemented
+        shape, a, b = Tensor.__broadcast(self, other)
+        return type(self)._from_buffer(Backends.get_backend().add(a, b), shape)
+
+    def __radd__(self, other: float) -> object:
+        """definition of addition to a scalar"""
+        return self + other
+
+    def __neg__(self) -> object:
+        """definition of negation"""
+        return type(self)._from_buffer(
+            Backends.get_backend().neg(self._flat()), self._shape
+        )
+
+    def __sub__(self, other: object) -> object:
+        """definition of subtraction, with broadcasting"""
+        if isinstance(other, int | float):
+            return self._elementwise(map(operator.sub, self._flat(), repeat(other)))
+        if not isinstance(other, Tensor):
+            return NotImplemented
+        shape, a, b = Tensor.__broadcast(self, other)
+        return type(self)._from_buffer(Backends.get_backend().sub(a, b), shape)
+
+    def __rsub__(self, other: float) -> object:
+        """definition of subtraction from a scalar"""
+        if not isinstance(other, int | float):
+            return NotImplemented
+        return self._elementwise(map(operator.sub, repeat(other), self._flat()))
+
+    def __mul__(self, other: object) -> object:
+        """definition of product for scalar, and elementwise product with broadcasting"""
+        if isinstance(other, int | float):
+            return type(self)._from_buffer(
+                Backends.get_backend().scale(self._flat(), other), self._shape
+            )
+        if not isinstance(other, Tensor):
+            return NotImplemented
+        shape, a, b = Tensor.__broadcast(self, other)
+        return type(self)._from_buffer(array("d", map(operator.mul, a, b)), shape)
+
+    def __rmul__(self, other: float) -> object:
+        """definition of product for scalar"""
+        return self * other
+
+    def __truediv__(self, other: object) -> object:
+        """definition of division by scalar, and elementwise division with broadcasting"""
+        if isinstance(other, int | float):
+            if other == 0:
+                raise ZeroDivisionError("Tried dividing a tensor for zero")
+            return self._elementwise(map(operator.truediv, self._flat(), repeat(other)))
+        if not isinstance(other, Tensor):
+            return NotImplemented
+        shape, a, b = Tensor.__broadcast(self, other)
+        return type(self)._from_buffer(array("d", map(operator.truediv, a, b)), shape)
+
+    def is_contiguous(self) -> bool:
+        """return true if the values are stored row-major without gaps"""
+        expected = 1
+        for length, stride in zip(reversed(self._shape), reversed(self._strides)):
+            if length != 1 and stride != expected:
+                return False
+            expected *= length
+        return True
+
+    def copy(self) -> object:
+        """return a contiguous copy of the tensor"""
+        return self._elementwise(self._flat())
+
+    def reshape(self, *shape: int) -> object:
+        """Return the tensor with another shape and the same values row-major
+
+        The result is a view sharing the buffer if the tensor is contiguous,
+        a copy otherwise.
+
+        Args:
+            shape (int): the new length of every axis, a single -1 is the
+                length making the number of values the same
+
+        Raises:
+            TypeError: if the new shape has a different number of values
+        """
+        shape = Tensor.__check_shape(shape, self.size)
+        if self.is_contiguous():
+            return type(self)._from_buffer(
+                self._data, shape, None, self._offset, self._version
+            )
+        return type(self)._from_buffer(array("d", self._flat()), shape)
+
+    def flatten(self) -> object:
+        """return the values as a rank-1 tensor (a view if the tensor is contiguous)"""
+        return self.reshape(-1)
+
+    def permute(self, *axes: int) -> object:
+        """return a view with the axes in the given order, e.g. t.permute(2, 0, 1)"""
+        if sorted(axes) != list(range(self.rank)):
+            raise ValueError(
+                f"The axes should be a permutation of 0 ... {self.rank - 1}"
+            )
+        return type(self)._from_buffer(
+            self._data,
+            [self._shape[axis] for axis in axes],
+            [self._strides[axis] for axis in axes],
+            self._offset,
+            self._version,
+        )
+
+    def get_transposed(self) -> object:
+        """not in place, return a view with the axes in the reverse order"""
+        return self.permute(*reversed(range(self.rank)))
+
+    def broadcast_to(self, *shape: int) -> object:
+        """Return a view of the tensor repeated to a shape, without copying
+
+        The shapes are aligned on the last axis, the axes of length 1 (and
+        the missing leading axes) are repeated with stride 0.
+
+        Raises:
+            TypeError: if the tensor cannot be broadcast to the shape
+        """
+        extra = len(shape) - self.rank
+        if extra < 0:
+            raise TypeError(f"Cannot broadcast shape {self._shape} to {shape}")
+        strides = [0] * extra
+        for length, own, stride in zip(shape[extra:], self._shape, self._strides):
+            if own == length:
+                strides.append(stride)
+            elif own == 1:
+                strides.append(0)
+            else:
+                raise TypeError(f"Cannot broadcast shape {self._shape} to {shape}")
+        return type(self)._from_buffer(
+            self._data, shape, strides, self._offset, self._version
+        )
+
+    def sum(
+        self, axis: int | Tuple[int] | None = None, precision: str | None = None
+    ) -> object | float:
+        """Return the sum of the values along some axes
+
+        Args:
+            axis (int | Tuple[int], optional): the axes summed, None sums all
+                the values and returns a float.
+            precision (str, optional): the precision policy of the sums (see
+                Precision), None uses the global one.
+        """
+        if axis is None:
+            return kernels.total(self._flat(), precision)
+        axes = (axis,) if isinstance(axis, int) else tuple(axis)
+        axes = tuple(Tensor.__normalize_index(a, self.rank) for a in axes)
+        if len(set(axes)) != len(axes):
+            raise ValueError("The axes of a sum should be different")
+        kept = [a for a in range(self.rank) if a not in axes]
+        if not kept:
+            return kernels.total(self._flat(), precision)
+        values = self.permute(*kept, *axes)._flat()
+        length = math.prod(self._shape[a] for a in axes)
+        sums = array(
+            "d",
+            (
+                kernels.total(values[i : i + length], precision)
+                for i in range(0, len(values), length)
+            ),
+        )
+        return type(self)._from_buffer(sums, [self._shape[a] for a in kept])
+
+    def to_vector(self) -> object:
+        """return a read-only Vector view on the buffer of a rank-1 tensor (as
+        the rows of a Matrix, the values are changed through the tensor)"""
+        if self.rank != 1:
+            raise TypeError(f"Only rank-1 tensors are vectors, not rank {self.rank}")
+        (length,), (stride,) = self._shape, self._strides
+        if stride == 0:
+            return Vector._from_coords(tuple(self._flat()))
+        stop = self._offset + (length - 1) * stride + 1
+        coords = memoryview(self._data)[self._offset : stop : stride]
+        return Vector._from_coords(coords.toreadonly())
+
+    def to_matrix(self) -> object:
+        """return a Matrix sharing the buffer of a rank-2 tensor"""
+        if self.rank != 2:
+            raise TypeError(f"Only rank-2 tensors are matrices, not rank {self.rank}")
+        if 0 in self._strides:
+            return Matrix._from_buffer(array("d", self._flat()), self._shape)
+        return Matrix._from_buffer(
+            self._data, self._shape, self._strides, self._offset, self._version
+        )
+
+    @classmethod
+    def from_vector(cls, vector: object) -> object:
+        """Create a rank-1 tensor from a Vector
+
+        The tensor shares the coordinates of the vectors stored in a buffer
+        (e.g. the rows of a Matrix or of a VectorBatch, or vectors created
+        from a buffer), the immutable tuples of the other vectors are copied once.
+        The tensors on a read-only view (e.g. a row of a Matrix) are read-only.
+        """
+        if not isinstance(vector, Vector):
+            raise TypeError("Only a Vector can be converted to a rank-1 tensor")
+        coords = vector.coords
+        if isinstance(coords, tuple) or memoryview(coords).format != "d":
+            coords = array("d", coords)
+        return cls._from_buffer(coords, (len(coords),))
+
+    @classmethod
+    def from_matrix(cls, matrix: object) -> object:
+        """Create a rank-2 tensor sharing the buffer of a Matrix"""
+        if not isinstance(matrix, Matrix):
+            raise TypeError("Only a Matrix can be converted to a rank-2 tensor")
+        return cls._from_buffer(
+            matrix._data,
+            matrix._shape,
+            matrix._strides,
+            matrix._offset,
+            matrix._version,
+        )
+
+    @classmethod
+    def from_flat(cls, values: Iterable[float], *shape: int) -> object:
+        """Create a tensor of a shape from its values row-major, the values
+        in a buffer are not copied"""
+        data = (
+            convert.as_doubles(values)
+            if convert.is_buffer(values)
+            else array("d", values)
+        )
+        return cls._from_buffer(data, Tensor.__check_shape(shape, len(data)))
+
+    @classmethod
+    def zeros(cls, *shape: int) -> object:
+        """Create a tensor of a shape with all the values 0"""
+        shape = Tensor.__check_shape(shape, None)
+        return cls._from_buffer(array("d", bytes(8 * math.prod(shape))), shape)
+
+    def _flat(self) -> Iterable[float]:
+        """return the values row-major, without copying if the tensor is contiguous"""
+        size = self.size
+        if self.is_contiguous():
+            if self._offset == 0 and len(self._data) == size:
+                return self._data
+            return memoryview(self._data)[self._offset : self._offset + size]
+        *outer_shape, length = self._shape
+        *outer_strides, stride = self._strides
+        starts = [self._offset]
+        for outer_length, outer_stride in zip(outer_shape, outer_strides):
+            starts = [
+                start + i * outer_stride
+                for start in starts
+                for i in range(outer_length)
+            ]
+        data = self._data
+        if stride == 0:
+            rows = ([data[start]] * length for start in starts)
+        else:
+            rows = (
+                data[start : start + (length - 1) * stride + 1 : stride]
+                for start in starts
+            )
+        return array("d", chain.from_iterable(rows))
+
+    def _elementwise(self, values: Iterable[float]) -> object:
+        """return a new contiguous tensor with the shape of self from the values"""
+        return type(self)._from_buffer(array("d", values), self._shape)
+
+    @classmethod
+    def _from_buffer(
+        cls,
+        data: array,
+        shape: Tuple[int],
+        strides: Tuple[int] | None = None,
+        offset: int = 0,
+        version: list | None = None,
+    ) -> object:
+        """Create an object on an already validated buffer (no checks, no copy)
+
+        Args:
+            data (array): the flat buffer of floats (or a memoryview of
+                doubles), shared with the new tensor
+            shape (Tuple[int]): the length of every axis
+            strides (Tuple[int], optional): distance in the buffer between two
+                values along every axis. Defaults to row-major contiguous.
+            offset (int, optional): position of the first value. Defaults to 0.
+            version (list, optional): the version counter of the buffer, shared
+                with the matrices on the same buffer to invalidate their caches.
+        """
+        tensor = cls.__new__(cls)
+        tensor._data = data
+        tensor._shape = tuple(shape)
+        tensor._strides = (
+            Tensor._contiguous_strides(shape) if strides is None else tuple(strides)
+        )
+        tensor._offset = offset
+        tensor._version = [0] if version is None else version
+        return tensor
+
+    @staticmethod
+    def _contiguous_strides(shape: Tuple[int]) -> Tuple[int]:
+        """return the strides of a row-major contiguous tensor of a shape"""
+        strides = []
+        stride = 1
+        for length in reversed(shape):
+            strides.append(stride)
+            stride *= length
+        return tuple(reversed(strides))
+
+    @staticmethod
+    def broadcast_shape(*shapes: Tuple[int]) -> Tuple[int]:
+        """Return the shape of the result of an operation between tensors of
+        the given shapes
+
+        Raises:
+            TypeError: if the shapes cannot be broadcast together
+        """
+        rank = max(map(len, shapes))
+        padded = [(1,) * (rank - len(shape)) + tuple(shape) for shape in shapes]
+        result = []
+        for lengths in zip(*padded):
+            others = set(lengths) - {1}
+            if len(others) > 1:
+                raise TypeError(
+                    "Cannot broadcast together the shapes "
+                    + ", ".join(map(str, shapes))
+                )
+            result.append(others.pop() if others else 1)
+        return tuple(result)
+
+    @staticmethod
+    def __broadcast(x: object, y: object) -> Tuple[Tuple[int], Iterable, Iterable]:
+        """return the broadcast shape and the flat values of both tensors"""
+        if x._shape == y._shape:
+            return x._shape, x._flat(), y._flat()
+        shape = Tensor.broadcast_shape(x._shape, y._shape)
+        return shape, x.broadcast_to(*shape)._flat(), y.broadcast_to(*shape)._flat()
+
+    @staticmethod
+    def __nested_shape(values: Tuple) -> Tuple[int]:
+        """return the shape of nested tuples (or lists) of numbers"""
+        shape = []
+        while isinstance(values, tuple | list):
+            if len(values) == 0:
+                raise TypeError("Tensor axes should have at least one element")
+            shape.append(len(values))
+            values = values[0]
+        return tuple(shape)
+
+    @staticmethod
+    def __extend(data: array, values: Tuple, shape: Tuple[int]) -> None:
+        """append to data the nested values, checking that they have the shape"""
+        if len(shape) == 1:
+            if len(values) != shape[0] or any(
+                not isinstance(value, int | float) for value in values
+            ):
+                raise TypeError(
+                    "Tensor values must be int or float, in nested tuples of the "
+                    + "same length along every axis"
+                )
+            data.extend(values)
+            return
+        if not isinstance(values, tuple | list) or len(values) != shape[0]:
+            raise TypeError("Tensor nested tuples must have the same length")
+        for value in values:
+            if not isinstance(value, tuple | list):
+                raise TypeError("Tensor nested tuples must have the same length")
+            Tensor.__extend(data, value, shape[1:])
+
+    @staticmethod
+    def __check_shape(shape: Tuple[int], size: int | None) -> Tuple[int]:
+        """return the shape with -1 replaced, raise an error if it doesn't have size values"""
+        if len(shape) == 0 or any(not isinstance(length, int) for length in shape):
+            raise TypeError("A shape should be one or more integers")
+        if size is not None and shape.count(-1) == 1:
+            known = math.prod(length for length in shape if length != -1)
+            if known > 0 and size % known == 0:
+                shape = tuple(
+                    size // known if length == -1 else length for length in shape
+                )
+        if any(length < 1 for length in shape):
+            raise ValueError("The lengths of the axes should be positive integers")
+        if size is not None and math.prod(shape) != size:
+            raise TypeError(f"Cannot arrange {size} values in the shape {shape}")
+        return tuple(shape)
+
+    @staticmethod
+    def __normalize_index(index: int, length: int) -> int:
+        """return a positive index, raise an error if it's out of range"""
+        if not isinstance(index, int):
+            raise TypeError("Tensor indices must be integers or slices")
+        if index < 0:
+            index += length
+        if not 0 <= index < length:
+            raise IndexError("Tensor index out of range")
+        return index
+
+    @staticmethod
+    def __normalize_slice(key: slice, length: int) -> Tuple[int]:
+        """return start, number of elements and step of a slice"""
+        start, stop, step = key.indices(length)
+        if step < 0:
+            raise ValueError("Tensor slices with negative steps are not supported")
+        n_elements = len(range(start, stop, step))
+        if n_elements == 0:
+            raise IndexError("Tensor slices should contain at least one element")
+        return start, n_elements, step
@@ -1,2 +1,10 @@
 from .vec2 import Vec2
+from .vec3 import Vec3
+from .vec4 import Vec4
+from .vec4R import FourVector
+from .vecB import VectorBatch
+from .vecC import CVector
+from .vecF import FrozenVec2, FrozenVec3, FrozenVector
 from .vecn import Vector
+from .vecP import PVector
+from .vecW import VectorAccumulator, WVector
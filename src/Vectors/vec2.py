@@ -1,6 +1,8 @@
 import math
 from typing import Tuple
 
+from ..Buffers import convert
+from ..Precision import kernels
 from .vecn import Vector
 
 
@@ -10,8 +12,13 @@ class Vec2(Vector):
     subclass of Vector
     """
 
+    __slots__ = ()
+
     def __init__(self, *coords: float) -> None:
-        """Create an object from an unpacked tuple of 2 coordinates"""
+        """Create an object from an unpacked tuple of 2 coordinates, or from a buffer"""
+        if len(coords) == 1 and convert.is_buffer(coords[0]):
+            self.coords = Vector._buffer_coords(coords[0], 2)
+            return
         if len(coords) != 2:
             raise TypeError(
                 f"Vector objects must have 2 argument, {len(coords)} where given"
@@ -42,6 +49,41 @@ class Vec2(Vector):
             0 if self.x > 0 else math.copysign(math.pi, self.y)
         )
 
+    def __add__(self, other: object) -> object:
+        """definition of addition, unrolled for 2 dimensions"""
+        if not isinstance(other, Vec2):
+            return super().__add__(other)
+        x1, y1 = self.coords
+        x2, y2 = other.coords
+        return type(self)._from_coords((x1 + x2, y1 + y2))
+
+    def __neg__(self) -> object:
+        """definition of negation, unrolled for 2 dimensions"""
+        x, y = self.coords
+        return type(self)._from_coords((-x, -y))
+
+    def __sub__(self, other: object) -> object:
+        """definition of subtraction, unrolled for 2 dimensions"""
+        if not isinstance(other, Vec2):
+            return super().__sub__(other)
+        x1, y1 = self.coords
+        x2, y2 = other.coords
+        return type(self)._from_coords((x1 - x2, y1 - y2))
+
+    def __mul__(self, other: float | object) -> object | float:
+        """definition of inner product and product for scalar, unrolled for 2 dimensions"""
+        if isinstance(other, int | float):
+            x, y = self.coords
+            return type(self)._from_coords((other * x, other * y))
+        # the unrolled inner product is the FAST policy
+        if isinstance(other, Vec2) and (
+            kernels.DOT[self.precision or other.precision] is math.sumprod
+        ):
+            x1, y1 = self.coords
+            x2, y2 = other.coords
+            return x1 * x2 + y1 * y2
+        return super().__mul__(other)
+
     def __radd__(self, other):
         """definition of reverse addition"""
         return self + other
@@ -108,7 +150,7 @@ class Vec2(Vector):
         """Create a Vec2 from a complex number, x=Re and y=Im"""
         if not isinstance(num, complex):
             raise TypeError("Argument should be a complex number")
-        return Vec2(num.real, num.imag)
+        return cls._from_coords((num.real, num.imag))
 
     @classmethod
     def from_polar(cls, rho: float, phi: float) -> object:
@@ -117,7 +159,7 @@ class Vec2(Vector):
             raise TypeError("Both arguments should be floats or integers")
         if rho < 0:
             raise ValueError("The modulus of the vector should be positive")
-        return Vec2(rho * math.cos(phi), rho * math.sin(phi))
+        return cls._from_coords((rho * math.cos(phi), rho * math.sin(phi)))
 
     @staticmethod
     def cross_prod_module(a: object, b: object) -> float:
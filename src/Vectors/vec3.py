@@ -1,6 +1,8 @@
 import math
 from typing import Tuple
 
+from ..Buffers import convert
+from ..Precision import kernels
 from .vecn import Vector
 
 
@@ -10,8 +12,13 @@ class Vec3(Vector):
     subclass of Vector
     """
 
+    __slots__ = ()
+
     def __init__(self, *coords: float) -> None:
-        """Create an object from an unpacked tuple of 3 coordinates"""
+        """Create an object from an unpacked tuple of 3 coordinates, or from a buffer"""
+        if len(coords) == 1 and convert.is_buffer(coords[0]):
+            self.coords = Vector._buffer_coords(coords[0], 3)
+            return
         if len(coords) != 3:
             raise TypeError(
                 f"Vector objects must have 2 argument, {len(coords)} where given"
@@ -44,7 +51,7 @@ class Vec3(Vector):
         if self.z == 0:
             return math.pi / 2
         return (
-            math.atan(Vector(self.x, self.y).module / self.z)
+            math.atan(math.hypot(self.x, self.y) / self.z)
             + math.pi / 2
             + math.copysign(math.pi / 2, self.z)
         )
@@ -63,7 +70,7 @@ class Vec3(Vector):
     @property
     def radial_dist(self) -> float:
         """return the radial distance in cylindrical coordinates"""
-        return Vector(self.x, self.y).module
+        return math.hypot(self.x, self.y)
 
     def get_phases(self) -> Tuple[float]:
         """return polar and azimuthal angles"""
@@ -77,6 +84,41 @@ class Vec3(Vector):
         """return cylindrical coordinates"""
         return self.radial_dist, self.azimuth, self.z
 
+    def __add__(self, other: object) -> object:
+        """definition of addition, unrolled for 3 dimensions"""
+        if not isinstance(other, Vec3):
+            return super().__add__(other)
+        x1, y1, z1 = self.coords
+        x2, y2, z2 = other.coords
+        return type(self)._from_coords((x1 + x2, y1 + y2, z1 + z2))
+
+    def __neg__(self) -> object:
+        """definition of negation, unrolled for 3 dimensions"""
+        x, y, z = self.coords
+        return type(self)._from_coords((-x, -y, -z))
+
+    def __sub__(self, other: object) -> object:
+        """definition of subtraction, unrolled for 3 dimensions"""
+        if not isinstance(other, Vec3):
+            return super().__sub__(other)
+        x1, y1, z1 = self.coords
+        x2, y2, z2 = other.coords
+        return type(self)._from_coords((x1 - x2, y1 - y2, z1 - z2))
+
+    def __mul__(self, other: float | object) -> object | float:
+        """definition of inner product and product for scalar, unrolled for 3 dimensions"""
+        if isinstance(other, int | float):
+            x, y, z = self.coords
+            return type(self)._from_coords((other * x, other * y, other * z))
+        # the unrolled inner product is the FAST policy
+        if isinstance(other, Vec3) and (
+            kernels.DOT[self.precision or other.precision] is math.sumprod
+        ):
+            x1, y1, z1 = self.coords
+            x2, y2, z2 = other.coords
+            return x1 * x2 + y1 * y2 + z1 * z2
+        return super().__mul__(other)
+
     def __radd__(self, other):
         """definition of reverse addition"""
         return self + other
@@ -85,25 +127,33 @@ class Vec3(Vector):
         """definition of reverse addition"""
         return -self + other
 
-    # TODO
     def __matmul__(self, other: object) -> object:
         """definition of cross product"""
-        pass
+        if not isinstance(other, Vec3):
+            return NotImplemented
+        x1, y1, z1 = self.coords
+        x2, y2, z2 = other.coords
+        return type(self)._from_coords(
+            (y1 * z2 - z1 * y2, z1 * x2 - x1 * z2, x1 * y2 - y1 * x2)
+        )
 
-    # TODO
     def rotate_x(self, phi: float) -> None:
         """In place counter clockwise rotation around the x-axis"""
-        pass
+        cos, sin = Vec3.__cos_sin(phi)
+        x, y, z = self.coords
+        self._set_coords((x, cos * y - sin * z, sin * y + cos * z))
 
-    # TODO
     def rotate_y(self, phi: float) -> None:
         """In place counter clockwise rotation around the y-axis"""
-        pass
+        cos, sin = Vec3.__cos_sin(phi)
+        x, y, z = self.coords
+        self._set_coords((cos * x + sin * z, y, cos * z - sin * x))
 
-    # TODO
     def rotate_z(self, phi: float) -> None:
         """In place counter clockwise rotation around the z-axis"""
-        pass
+        cos, sin = Vec3.__cos_sin(phi)
+        x, y, z = self.coords
+        self._set_coords((cos * x - sin * y, sin * x + cos * y, z))
 
     @classmethod
     def from_spherical(cls, rho: float, polar: float, azimuth: float) -> object:
@@ -116,10 +166,12 @@ class Vec3(Vector):
             raise TypeError("All three arguments should be floats or integers")
         if rho < 0:
             raise ValueError("The modulus of the vector should be positive or zero")
-        return Vec3(
-            rho * math.sin(polar) * math.cos(azimuth),
-            rho * math.sin(polar) * math.sin(azimuth),
-            rho * math.cos(polar),
+        return cls._from_coords(
+            (
+                rho * math.sin(polar) * math.cos(azimuth),
+                rho * math.sin(polar) * math.sin(azimuth),
+                rho * math.cos(polar),
+            )
         )
 
     @classmethod
@@ -135,4 +187,13 @@ class Vec3(Vector):
             raise ValueError(
                 "The modulus of the radial distance should be positive or zero"
             )
-        return Vec3(radial_dist * math.cos(azimuth), radial_dist * math.sin(azimuth), z)
+        return cls._from_coords(
+            (radial_dist * math.cos(azimuth), radial_dist * math.sin(azimuth), z)
+        )
+
+    @staticmethod
+    def __cos_sin(phi: float) -> Tuple[float]:
+        """return cosine and sine of a rotation angle"""
+        if not isinstance(phi, int | float):
+            raise TypeError("The angle of rotation should be a float or an integer")
+        return math.cos(phi), math.sin(phi)
@@ -1 +1,93 @@
 # 4-dimensional vectors
+import math
+from typing import Tuple
+
+from ..Buffers import convert
+from ..Precision import kernels
+from .vecn import Vector
+
+
+class Vec4(Vector):
+    """class for 4-dimensional vectors.
+
+    subclass of Vector
+    """
+
+    __slots__ = ()
+
+    def __init__(self, *coords: float) -> None:
+        """Create an object from an unpacked tuple of 4 coordinates, or from a buffer"""
+        if len(coords) == 1 and convert.is_buffer(coords[0]):
+            self.coords = Vector._buffer_coords(coords[0], 4)
+            return
+        if len(coords) != 4:
+            raise TypeError(
+                f"Vector objects must have 4 argument, {len(coords)} where given"
+            )
+        if any(not isinstance(coord, int | float) for coord in coords):
+            raise TypeError("Vector arguments must be int or float")
+
+        self.coords: Tuple[float] = tuple(coords)
+
+    @property
+    def x(self) -> float:
+        """return the x (first) coordinate of the vector"""
+        return self.coords[0]
+
+    @property
+    def y(self) -> float:
+        """return the y (second) coordinate of the vector"""
+        return self.coords[1]
+
+    @property
+    def z(self) -> float:
+        """return the z (third) coordinate of the vector"""
+        return self.coords[2]
+
+    @property
+    def w(self) -> float:
+        """return the w (fourth) coordinate of the vector"""
+        return self.coords[3]
+
+    def __add__(self, other: object) -> object:
+        """definition of addition, unrolled for 4 dimensions"""
+        if not isinstance(other, Vec4):
+            return super().__add__(other)
+        x1, y1, z1, w1 = self.coords
+        x2, y2, z2, w2 = other.coords
+        return type(self)._from_coords((x1 + x2, y1 + y2, z1 + z2, w1 + w2))
+
+    def __neg__(self) -> object:
+        """definition of negation, unrolled for 4 dimensions"""
+        x, y, z, w = self.coords
+        return type(self)._from_coords((-x, -y, -z, -w))
+
+    def __sub__(self, other: object) -> object:
+        """definition of subtraction, unrolled for 4 dimensions"""
+        if not isinstance(other, Vec4):
+            return super().__sub__(other)
+        x1, y1, z1, w1 = self.coords
+        x2, y2, z2, w2 = other.coords
+        return type(self)._from_coords((x1 - x2, y1 - y2, z1 - z2, w1 - w2))
+
+    def __mul__(self, other: float | object) -> object | float:
+        """definition of inner product and product for scalar, unrolled for 4 dimensions"""
+        if isinstance(other, int | float):
+            x, y, z, w = self.coords
+            return type(self)._from_coords((other * x, other * y, other * z, other * w))
+        # the unrolled inner product is the FAST policy
+        if isinstance(other, Vec4) and (
+            kernels.DOT[self.precision or other.precision] is math.sumprod
+        ):
+            x1, y1, z1, w1 = self.coords
+            x2, y2, z2, w2 = other.coords
+            return x1 * x2 + y1 * y2 + z1 * z2 + w1 * w2
+        return super().__mul__(other)
+
+    def __radd__(self, other):
+        """definition of reverse addition"""
+        return self + other
+
+    def __rsub__(self, other):
+        """definition of reverse addition"""
+        return -self + other
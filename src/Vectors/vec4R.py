@@ -1 +1,113 @@
 # relativistic 4dimensional vector
+import math
+
+from .vec3 import Vec3
+from .vec4 import Vec4
+
+
+class FourVector(Vec4):
+    """class for relativistic four-vectors (t, x, y, z), in units where c = 1
+
+    For a particle the coordinates are the energy and the momentum (E, px, py, pz).
+    The inner product is the Minkowski one, with metric (+, -, -, -), so
+    p * p is the squared invariant mass.
+
+    subclass of Vec4
+    """
+
+    __slots__ = ()
+
+    @property
+    def t(self) -> float:
+        """return the time (first) coordinate, the energy for a particle"""
+        return self.coords[0]
+
+    @property
+    def x(self) -> float:
+        """return the x (second) coordinate of the vector"""
+        return self.coords[1]
+
+    @property
+    def y(self) -> float:
+        """return the y (third) coordinate of the vector"""
+        return self.coords[2]
+
+    @property
+    def z(self) -> float:
+        """return the z (fourth) coordinate of the vector"""
+        return self.coords[3]
+
+    @property
+    def spatial(self) -> object:
+        """return the spatial part (x, y, z) as a Vec3, the momentum for a particle"""
+        return Vec3._from_coords(tuple(self.coords[1:]))
+
+    @property
+    def mass2(self) -> float:
+        """return the squared invariant mass, p * p"""
+        return self * self
+
+    @property
+    def mass(self) -> float:
+        """return the invariant mass, negative for spacelike vectors (p * p < 0)"""
+        mass2 = self.mass2
+        return math.copysign(math.sqrt(abs(mass2)), mass2)
+
+    @property
+    def pt(self) -> float:
+        """return the transverse momentum, the momentum orthogonal to the z-axis"""
+        return math.hypot(self.coords[1], self.coords[2])
+
+    @property
+    def rapidity(self) -> float:
+        """return the rapidity along the z-axis, atanh(pz / E)"""
+        t, _, _, z = self.coords
+        if t <= abs(z):
+            raise ValueError("The rapidity is defined only for E > |pz|")
+        return 0.5 * math.log((t + z) / (t - z))
+
+    @property
+    def beta(self) -> object:
+        """return the velocity of the particle (Vec3), the momentum over the energy"""
+        t, x, y, z = self.coords
+        if t == 0:
+            raise ValueError("The velocity of a vector with zero energy it's undefined")
+        return Vec3._from_coords((x / t, y / t, z / t))
+
+    @property
+    def gamma(self) -> float:
+        """return the Lorentz factor of the particle, the energy over the mass"""
+        mass2 = self.mass2
+        if mass2 <= 0:
+            raise ValueError("The Lorentz factor is defined only for timelike vectors")
+        return self.coords[0] / math.sqrt(mass2)
+
+    def __mul__(self, other: float | object) -> object | float:
+        """definition of Minkowski inner product, and product for scalar"""
+        if isinstance(other, int | float):
+            return super().__mul__(other)
+        if isinstance(other, FourVector):
+            t1, x1, y1, z1 = self.coords
+            t2, x2, y2, z2 = other.coords
+            return t1 * t2 - x1 * x2 - y1 * y2 - z1 * z2
+        raise TypeError(
+            "Four-vectors can only be multiplied with a FourVector or a scalar"
+        )
+
+    def boosted(self, beta: object) -> object:
+        """return the vector in the frame moving with velocity beta (Vec3), see Boost"""
+        from ..Matrices import Boost
+
+        return Boost.from_velocity(beta) @ self
+
+    @classmethod
+    def from_mass(cls, mass: float, momentum: object) -> object:
+        """Create the four-momentum of a particle from its mass and momentum (Vec3)"""
+        if not isinstance(mass, int | float):
+            raise TypeError("The mass should be a float or an integer")
+        if not isinstance(momentum, Vec3):
+            raise TypeError("The momentum should be a Vec3")
+        if mass < 0:
+            raise ValueError("The mass should be positive or zero")
+        px, py, pz = momentum.coords
+        return cls._from_coords((math.hypot(mass, px, py, pz), px, py, pz))
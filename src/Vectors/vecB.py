@@ -0,0 +1,262 @@
+import math
+import operator
+from array import array
+from functools import partial, reduce
+from itertools import chain, cycle, repeat
+from typing import Iterable, Iterator, List, Tuple
+
+from .vec2 import Vec2
+from .vec3 import Vec3
+from .vec4 import Vec4
+from .vecn import Vector
+
+# class used for the views on the rows of a batch, depending on the dimension
+_ROW_TYPES = {2: Vec2, 3: Vec3, 4: Vec4}
+
+
+class VectorBatch:
+    """class for a batch of N vectors with the same dimension d
+
+    The coordinates are stored row-major in a single contiguous array('d'),
+    the i-th vector occupies data[i * d : (i + 1) * d].
+    Every operation is applied to the whole batch in a single call.
+    """
+
+    __slots__ = ("data", "dim")
+
+    def __init__(self, *vectors: object) -> None:
+        """Create an object from an unpacked tuple of vectors of the same dimension"""
+        if len(vectors) == 0:
+            raise TypeError(
+                "VectorBatch objects must have at least 1 argument, 0 where given"
+            )
+        if any(not isinstance(vector, Vector) for vector in vectors):
+            raise TypeError("VectorBatch arguments must be Vector (or a subclass)")
+        dim = len(vectors[0])
+        if any(len(vector) != dim for vector in vectors):
+            raise TypeError("All the vectors of a batch must have the same dimension")
+
+        self.dim: int = dim
+        self.data: array = array("d", chain.from_iterable(v.coords for v in vectors))
+
+    @property
+    def module(self) -> array:
+        """return the modulus of every vector of the batch"""
+        return array("d", map(math.hypot, *self._columns()))
+
+    def __str__(self) -> str:
+        """return a string in the form of VectorBatch_{N}x{d}Dim"""
+        return f"VectorBatch_{len(self)}x{self.dim}Dim"
+
+    def __repr__(self) -> str:
+        """return a string in the form of VectorBatch(Vec{d}(...), ...)"""
+        return "VectorBatch(" + ", ".join(repr(row) for row in self) + ")"
+
+    def __len__(self) -> int:
+        """return the number of vectors in the batch"""
+        return len(self.data) // self.dim
+
+    def __getitem__(self, index: int) -> object:
+        """return a view on the index-th vector of the batch
+
+        The returned Vector (Vec2, Vec3 or Vec4 for 2, 3 or 4 dimensions) shares the
+        memory with the batch, no coordinate is copied.
+        """
+        if not isinstance(index, int):
+            raise TypeError("VectorBatch indices must be integers")
+        n_vectors = len(self)
+        if index < 0:
+            index += n_vectors
+        if not 0 <= index < n_vectors:
+            raise IndexError("VectorBatch index out of range")
+        start = index * self.dim
+        cls = _ROW_TYPES.get(self.dim, Vector)
+        return cls._from_coords(memoryview(self.data)[start : start + self.dim])
+
+    def __iter__(self) -> Iterator[object]:
+        """iterate over views on the vectors of the batch"""
+        return (self[i] for i in range(len(self)))
+
+    def __add__(self, other: object) -> object:
+        """definition of addition, with a batch or a single vector for every row"""
+        return self._from_data(
+            array("d", map(operator.add, self.data, self._operand(other))), self.dim
+        )
+
+    def __radd__(self, other: object) -> object:
+        """definition of reverse addition"""
+        return self + other
+
+    def __neg__(self) -> object:
+        """definition of negation"""
+        return self._from_data(array("d", map(operator.neg, self.data)), self.dim)
+
+    def __sub__(self, other: object) -> object:
+        """definition of subtraction, with a batch or a single vector for every row"""
+        return self._from_data(
+            array("d", map(operator.sub, self.data, self._operand(other))), self.dim
+        )
+
+    def __rsub__(self, other: object) -> object:
+        """definition of reverse subtraction"""
+        return -self + other
+
+    def __mul__(self, other: float | object) -> object | array:
+        """definition of product for scalar and of the rowwise inner product
+
+        Args:
+            other (float | object): a scalar, a Vector or a VectorBatch
+
+        Returns:
+            object | array: a new VectorBatch for scalars, otherwise the inner
+                products of every row as an array('d')
+        """
+        if isinstance(other, int | float):
+            return self._from_data(
+                array("d", map(partial(operator.mul, other), self.data)), self.dim
+            )
+        if isinstance(other, Vector):
+            VectorBatch.__check_raise_dim_error(self, other)
+            columns = (
+                map(partial(operator.mul, coord), column)
+                for coord, column in zip(other.coords, self._columns())
+            )
+            return array("d", reduce(partial(map, operator.add), columns))
+        if isinstance(other, VectorBatch):
+            VectorBatch.__check_raise_same_size_error(self, other)
+            columns = map(partial(map, operator.mul), self._columns(), other._columns())
+            return array("d", reduce(partial(map, operator.add), columns))
+        raise TypeError("Tried multiplying a vector batch with a non numerical value")
+
+    def __rmul__(self, other: object) -> object | array:
+        """definition of product for scalar"""
+        return self * other
+
+    def __truediv__(self, other: object) -> object:
+        """definition of division by scalar"""
+        if not isinstance(other, int | float):
+            raise TypeError("Tried dividing a vector batch with a non numerical value")
+        if other == 0:
+            raise ZeroDivisionError("Tried dividing a vector batch for zero")
+        return self * (1 / other)
+
+    def size(self) -> Tuple[int]:
+        """return the number of vectors and the number of dimensions"""
+        return len(self), self.dim
+
+    def is_zero(self) -> List[bool]:
+        """return for every vector of the batch if it's a zero vector"""
+        return [not any(row) for row in zip(*self._columns())]
+
+    def copy(self) -> object:
+        """return a deepcopy of the batch"""
+        return self._from_data(array("d", self.data), self.dim)
+
+    def to_vectors(self) -> list:
+        """return a list of independent vectors (the coordinates are copied)"""
+        cls = _ROW_TYPES.get(self.dim, Vector)
+        return [cls(*row) for row in zip(*self._columns())]
+
+    def get_normalized(self) -> object:
+        """return the batch of the normalized vectors (not inplace)
+
+        Raises:
+            ValueError: if any vector of the batch is a zero vector.
+
+        Returns:
+            object: a new VectorBatch, every vector has modulus 1.
+        """
+        modules = self.module
+        if not all(modules):
+            raise ValueError("Cannot normalize a batch containing a zero vector")
+        repeated = chain.from_iterable(map(repeat, modules, repeat(self.dim)))
+        return self._from_data(
+            array("d", map(operator.truediv, self.data, repeated)), self.dim
+        )
+
+    def _columns(self) -> list:
+        """return the coordinates split by dimension (struct of arrays)"""
+        return [self.data[j :: self.dim] for j in range(self.dim)]
+
+    def _operand(self, other: object) -> Iterable[float]:
+        """return the flat coordinates to combine elementwise with the batch"""
+        if isinstance(other, VectorBatch):
+            VectorBatch.__check_raise_same_size_error(self, other)
+            return other.data
+        if isinstance(other, Vector):
+            VectorBatch.__check_raise_dim_error(self, other)
+            return cycle(other.coords)
+        raise TypeError("Vector batches can only be combined with vectors or batches")
+
+    @classmethod
+    def _from_data(cls, data: array, dim: int) -> object:
+        """create a batch from an already validated flat array('d'), no copy is made"""
+        batch = cls.__new__(cls)
+        batch.data = data
+        batch.dim = dim
+        return batch
+
+    @classmethod
+    def from_coords(cls, coords: Iterable[float], dim: int) -> object:
+        """Create a batch from the flat row-major coordinates of the vectors
+
+        Args:
+            coords (Iterable[float]): x0, y0, ..., x1, y1, ... (any iterable or buffer)
+            dim (int): the dimension of the vectors
+
+        Raises:
+            TypeError: if the number of coordinates is not a multiple of dim
+        """
+        if not isinstance(dim, int) or dim < 1:
+            raise ValueError(
+                "The dimension of the vectors should be a positive integer"
+            )
+        data = array("d", coords)
+        if len(data) == 0 or len(data) % dim != 0:
+            raise TypeError(
+                f"The number of coordinates must be a non zero multiple of {dim}"
+            )
+        return cls._from_data(data, dim)
+
+    @classmethod
+    def zeros(cls, n_vectors: int, dim: int) -> object:
+        """Create a batch of n_vectors zero vectors of dimension dim"""
+        if not isinstance(n_vectors, int) or n_vectors < 1:
+            raise ValueError("The number of vectors should be a positive integer")
+        if not isinstance(dim, int) or dim < 1:
+            raise ValueError(
+                "The dimension of the vectors should be a positive integer"
+            )
+        return cls._from_data(array("d", bytes(8 * n_vectors * dim)), dim)
+
+    @staticmethod
+    def distance(a: object, b: object) -> array:
+        """return the euclidean distances between the vectors of two batches
+
+        One of the two arguments can also be a single Vector, in this case the
+        distances are all computed from that vector.
+        """
+        if isinstance(a, Vector) and isinstance(b, VectorBatch):
+            a, b = b, a
+        if not isinstance(a, VectorBatch):
+            raise TypeError("At least one argument should be a VectorBatch")
+        differences = map(operator.sub, a.data, a._operand(b))
+        return VectorBatch._from_data(array("d", differences), a.dim).module
+
+    @staticmethod
+    def __check_raise_dim_error(batch: object, vector: object) -> None:
+        """raise an error if the vector and the batch don't have the same dimension"""
+        if batch.dim != len(vector):
+            raise TypeError(
+                f"Vectors must have the same dimension\n\t"
+                + f"instead got: vec{batch.dim}D and vec{len(vector)}D"
+            )
+
+    @staticmethod
+    def __check_raise_same_size_error(x: object, y: object) -> None:
+        """raise an error if the batches don't have the same size"""
+        if x.size() != y.size():
+            raise TypeError(
+                f"Vector batches must have the same size\n\t"
+                + f"instead got: {len(x)}x{x.dim} and {len(y)}x{y.dim}"
+            )
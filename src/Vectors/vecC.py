@@ -1,2 +1,233 @@
 # vectors with complex components
-# ? can this vector inherit from one of the classes of Vector, Vec2, ...
+import operator
+from array import array
+from itertools import repeat
+from typing import Iterable, Iterator, List
+
+from ..Precision import kernels
+from .vec2 import Vec2
+from .vecn import Vector
+
+
+class CVector:
+    """class for n-dimensional vectors with complex components
+
+    The components are stored in a single array('d') with the real and the
+    imaginary parts interleaved (re0, im0, re1, im1, ...), the operations
+    work on the doubles of the buffer and never create a complex per component.
+    The inner product is the hermitian one, conjugate-linear in the first
+    vector: a * b = sum(conj(a_i) * b_i).
+    """
+
+    __slots__ = ("data",)
+
+    def __init__(self, *values: complex | float | object) -> None:
+        """Create an object from an unpacked tuple of complex numbers
+
+        The values can be complex, int, float or Vec2 (x is the real part
+        and y the imaginary part, like Vec2.from_complex).
+        """
+        if len(values) == 0:
+            raise TypeError(
+                "CVector objects must have at least 1 argument, 0 where given"
+            )
+        data = array("d")
+        for value in values:
+            if isinstance(value, Vec2):
+                data.extend(value.coords)
+            elif isinstance(value, complex | int | float):
+                data.extend((value.real, value.imag))
+            else:
+                raise TypeError("CVector arguments must be complex, int, float or Vec2")
+        self.data: array = data
+
+    @property
+    def real(self) -> object:
+        """return the real parts of the components as a Vector"""
+        return Vector._from_coords(tuple(self.data[0::2]))
+
+    @property
+    def imag(self) -> object:
+        """return the imaginary parts of the components as a Vector"""
+        return Vector._from_coords(tuple(self.data[1::2]))
+
+    @property
+    def module(self) -> float:
+        """return the norm of the vector, sqrt(a * a)"""
+        return kernels.NORM[None](*self.data)
+
+    def __repr__(self) -> str:
+        """return a string in the form of CVec{dimension}(complex components)"""
+        return f"CVec{len(self)}(" + ", ".join(map(str, self)) + ")"
+
+    def __len__(self) -> int:
+        """return the number of components of the vector"""
+        return len(self.data) // 2
+
+    def __getitem__(self, index: int) -> complex:
+        """return the index-th component as a complex number"""
+        if not isinstance(index, int):
+            raise TypeError("CVector indices must be integers")
+        if index < 0:
+            index += len(self)
+        if not 0 <= index < len(self):
+            raise IndexError("CVector index out of range")
+        return complex(self.data[2 * index], self.data[2 * index + 1])
+
+    def __iter__(self) -> Iterator[complex]:
+        """iterate over the components as complex numbers"""
+        return map(complex, self.data[0::2], self.data[1::2])
+
+    def __eq__(self, other: object) -> bool:
+        """two complex vectors are equal if they have the same components"""
+        if not isinstance(other, CVector):
+            return NotImplemented
+        return self.data == other.data
+
+    def __add__(self, other: object) -> object:
+        """definition of addition"""
+        CVector.__check_raise_same_dim_error(self, other)
+        return CVector._from_data(array("d", map(operator.add, self.data, other.data)))
+
+    def __neg__(self) -> object:
+        """definition of negation"""
+        return CVector._from_data(array("d", map(operator.neg, self.data)))
+
+    def __sub__(self, other: object) -> object:
+        """definition of subtraction"""
+        CVector.__check_raise_same_dim_error(self, other)
+        return CVector._from_data(array("d", map(operator.sub, self.data, other.data)))
+
+    def __mul__(self, other: complex | object) -> object | complex:
+        """definition of hermitian inner product, and product for scalar"""
+        if isinstance(other, complex | int | float):
+            return CVector._from_data(CVector._scale(self.data, other))
+        if isinstance(other, CVector):
+            CVector.__check_raise_same_dim_error(self, other)
+            # re(conj(a) b) = ar br + ai bi and im(conj(a) b) = ar bi - ai br
+            dot = kernels.DOT[None]
+            return complex(
+                dot(self.data, other.data), dot(self.data, CVector._rotate(other.data))
+            )
+        raise TypeError("Tried multiplying a complex vector with a non numerical value")
+
+    def __rmul__(self, other: object) -> object:
+        """definition of product for scalar"""
+        if not isinstance(other, complex | int | float):
+            raise TypeError(
+                "Tried multiplying a complex vector with a non numerical value"
+            )
+        return self * other
+
+    def __rmatmul__(self, other: object) -> object:
+        """definition of the product of a real Matrix with a complex vector"""
+        from ..Matrices import CMatrix, Matrix
+
+        if not isinstance(other, Matrix):
+            return NotImplemented
+        return CMatrix.from_parts(other) @ self
+
+    def __truediv__(self, other: complex) -> object:
+        """definition of division by scalar"""
+        if not isinstance(other, complex | int | float):
+            raise TypeError(
+                "Tried dividing a complex vector with a non numerical value"
+            )
+        if other == 0:
+            raise ZeroDivisionError("Tried dividing a complex vector for zero")
+        return self * (1 / other)
+
+    def conjugate(self) -> object:
+        """return the complex conjugate vector (not in place)"""
+        data = array("d", self.data)
+        data[1::2] = array("d", map(operator.neg, self.data[1::2]))
+        return CVector._from_data(data)
+
+    def is_zero(self) -> bool:
+        """check if all the components are zero"""
+        return not any(self.data)
+
+    def copy(self) -> object:
+        """return a copy of the vector"""
+        return CVector._from_data(array("d", self.data))
+
+    def get_normalized(self) -> object:
+        """return the vector divided by its module (not in place)"""
+        if self.is_zero():
+            raise ValueError("Cannot normalize a zero vector")
+        return self * (1 / self.module)
+
+    def to_vec2(self) -> List[object]:
+        """return the components as Vec2 (x=Re and y=Im), like Vec2.from_complex"""
+        data = self.data
+        return [
+            Vec2._from_coords((data[i], data[i + 1])) for i in range(0, len(data), 2)
+        ]
+
+    @classmethod
+    def from_parts(cls, real: object, imag: object | None = None) -> object:
+        """Create a complex vector from the Vector of the real parts and the
+        Vector of the imaginary parts (zero if None)"""
+        if not isinstance(real, Vector) or not isinstance(imag, Vector | None):
+            raise TypeError("The real and imaginary parts should be Vector")
+        data = array("d", bytes(16 * len(real)))
+        data[0::2] = array("d", real.coords)
+        if imag is not None:
+            if len(imag) != len(real):
+                raise TypeError(
+                    "The real and imaginary parts must have the same dimension"
+                )
+            data[1::2] = array("d", imag.coords)
+        return cls._from_data(data)
+
+    @classmethod
+    def _from_data(cls, data: array) -> object:
+        """Create an object from an interleaved array('d') (no checks, no copy)"""
+        vector = cls.__new__(cls)
+        vector.data = data
+        return vector
+
+    @staticmethod
+    def _scale(data: Iterable[float], value: complex) -> array:
+        """return the interleaved values of data multiplied by a complex number"""
+        if not isinstance(value, complex):
+            return array("d", map(operator.mul, data, repeat(value)))
+        re, im = data[0::2], data[1::2]
+        out = array("d", bytes(8 * len(data)))
+        # (x + iy)(a + ib) = (ax - by) + i(ay + bx)
+        out[0::2] = array(
+            "d",
+            map(
+                operator.sub,
+                map(operator.mul, re, repeat(value.real)),
+                map(operator.mul, im, repeat(value.imag)),
+            ),
+        )
+        out[1::2] = array(
+            "d",
+            map(
+                operator.add,
+                map(operator.mul, im, repeat(value.real)),
+                map(operator.mul, re, repeat(value.imag)),
+            ),
+        )
+        return out
+
+    @staticmethod
+    def _rotate(data: Iterable[float]) -> array:
+        """return the interleaved values of data multiplied by -i, (im, -re) for each"""
+        out = array("d", bytes(8 * len(data)))
+        out[0::2] = data[1::2]
+        out[1::2] = array("d", map(operator.neg, data[0::2]))
+        return out
+
+    @staticmethod
+    def __check_raise_same_dim_error(x: object, y: object) -> None:
+        """raise an error if the vectors are not complex vectors of the same length"""
+        if not isinstance(y, CVector):
+            raise TypeError("Complex vectors can only be combined with a CVector")
+        if len(x) != len(y):
+            raise TypeError(
+                f"Vectors must have the same dimension\n\t"
+                + f"instead got: cvec{len(x)}D and cvec{len(y)}D"
+            )
@@ -1 +1,129 @@
 # a frozen (immutable) vector
+from typing import Callable, Tuple
+
+from .vec2 import Vec2
+from .vec3 import Vec3
+from .vecn import Vector
+
+
+class FrozenVector(Vector):
+    """class for frozen (immutable) n-dimensional vectors
+
+    Frozen vectors are hashable, so they can be used as dict keys and in sets,
+    and their derived quantities (module, normalized vector, angles) are
+    computed only once and cached.
+
+    subclass of Vector
+    """
+
+    __slots__ = ("_cache",)
+
+    def __init__(self, *coords: float) -> None:
+        """Create an object from an unpacked tuple of coordinates, or from a
+        buffer (its values are copied, the buffer can still be changed)"""
+        super().__init__(*coords)
+        if not isinstance(self.coords, tuple):
+            object.__setattr__(self, "coords", tuple(self.coords))
+        self._cache: dict = {}
+
+    def __setattr__(self, name: str, value: object) -> None:
+        """the attributes can be set only once, when the vector is created"""
+        if hasattr(self, name):
+            raise TypeError(f"{type(self).__name__} objects are immutable")
+        super().__setattr__(name, value)
+
+    @property
+    def module(self) -> float:
+        """return the modulus of the vector (cached)"""
+        return self._cached("module", lambda: Vector.module.fget(self))
+
+    def __eq__(self, other: object) -> bool:
+        """two frozen vectors are equal if they have the same coordinates"""
+        if not isinstance(other, FrozenVector):
+            return NotImplemented
+        return self.coords == other.coords
+
+    def __hash__(self) -> int:
+        """return the hash of the coordinates (cached)"""
+        return self._cached("hash", lambda: hash(self.coords))
+
+    def get_normalized(self) -> object:
+        """return the normalized vector (cached), see Vector.get_normalized"""
+        return self._cached("normalized", lambda: Vector.get_normalized(self))
+
+    def to_int(self) -> None:
+        """not defined, frozen vectors cannot be changed"""
+        raise TypeError(f"{type(self).__name__} objects are immutable")
+
+    def to_float(self) -> None:
+        """not defined, frozen vectors cannot be changed"""
+        raise TypeError(f"{type(self).__name__} objects are immutable")
+
+    def translate(self, origin: object) -> None:
+        """not defined, frozen vectors cannot be changed"""
+        raise TypeError(f"{type(self).__name__} objects are immutable")
+
+    def normalize(self) -> None:
+        """not defined, frozen vectors cannot be changed"""
+        raise TypeError(f"{type(self).__name__} objects are immutable")
+
+    def _cached(self, key: str, compute: Callable[[], object]) -> object:
+        """return the cached value of key, computing it the first time"""
+        if key not in self._cache:
+            self._cache[key] = compute()
+        return self._cache[key]
+
+    @classmethod
+    def _from_coords(cls, coords: Tuple[float]) -> object:
+        """Create an object from already validated coordinates, see Vector._from_coords
+
+        The coordinates are always stored in a tuple, views on a buffer are copied.
+        """
+        vector = super()._from_coords(tuple(coords))
+        vector._cache = {}
+        return vector
+
+    @classmethod
+    def from_vector(cls, vector: object) -> object:
+        """Create a frozen copy of a Vector"""
+        if not isinstance(vector, Vector):
+            raise TypeError("The argument should be a Vector")
+        return cls._from_coords(vector.coords)
+
+
+class FrozenVec2(FrozenVector, Vec2):
+    """class for frozen (immutable) 2-dimensional vectors
+
+    subclass of FrozenVector and Vec2
+    """
+
+    __slots__ = ()
+
+    @property
+    def phase(self) -> float:
+        """return the angle between the x-axis and the vector (cached)"""
+        return self._cached("phase", lambda: Vec2.phase.fget(self))
+
+
+class FrozenVec3(FrozenVector, Vec3):
+    """class for frozen (immutable) 3-dimensional vectors
+
+    subclass of FrozenVector and Vec3
+    """
+
+    __slots__ = ()
+
+    @property
+    def polar(self) -> float:
+        """return the polar angle in spherical coordinates (cached)"""
+        return self._cached("polar", lambda: Vec3.polar.fget(self))
+
+    @property
+    def azimuth(self) -> float:
+        """return the azimuthal angle in spherical coordinates (cached)"""
+        return self._cached("azimuth", lambda: Vec3.azimuth.fget(self))
+
+    @property
+    def radial_dist(self) -> float:
+        """return the radial distance in cylindrical coordinates (cached)"""
+        return self._cached("radial_dist", lambda: Vec3.radial_dist.fget(self))
@@ -1 +1,65 @@
 # vectors with a customizable precision
+from ..Precision import kernels
+from .vecn import Vector
+
+
+class PVector(Vector):
+    """class for n-dimensional vectors with their own precision policy
+
+    The inner product and the module of a PVector use its precision policy
+    (FAST, COMPENSATED or EXACT, see Precision) instead of the global one,
+    the results of the operations keep the policy of the vector.
+    Every policy has its own subclass (created once), so the policy costs
+    no memory per vector.
+
+    subclass of Vector
+    """
+
+    __slots__ = ()
+
+    # subclasses of PVector by policy
+    _policy_classes: dict = {}
+
+    def __new__(cls, *coords: float, precision: str | None = None) -> object:
+        """Create an object of the subclass with the given precision policy"""
+        if precision is not None:
+            cls = PVector._policy_class(precision)
+        return super().__new__(cls)
+
+    def __init__(self, *coords: float, precision: str | None = None) -> None:
+        """Create an object from an unpacked tuple of coordinates
+
+        Args:
+            precision (str, optional): FAST, COMPENSATED or EXACT, None uses
+                the global policy. Defaults to None.
+        """
+        super().__init__(*coords)
+
+    def __repr__(self) -> str:
+        """return a string in the form of PVector(coordinates, precision=policy)"""
+        return (
+            "PVector("
+            + ", ".join(str(coord) for coord in self.coords)
+            + f", precision={self.precision!r})"
+        )
+
+    def with_precision(self, precision: str | None) -> object:
+        """return a copy of the vector with another precision policy"""
+        if precision is None:
+            return PVector._from_coords(tuple(self.coords))
+        return PVector._policy_class(precision)._from_coords(tuple(self.coords))
+
+    @staticmethod
+    def _policy_class(precision: str) -> type:
+        """return the subclass of PVector with the given policy"""
+        if precision not in PVector._policy_classes:
+            PVector._policy_classes[precision] = type(
+                "PVector",
+                (PVector,),
+                {
+                    "__slots__": (),
+                    "__qualname__": f"PVector[{kernels.check_policy(precision)}]",
+                    "precision": precision,
+                },
+            )
+        return PVector._policy_classes[precision]
@@ -1 +1,279 @@
 # class for weighted vectors
+import operator
+from array import array
+from itertools import repeat
+from typing import Iterable, List, Tuple
+
+from ..Precision import kernels
+from .vecB import VectorBatch
+from .vecn import Vector
+
+
+class WVector(Vector):
+    """class for n-dimensional vectors with a weight, e.g. weighted samples
+
+    The weight is used by VectorAccumulator, the results of the operations
+    between vectors have weight 1.
+
+    subclass of Vector
+    """
+
+    __slots__ = ("weight",)
+
+    def __init__(self, *coords: float, weight: float = 1.0) -> None:
+        """Create an object from an unpacked tuple of coordinates and a weight (>= 0)"""
+        super().__init__(*coords)
+        WVector.__check_weight(weight)
+        self.weight: float = weight
+
+    def __repr__(self) -> str:
+        """return a string in the form of WVector(coordinates, weight=weight)"""
+        return (
+            "WVector("
+            + ", ".join(str(coord) for coord in self.coords)
+            + f", weight={self.weight})"
+        )
+
+    def copy(self) -> object:
+        """return a copy of the vector, with the same weight"""
+        return self.with_weight(self.weight)
+
+    def with_weight(self, weight: float) -> object:
+        """return a copy of the vector with another weight"""
+        WVector.__check_weight(weight)
+        return WVector._from_coords(tuple(self.coords), weight)
+
+    @classmethod
+    def _from_coords(cls, coords: Tuple[float], weight: float = 1.0) -> object:
+        """Create an object from already validated coordinates and weight"""
+        vector = super()._from_coords(coords)
+        vector.weight = weight
+        return vector
+
+    @staticmethod
+    def __check_weight(weight: float) -> None:
+        """raise an error if the weight is not a positive number or zero"""
+        if not isinstance(weight, int | float):
+            raise TypeError("The weight should be a float or an integer")
+        if not weight >= 0:
+            raise ValueError("The weight should be positive or zero")
+
+
+class VectorAccumulator:
+    """class for the streaming weighted statistics of a set of vectors
+
+    The vectors are added a chunk at a time (update) and only the total
+    weight, the weighted mean and the matrix of the weighted sums of the
+    products of the deviations from the mean (the comoment) are kept, so the
+    memory doesn't depend on the number of vectors.
+    A chunk is first reduced on its own, column by column, and then merged
+    with the current statistics with the update of Welford and Chan et al.,
+    which doesn't subtract large sums and keeps the precision of a two-pass
+    computation. Accumulators of different chunks, processes or files are
+    merged in the same way (merge, +).
+    """
+
+    __slots__ = ("dim", "count", "weight", "_weight2", "_mean", "_comoment")
+
+    def __init__(self, dim: int | None = None) -> None:
+        """Create an empty accumulator for vectors of dimension dim (None sets it
+        with the first vectors)"""
+        if dim is not None and (not isinstance(dim, int) or dim < 1):
+            raise ValueError("The dimension should be a positive integer")
+        self.dim: int | None = dim
+        self.count: int = 0
+        self.weight: float = 0.0
+        self._weight2: float = 0.0
+        self._mean: List[float] = [0.0] * (dim or 0)
+        self._comoment: List[List[float]] = [
+            [0.0] * (dim or 0) for _ in range(dim or 0)
+        ]
+
+    @property
+    def mean(self) -> object:
+        """return the weighted mean of the vectors as a Vector"""
+        self.__check_raise_empty_error()
+        return Vector._from_coords(tuple(self._mean))
+
+    @property
+    def centroid(self) -> object:
+        """return the weighted centroid of the vectors (points), the same as the mean"""
+        return self.mean
+
+    @property
+    def variance(self) -> object:
+        """return the weighted variance of every coordinate as a Vector"""
+        self.__check_raise_empty_error()
+        return Vector._from_coords(
+            tuple(self._comoment[k][k] / self.weight for k in range(self.dim))
+        )
+
+    def __repr__(self) -> str:
+        """return a string in the form of VectorAccumulator(dim=d, count=n, weight=w)"""
+        return (
+            f"VectorAccumulator(dim={self.dim}, count={self.count}, "
+            + f"weight={self.weight})"
+        )
+
+    def __add__(self, other: object) -> object:
+        """return a new accumulator with the statistics of both"""
+        if not isinstance(other, VectorAccumulator):
+            return NotImplemented
+        result = self.copy()
+        result.merge(other)
+        return result
+
+    def covariance(self, unbiased: bool = False) -> object:
+        """Return the weighted covariance matrix as a SMatrix
+
+        Args:
+            unbiased (bool, optional): divide the comoment by W - sum(w^2) / W
+                (reliability weights, n - 1 for unit weights) instead of the
+                total weight W. Defaults to False.
+        """
+        from ..Matrices import SMatrix
+
+        self.__check_raise_empty_error()
+        norm = self.weight - self._weight2 / self.weight if unbiased else self.weight
+        if norm <= 0:
+            raise ValueError("The unbiased covariance needs more than one vector")
+        values = array("d", (value / norm for row in self._comoment for value in row))
+        return SMatrix._from_buffer(values, (self.dim, self.dim))
+
+    def add(self, vector: object, weight: float | None = None) -> None:
+        """add a single vector, weight None uses the weight of a WVector (or 1)"""
+        self.update((vector,), None if weight is None else (weight,))
+
+    def update(
+        self, vectors: Iterable[object], weights: Iterable[float] | None = None
+    ) -> None:
+        """Add a chunk of vectors to the statistics
+
+        Args:
+            vectors (Iterable[object]): a VectorBatch, a Matrix (a vector per
+                row, e.g. a chunk of Storage.iter_chunks) or a collection of Vector
+            weights (Iterable[float], optional): the weights (>= 0) of the
+                vectors, None uses the weights of the WVector and 1 otherwise.
+        """
+        columns, weights = self.__columns(vectors, weights)
+        if not weights:
+            return
+        total = sum(weights)
+        dot = kernels.DOT[None]
+        if total == 0:
+            self.count += len(weights)
+            return
+        mean = [dot(weights, column) / total for column in columns]
+        centered = [
+            array("d", map(operator.sub, column, repeat(value)))
+            for column, value in zip(columns, mean)
+        ]
+        weighted = [
+            array("d", map(operator.mul, weights, column)) for column in centered
+        ]
+        comoment = [[0.0] * self.dim for _ in range(self.dim)]
+        for k in range(self.dim):
+            for j in range(k, self.dim):
+                comoment[k][j] = comoment[j][k] = dot(weighted[k], centered[j])
+        self.__combine(len(weights), total, dot(weights, weights), mean, comoment)
+
+    def merge(self, other: object) -> None:
+        """add in place the statistics of another accumulator"""
+        if not isinstance(other, VectorAccumulator):
+            raise TypeError("Only a VectorAccumulator can be merged")
+        if other.dim is None:
+            return
+        self.__set_dim(other.dim)
+        if other.weight == 0:
+            self.count += other.count
+            return
+        self.__combine(
+            other.count, other.weight, other._weight2, other._mean, other._comoment
+        )
+
+    def copy(self) -> object:
+        """return a copy of the accumulator"""
+        result = VectorAccumulator(self.dim)
+        result.count, result.weight, result._weight2 = (
+            self.count,
+            self.weight,
+            self._weight2,
+        )
+        result._mean = list(self._mean)
+        result._comoment = [list(row) for row in self._comoment]
+        return result
+
+    def __combine(
+        self,
+        count: int,
+        weight: float,
+        weight2: float,
+        mean: List[float],
+        comoment: List[List[float]],
+    ) -> None:
+        """merge the statistics of a set of vectors with the current ones"""
+        total = self.weight + weight
+        delta = list(map(operator.sub, mean, self._mean))
+        ratio = weight / total
+        factor = self.weight * ratio
+        self._mean = [value + d * ratio for value, d in zip(self._mean, delta)]
+        for k in range(self.dim):
+            row, other_row = self._comoment[k], comoment[k]
+            scaled = delta[k] * factor
+            for j in range(self.dim):
+                row[j] += other_row[j] + scaled * delta[j]
+        self.count += count
+        self.weight = total
+        self._weight2 += weight2
+
+    def __columns(
+        self, vectors: Iterable[object], weights: Iterable[float] | None
+    ) -> Tuple[List[array], List[float]]:
+        """return the coordinates of a chunk by column, and the weights"""
+        from ..Matrices import Matrix
+
+        if isinstance(vectors, VectorBatch):
+            dim, data = vectors.dim, vectors.data
+            columns = [data[k::dim] for k in range(dim)]
+            default = [1.0] * len(vectors)
+        elif isinstance(vectors, Matrix):
+            n_rows, dim = vectors.size()
+            values = array("d", vectors._flat())
+            columns = [values[k::dim] for k in range(dim)]
+            default = [1.0] * n_rows
+        else:
+            vectors = list(vectors)
+            if any(not isinstance(vector, Vector) for vector in vectors):
+                raise TypeError("The vectors should be a collection of Vector")
+            if not vectors:
+                return [], []
+            dim = len(vectors[0])
+            if any(len(vector) != dim for vector in vectors):
+                raise TypeError("All the vectors must have the same dimension")
+            columns = [
+                array("d", column) for column in zip(*(v.coords for v in vectors))
+            ]
+            default = [getattr(vector, "weight", 1.0) for vector in vectors]
+        self.__set_dim(dim)
+        if weights is None:
+            return columns, default
+        weights = [float(weight) for weight in weights]
+        if len(weights) != len(default):
+            raise TypeError("There should be a weight for every vector")
+        if not all(weight >= 0 for weight in weights):
+            raise ValueError("The weights should be positive or zero")
+        return columns, weights
+
+    def __set_dim(self, dim: int) -> None:
+        """set the dimension with the first vectors, or check it"""
+        if self.dim is None:
+            self.dim = dim
+            self._mean = [0.0] * dim
+            self._comoment = [[0.0] * dim for _ in range(dim)]
+        elif dim != self.dim:
+            raise TypeError(f"Cannot add vec{dim}D to the statistics of vec{self.dim}D")
+
+    def __check_raise_empty_error(self) -> None:
+        """raise an error if no vector (with a positive weight) was added"""
+        if self.weight == 0:
+            raise ValueError("The statistics of an empty set of vectors are undefined")
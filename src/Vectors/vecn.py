@@ -1,12 +1,28 @@
-import math
-from typing import List, Tuple
+import operator
+from array import array
+from typing import Iterable, List, Tuple
+
+from ..Buffers import convert
+from ..Precision import kernels
 
 
 class Vector:
     """class for a n-dimensional vector"""
 
+    __slots__ = ("coords",)
+
+    # precision policy of the inner product and of the module (see Precision),
+    # None uses the global policy, PVector sets it for a single vector
+    precision: str | None = None
+
     def __init__(self, *coords: float) -> None:
-        """Create an object from an unpacked tuple of coordinates"""
+        """Create an object from an unpacked tuple of coordinates, or from a
+        single buffer (array, memoryview, bytes, NumPy array, ...) whose
+        values are used without copying them, see Buffers.as_doubles (the
+        values of a Vector, Matrix or Tensor are copied)"""
+        if len(coords) == 1 and convert.is_buffer(coords[0]):
+            self.coords = Vector._buffer_coords(coords[0], None)
+            return
         if len(coords) == 0:
             raise TypeError(
                 "Vector objects must have at least 1 argument, 0 where given"
@@ -19,7 +35,7 @@ class Vector:
     @property
     def module(self) -> float:
         """return the modulus of the vector, which is the euclidean norm in n dimensions"""
-        return math.hypot(*self.coords)
+        return kernels.NORM[self.precision](*self.coords)
 
     def __str__(self) -> str:
         """return a string in the form of Vec{dimension}D{tuple of the coordinates}"""
@@ -37,28 +53,59 @@ class Vector:
         """return the length of the Vector (the number of dimensions)"""
         return len(self.coords)
 
+    def __buffer__(self, flags: int) -> memoryview:
+        """return a read-only memoryview on the coordinates (buffer protocol)
+
+        The memoryview shares the coordinates stored in a buffer, the
+        coordinates stored in a tuple are copied.
+        """
+        coords = self.coords
+        if isinstance(coords, tuple):
+            return memoryview(array("d", coords)).toreadonly()
+        return convert.export(coords, (len(coords),), (1,), 0)
+
+    @property
+    def __array_interface__(self) -> dict:
+        """return the NumPy array interface of the coordinates, see __buffer__"""
+        coords = self.coords
+        if isinstance(coords, tuple):
+            coords = array("d", coords)
+        return convert.array_interface(coords, (len(coords),), (1,), 0)
+
     def __add__(self, other: object) -> object:
         """definition of addition"""
+        if not isinstance(other, Vector):
+            # e.g. a VectorBatch, which adds the vector to every row
+            return NotImplemented
         Vector.__check_raise_same_dim_error(self, other)
-        return type(self)(*(a + b for a, b in zip(self.coords, other.coords)))
+        return type(self)._from_coords(
+            tuple(map(operator.add, self.coords, other.coords))
+        )
 
     def __neg__(self) -> object:
         """definition of negation"""
-        return type(self)(*(-coord for coord in self.coords))
+        return type(self)._from_coords(tuple(map(operator.neg, self.coords)))
 
     def __sub__(self, other: object) -> object:
         """definition of subtraction"""
+        if not isinstance(other, Vector):
+            return NotImplemented
         Vector.__check_raise_same_dim_error(self, other)
-        return type(self)(*(a - b for a, b in zip(self.coords, other.coords)))
+        return type(self)._from_coords(
+            tuple(map(operator.sub, self.coords, other.coords))
+        )
 
     def __mul__(self, other: float | object) -> object | float:
         """definition of inner product, and product for scalar"""
         if isinstance(other, int | float):
-            return type(self)(*(other * coord for coord in self.coords))
+            return type(self)._from_coords(
+                tuple(other * coord for coord in self.coords)
+            )
         if isinstance(other, Vector):
             Vector.__check_raise_same_dim_error(self, other)
-            return sum(list(a * b for a, b in zip(self.coords, other.coords)))
-        raise TypeError("Tried multiplying a vector with a non numerical value")
+            dot = kernels.DOT[self.precision or other.precision]
+            return dot(self.coords, other.coords)
+        return NotImplemented
 
     def __rmul__(self, other: object) -> object | float:
         """definition of product for scalar"""
@@ -84,7 +131,11 @@ class Vector:
             return 1
         if other == 1:
             return self
-        return self * self ** (other - 1)
+        # v ** 2k is (v * v) ** k and v ** (2k + 1) is (v * v) ** k * v
+        square = self * self
+        if other % 2 == 0:
+            return square ** (other // 2)
+        return self * square ** (other // 2)
 
     def to_int(self) -> None:
         """convert in-place the vector to an integer vector"""
@@ -109,11 +160,19 @@ class Vector:
 
     def get_cartesian_coordinates(self) -> Tuple[float]:
         """return the cartesian coordinates of the vector as a tuple"""
-        return tuple(coord for coord in self.coords)
+        if isinstance(self.coords, tuple):
+            return self.coords
+        return tuple(self.coords)
 
     def copy(self):
         """return a deepcopy of the vector"""
-        return type(self)(*(coord for coord in self.coords))
+        return type(self)._from_coords(tuple(self.coords))
+
+    def to_tensor(self) -> object:
+        """return a rank-1 Tensor, sharing the coordinates if they are a buffer"""
+        from ..Tensors import Tensor
+
+        return Tensor.from_vector(self)
 
     def translate(self, origin: object):
         """In place tanslation
@@ -124,7 +183,7 @@ class Vector:
         if not isinstance(origin, Vector):
             raise ValueError("The origin of the translation should be a Vector")
         Vector.__check_raise_same_dim_error(self, origin)
-        self.coords[::] = [x + y for x, y in zip(self.coords, (-origin).coords)]
+        self._set_coords(map(operator.sub, self.coords, origin.coords))
 
     # TODO after implementing matrices
     def transform_coords(self, matrix):
@@ -148,7 +207,8 @@ class Vector:
         """
         if self.is_zero():
             raise ValueError("Cannot normalize a zero vector")
-        self.coords[::] = [coord / self.module for coord in self.coords]
+        module = self.module
+        self._set_coords(coord / module for coord in self.coords)
 
     def get_normalized(self) -> object:
         """return the normalized vector (not inplace)
@@ -164,7 +224,8 @@ class Vector:
         """
         if self.is_zero():
             raise ValueError("Cannot normalize a zero vector")
-        return type(self)(*[coord / self.module for coord in self.coords])
+        module = self.module
+        return type(self)._from_coords(tuple(coord / module for coord in self.coords))
 
     def create_parallel(self, module: float) -> object:
         """Creates a new Vector (or subclass) with same direction and verse but different modulus
@@ -184,6 +245,48 @@ class Vector:
             )
         return self.get_normalized() * module
 
+    def _set_coords(self, coords: Iterable[float]) -> None:
+        """replace in place the coordinates
+
+        If the coordinates are a view on a buffer (e.g. a row of a VectorBatch)
+        the new values are written in the buffer.
+
+        Raises:
+            TypeError: if the view is read-only (e.g. a row of a Matrix)
+        """
+        if isinstance(self.coords, memoryview):
+            if self.coords.readonly:
+                raise TypeError("Cannot change in place a read-only view")
+            self.coords[:] = array("d", coords)
+        else:
+            self.coords = tuple(coords)
+
+    @classmethod
+    def _from_coords(cls, coords: Tuple[float]) -> object:
+        """Create an object from already validated coordinates (no checks, no copy)
+
+        Used by the operators to build the results, the coordinates must be a
+        tuple (or a buffer) of int or float with the right length for cls.
+        """
+        vector = cls.__new__(cls)
+        vector.coords = coords
+        return vector
+
+    @staticmethod
+    def _buffer_coords(buffer: object, dim: int | None) -> memoryview | array:
+        """return the coordinates in a buffer, checking their number (any if dim is None)"""
+        coords = convert.as_doubles(buffer)
+        # copy the objects of the library (matrices and tensors have a version
+        # counter), the changes in place of the vector would not increase it
+        if isinstance(buffer, Vector) or hasattr(buffer, "_version"):
+            coords = array("d", coords)
+        if len(coords) == 0 or dim is not None and len(coords) != dim:
+            raise TypeError(
+                f"Vector objects must have {dim or 'at least 1'} coordinates, "
+                + f"{len(coords)} where given in the buffer"
+            )
+        return coords
+
     @classmethod
     def get_units_vectors(cls, dimensions: int):
         """return a tuple of the unit vectors (Vector(1, 0, ...), Vector(0, 1, ...), ...)"""
@@ -1,3 +1,63 @@
-from .Matrices import Matrix as Mat
-from .Matrices import SMatrix as SMat
-from .Vectors import Vec2, Vector
+import os
+from importlib import import_module
+
+# every public name and the subpackage defining it, the subpackages are
+# imported the first time one of their names is used, so that importing
+# the library doesn't load the matrices (and their backends) of scripts
+# that use only the vectors
+_NAMES = {
+    "Backends": (".Backends", None),
+    "lazy": (".Expressions", "lazy"),
+    "instrument": (".Instrumentation", "instrument"),
+    "Boost": (".Matrices", "Boost"),
+    "CMat": (".Matrices", "CMatrix"),
+    "DMat": (".Matrices", "DiagonalMatrix"),
+    "FMat": (".Matrices", "FrozenMatrix"),
+    "Mat": (".Matrices", "Matrix"),
+    "Rotation": (".Matrices", "Rotation"),
+    "SMat": (".Matrices", "SMatrix"),
+    "SpMat": (".Matrices", "SparseMatrix"),
+    "precision": (".Precision", "precision"),
+    "KDTree": (".Spatial", "KDTree"),
+    "gram": (".Spatial", "gram"),
+    "pairwise_distances": (".Spatial", "pairwise_distances"),
+    "Tensor": (".Tensors", "Tensor"),
+    "einsum": (".Tensors", "einsum"),
+    "CVector": (".Vectors", "CVector"),
+    "FourVector": (".Vectors", "FourVector"),
+    "FrozenVec2": (".Vectors", "FrozenVec2"),
+    "FrozenVec3": (".Vectors", "FrozenVec3"),
+    "FrozenVector": (".Vectors", "FrozenVector"),
+    "PVector": (".Vectors", "PVector"),
+    "Vec2": (".Vectors", "Vec2"),
+    "Vec3": (".Vectors", "Vec3"),
+    "Vec4": (".Vectors", "Vec4"),
+    "Vector": (".Vectors", "Vector"),
+    "VectorAccumulator": (".Vectors", "VectorAccumulator"),
+    "VectorBatch": (".Vectors", "VectorBatch"),
+    "WVector": (".Vectors", "WVector"),
+}
+
+__all__ = list(_NAMES)
+
+
+def __getattr__(name: str) -> object:
+    """import the subpackage of a public name the first time it's used"""
+    if name not in _NAMES:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    module, attribute = _NAMES[name]
+    value = import_module(module, __name__)
+    if attribute is not None:
+        value = getattr(value, attribute)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list:
+    """return the public names, also the ones not imported yet"""
+    return sorted(set(globals()) | set(_NAMES))
+
+
+# the counters must patch the classes before they are used
+if os.environ.get("VMTL_INSTRUMENT", "0") not in ("", "0"):
+    import_module(".Instrumentation", __name__)